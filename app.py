@@ -3,6 +3,34 @@ import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
+import io
+
+from attribution import MODELS as ATTRIBUTION_MODELS, AttributionEngine, read_conversions, read_touchpoints
+from audience import AudienceSketches, read_audience_ids
+from audit_tables import ARTIST, TABLES, iter_tables, table_frame
+from calendar_engine import expand_calendar
+from collab_finder import CollaboratorIndex, read_artists
+from curators import CuratorStore, read_curator_rows
+from data_access import DataAccessLayer
+from email_sim import LEAD_MAGNETS, simulate_list
+from engagement import EngagementWindows, read_events
+from exports import excel_engine, export_tables
+from forecast import forecast_release
+from funnel import BASELINE_FUNNEL, CHANNELS as FUNNEL_CHANNELS, STAGES as FUNNEL_STAGES, FunnelEngine, read_funnel_rows
+from launch_tracker import EventFileTail, HourlyRingBuffer, SimulatedStreamSource
+from peers import load_peers
+from posting_times import PostingTimeIndex, best_cells, format_best_time
+from precompute_worker import ArtifactStore
+from progress_store import ProgressStore
+from royalties import RoyaltyEngine, blended_rate, read_rate_table, read_stream_rows
+from sensitivity import heatmap, tornado_figure
+from series import PRIMITIVES, cumulative_series, pct_of_target
+from smart_links import LinkStore, daily_click_rows
+from spend_ledger import SpendLedger, read_results, read_spend_export
+from task_scheduler import PLAN_TASKS, schedule_tasks
+from time_to_goal import first_passage, hit_curve, parse_range, tier_probabilities
+from uploads import file_digest
+from warehouse import Warehouse, read_metric_rows
 
 # Page configuration
 st.set_page_config(
@@ -82,22 +110,105 @@ st.sidebar.markdown("""
         <p style="color: #666; font-size: 0.9rem; margin-top: 0.5rem;">JohnGreat Music Audit</p>
     </div>
 """, unsafe_allow_html=True)
-section = st.sidebar.radio(
-    "Go to:",
-    [
-        "Executive Summary",
-        "Streaming Performance", 
-        "Social Media Audit",
-        "Critical Issues",
-        "90-Day Action Plan",
-        "KPIs & Targets",
-        "Content Strategy",
-        "Budget Scenarios",
-        "Email Marketing",
-        "Quick Wins",
-        "Age to Age Campaign"
-    ]
-)
+SECTIONS = [
+    "Executive Summary",
+    "Streaming Performance",
+    "Social Media Audit",
+    "Critical Issues",
+    "90-Day Action Plan",
+    "KPIs & Targets",
+    "Content Strategy",
+    "Budget Scenarios",
+    "Email Marketing",
+    "Quick Wins",
+    "Age to Age Campaign"
+]
+section = st.sidebar.radio("Go to:", SECTIONS)
+
+# Checklist progress persists across sessions in a local SQLite file
+@st.cache_resource
+def get_progress_store():
+    return ProgressStore()
+
+def record_tick(checklist, task_id, key):
+    # on_change callback: the widget's new value is already in session_state
+    get_progress_store().set_done(ARTIST, checklist, task_id, st.session_state[key])
+
+# Playlist curators and pitch history, shared by every session
+@st.cache_resource
+def get_curator_store():
+    return CuratorStore()
+
+# Paid spend and attributed results, appended from uploaded exports
+@st.cache_resource
+def get_spend_ledger():
+    return SpendLedger()
+
+# Distributor streams and per-stream rates for revenue estimates
+@st.cache_resource
+def get_royalty_engine():
+    return RoyaltyEngine()
+
+# Metric warehouse shared by every session
+@st.cache_resource
+def get_warehouse():
+    return Warehouse()
+
+with st.sidebar.expander("🗄️ Load Metrics"):
+    metrics_upload = st.file_uploader("Daily metrics (CSV: date, platform, metric, value)", type="csv", key="metrics_upload")
+    if metrics_upload is not None and st.session_state.get("metrics_file") != metrics_upload.file_id:
+        get_warehouse().ingest_daily_metrics(read_metric_rows(io.TextIOWrapper(metrics_upload, encoding="utf-8"), ARTIST))
+        st.session_state["metrics_file"] = metrics_upload.file_id
+        st.success("Metrics loaded")
+
+# Short links served by smart_links.py; clicks feed the funnel and attribution
+@st.cache_resource
+def get_link_store():
+    return LinkStore()
+
+with st.sidebar.expander("🔗 Smart Links"):
+    with st.form("add_link", clear_on_submit=True):
+        link_slug = st.text_input("Short name", placeholder="stream")
+        link_url = st.text_input("Destination URL")
+        link_channel = st.selectbox("Shared on", list(FUNNEL_CHANNELS) + ["Linktree", "Other"])
+        if st.form_submit_button("Save link") and link_slug and link_url:
+            get_link_store().add_link(link_slug.strip("/"), link_url, link_channel)
+    link_counts = get_link_store().counts()
+    if link_counts:
+        st.dataframe(
+            pd.DataFrame([(slug, channel, n) for slug, _, channel, _, n in link_counts], columns=['Link', 'Channel', 'Clicks']),
+            use_container_width=True,
+            hide_index=True
+        )
+
+# Bulk export of every table, or just the current section's
+with st.sidebar.expander("📥 Export Tables"):
+    export_scope = st.radio("Scope", ["All sections", "This section"], key="export_scope")
+    export_formats = ["Zipped CSVs"] + (["Excel workbook"] if excel_engine() else [])
+    export_format = st.radio("Format", export_formats, key="export_format")
+    if st.button("Prepare export"):
+        fmt = "xlsx" if export_format == "Excel workbook" else "zip"
+        tables = iter_tables(ARTIST, None if export_scope == "All sections" else section)
+        with export_tables(tables, fmt) as export_file:
+            st.download_button(
+                "Download",
+                data=export_file.read(),
+                file_name=f"{ARTIST.lower()}_audit_tables.{fmt}",
+                mime="application/zip" if fmt == "zip" else "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
+# Projections published by precompute_worker.py; sections only read them
+@st.cache_resource
+def get_artifact_store():
+    return ArtifactStore()
+
+# All of this section's warehouse queries run at once; the next one is prefetched
+@st.cache_resource
+def get_data_access():
+    return DataAccessLayer(get_warehouse())
+
+section_data = get_data_access().load_section(section, ARTIST)
+get_data_access().prefetch_next(section, ARTIST, SECTIONS)
+
 # Header
 st.markdown('<div class="main-header">🎵 JohnGreat Music</div>', unsafe_allow_html=True)
 st.markdown('<div class="sub-header">Strategic Social Media & Streaming Audit | 90-Day Growth Plan</div>', unsafe_allow_html=True)
@@ -120,7 +231,11 @@ if section == "Executive Summary":
         st.markdown('<div class="metric-card"><h2>2</h2><p>Spotify Monthly Listeners</p></div>', unsafe_allow_html=True)
     
     with col3:
-        st.markdown('<div class="metric-card"><h2>886</h2><p>Total Social Followers</p></div>', unsafe_allow_html=True)
+        audience = st.session_state.get("audience_sketches")
+        if audience and audience.platforms():
+            st.markdown(f'<div class="metric-card"><h2>{audience.reach():,}</h2><p>Unique Social Followers</p></div>', unsafe_allow_html=True)
+        else:
+            st.markdown('<div class="metric-card"><h2>886</h2><p>Total Social Followers</p></div>', unsafe_allow_html=True)
     
     with col4:
         st.markdown('<div class="metric-card"><h2>< 1,000</h2><p>Streams Per Song</p></div>', unsafe_allow_html=True)
@@ -216,14 +331,7 @@ if section == "Executive Summary":
     
     st.subheader("Current State vs. Industry Benchmarks")
     
-    benchmark_data = {
-        'Metric': ['Spotify Monthly Listeners', 'Instagram Followers', 'Email Subscribers', 'Playlist Placements'],
-        'JohnGreat (Current)': [2, 33, 0, 0],
-        'Industry Minimum': [500, 500, 100, 5],
-        'Gap': ['99.6% below', '93.4% below', '100% below', '100% below']
-    }
-    
-    df_benchmark = pd.DataFrame(benchmark_data)
+    df_benchmark = table_frame("Executive Summary", "benchmark_data")
     st.dataframe(df_benchmark, use_container_width=True, hide_index=True)
     
     st.markdown("""
@@ -273,6 +381,20 @@ elif section == "Streaming Performance":
         st.metric("Playlist Placements", "0", delta_color="inverse")
         st.metric("Algorithm Engagement", "None", delta_color="inverse", help="Need 1,000+ streams to trigger")
     
+    # Projections precomputed by the background worker from loaded data
+    stream_forecast = get_artifact_store().latest("stream_forecast", ARTIST)
+    if stream_forecast is not None:
+        version, created_at, projection = stream_forecast
+        st.caption(f"Forecast v{version} from loaded stream data, computed {datetime.fromtimestamp(created_at):%d %b %H:%M}")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Projected Next 30 Days", f"{projection['forecast'].sum():,.0f}")
+        with col2:
+            st.metric(f"Projected Day {projection['days'][-1]} Streams", f"{projection['forecast'][-1]:,.0f}",
+                      help=f"95% range: {projection['lower'][-1]:,.0f}-{projection['upper'][-1]:,.0f}")
+        with col3:
+            st.metric("Decay Model", projection['model'].title())
+    
     st.markdown("---")
     
     st.subheader("Competitive Benchmarking")
@@ -310,6 +432,35 @@ elif section == "Streaming Performance":
     
     st.plotly_chart(fig, use_container_width=True)
     
+    # Percentile rank against a loaded peer dataset
+    peer_upload = st.file_uploader(
+        "Load peer artists (CSV: Artist, Monthly Listeners, other numeric metrics)",
+        type="csv",
+        key="peer_upload"
+    )
+    if peer_upload is not None and st.session_state.get("peer_file") != peer_upload.file_id:
+        try:
+            st.session_state["peer_index"] = load_peers(peer_upload)
+        except ValueError as error:
+            st.session_state.pop("peer_index", None)
+            st.error(f"Couldn't read {peer_upload.name}: {error}")
+        st.session_state["peer_file"] = peer_upload.file_id
+    
+    peer_index = st.session_state.get("peer_index")
+    if peer_index is not None and 'Monthly Listeners' in peer_index.metrics:
+        current_listeners = comparison_data['Monthly Listeners'][-1]
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Percentile Among Peers", f"{peer_index.percentile('Monthly Listeners', current_listeners):.1f}",
+                      help=f"Out of {len(peer_index):,} peer artists")
+        with col2:
+            st.metric("Peer Median Listeners", f"{peer_index.median('Monthly Listeners'):,.0f}")
+        with col3:
+            st.metric("Gap to Median", f"{peer_index.gap_to_median('Monthly Listeners', current_listeners):,.0f}")
+        
+        st.markdown("**Closest Peers by Monthly Listeners:**")
+        st.dataframe(peer_index.nearest('Monthly Listeners', current_listeners, k=5), use_container_width=True, hide_index=True)
+    
     st.markdown("---")
     
     st.subheader("The Conversion Crisis: YouTube → Spotify")
@@ -360,14 +511,74 @@ elif section == "Streaming Performance":
     
     st.markdown("---")
     
+    st.subheader("Funnel Analytics: Channel → Spotify")
+    
+    if "funnel_engine" not in st.session_state:
+        st.session_state["funnel_engine"] = FunnelEngine()
+        st.session_state["funnel_engine"].add_rows(BASELINE_FUNNEL)
+        st.session_state["funnel_files"] = set()
+    funnel_engine = st.session_state["funnel_engine"]
+    
+    funnel_upload = st.file_uploader(
+        "Add daily funnel data (CSV: date, channel, stage, count)",
+        type="csv",
+        key="funnel_upload"
+    )
+    if funnel_upload is not None and funnel_upload.file_id not in st.session_state["funnel_files"]:
+        funnel_engine.add_rows(read_funnel_rows(io.TextIOWrapper(funnel_upload, encoding="utf-8")))
+        st.session_state["funnel_files"].add(funnel_upload.file_id)
+    
+    # Smart-link clicks logged since the last rerun become Link Clicks
+    new_clicks, st.session_state["funnel_click_id"] = get_link_store().clicks_after(st.session_state.get("funnel_click_id", 0))
+    other_clicks = st.session_state.setdefault("funnel_other_clicks", {})
+    for day, channel, stage, count in daily_click_rows(new_clicks, FUNNEL_CHANNELS):
+        if channel in FUNNEL_CHANNELS:
+            funnel_engine.add(day, channel, stage, count)
+        else:
+            # Linktree, Other and unknown utm_source clicks have no funnel row
+            other_clicks[channel] = other_clicks.get(channel, 0) + count
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        fig = go.Figure()
+        channel_colors = ['#dc3545', '#8B4789', '#17a2b8', '#D4A574']
+        for c, channel in enumerate(FUNNEL_CHANNELS):
+            if funnel_engine.totals[c].any():
+                fig.add_trace(go.Funnel(
+                    name=channel,
+                    y=list(FUNNEL_STAGES),
+                    x=funnel_engine.totals[c].tolist(),
+                    textinfo="value+percent initial",
+                    marker=dict(color=channel_colors[c])
+                ))
+        
+        fig.update_layout(
+            title=f"Conversion Funnel by Channel ({len(funnel_engine.days)} days of data)",
+            height=400
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        if other_clicks:
+            st.caption("Smart-link clicks outside the funnel channels: " + ", ".join(
+                f"{channel} {n:,}" for channel, n in sorted(other_clicks.items(), key=lambda item: -item[1])
+            ))
+    
+    with col2:
+        st.markdown("**Stage-to-Stage Conversion (%):**")
+        funnel_rates = funnel_engine.conversion()
+        df_funnel = pd.DataFrame(funnel_rates).T.reset_index().rename(columns={'index': 'Channel'})
+        st.dataframe(df_funnel, use_container_width=True, hide_index=True)
+        
+        if funnel_engine.days:
+            funnel_channel = st.selectbox("Daily cohort matrix", [c for c in funnel_rates] or list(FUNNEL_CHANNELS))
+            st.dataframe(funnel_engine.cohort_matrix(funnel_channel), use_container_width=True)
+    
+    st.markdown("---")
+    
     st.subheader("Multi-Platform Streaming Presence")
     
-    platforms = {
-        'Platform': ['Spotify', 'Apple Music', 'YouTube Music', 'TIDAL', 'Amazon Music', 'Deezer'],
-        'Status': ['✅ Active', '✅ Active', '✅ Active', '✅ Active', '✅ Likely', '✅ Likely'],
-        'Est. Monthly Streams': [90, 50, 30, 10, 15, 5],
-        'Note': ['2 listeners', 'Unknown metrics', 'Unknown', 'Unknown', 'Unknown', 'Unknown']
-    }
+    platforms = TABLES["Streaming Performance"]["platforms"]
     
     df_platforms = pd.DataFrame(platforms)
     st.dataframe(df_platforms, use_container_width=True, hide_index=True)
@@ -490,6 +701,57 @@ elif section == "Social Media Audit":
     
     st.markdown("---")
     
+    st.subheader("Cross-Platform Audience Overlap")
+    
+    if "audience_sketches" not in st.session_state:
+        st.session_state["audience_sketches"] = AudienceSketches()
+        st.session_state["audience_files"] = set()
+    audience = st.session_state["audience_sketches"]
+    
+    audience_upload = st.file_uploader(
+        "Add follower/engager IDs (CSV: date, platform, user_id, kind)",
+        type="csv",
+        key="audience_upload"
+    )
+    if audience_upload is not None and audience_upload.file_id not in st.session_state["audience_files"]:
+        audience.add_rows(read_audience_ids(io.TextIOWrapper(audience_upload, encoding="utf-8")))
+        st.session_state["audience_files"].add(audience_upload.file_id)
+    
+    if audience.platforms():
+        audience_weeks = st.multiselect("Weeks", audience.weeks(), default=audience.weeks())
+        overlap = audience.overlap_matrix(weeks=audience_weeks)
+        summed = int(overlap.values.diagonal().sum())
+        unique = audience.reach(weeks=audience_weeks)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Summed Platform Followers", f"{summed:,}")
+        with col2:
+            st.metric("Unique People (est.)", f"{unique:,}")
+        with col3:
+            st.metric("Double-Counted", f"{max(summed - unique, 0):,}",
+                      help="Followers counted on more than one platform")
+        
+        fig = go.Figure(data=go.Heatmap(
+            z=overlap.values,
+            x=overlap.columns,
+            y=overlap.index,
+            colorscale=[[0, '#f8f9fa'], [1, '#8B4789']],
+            text=overlap.values,
+            texttemplate="%{text:,}"
+        ))
+        
+        fig.update_layout(
+            title="Estimated Shared Followers Between Platforms",
+            height=400
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.caption("Upload follower IDs to replace summed platform counts with deduplicated reach.")
+    
+    st.markdown("---")
+    
     # Platform tabs
     platform_tabs = st.tabs(["📺 YouTube", "📸 Instagram", "🎬 TikTok", "📘 Facebook", "🐦 Twitter/X"])
     
@@ -608,20 +870,13 @@ elif section == "Social Media Audit":
         
         with col1:
             st.markdown("**30-Day Historical Performance (Peak Period):**")
-            historical_data = {
-                'Metric': ['Views', 'Profile Visits', 'Link Taps', 'Saves'],
-                'Value': [1662, 88, 1, 2],
-                'Trend': ['-57.7%', '-43.2%', '0.06% conv', 'Low utility']
-            }
+            historical_data = TABLES["Social Media Audit"]["historical_data"]
             df_hist = pd.DataFrame(historical_data)
             st.dataframe(df_hist, use_container_width=True, hide_index=True)
         
         with col2:
             st.markdown("**Best Performing Content:**")
-            best_posts = {
-                'Post': ['Staircase/outdoor piano', 'Music video teaser', 'Spotify player graphic'],
-                'Engagement': ['100 likes, 1 comment', '1,887 views (Reel)', '263 views (Reel)']
-            }
+            best_posts = TABLES["Social Media Audit"]["best_posts"]
             df_best = pd.DataFrame(best_posts)
             st.dataframe(df_best, use_container_width=True, hide_index=True)
         
@@ -772,10 +1027,7 @@ elif section == "Social Media Audit":
         
         with col1:
             st.markdown("**Current Post Performance:**")
-            facebook_posts = {
-                'Post': ['Song announcement', 'Reel teaser', 'Made Up My Mind video'],
-                'Engagement': ['0 reactions, 0 comments', '0 reactions, 0 comments', '2 comments']
-            }
+            facebook_posts = TABLES["Social Media Audit"]["facebook_posts"]
             df_fb = pd.DataFrame(facebook_posts)
             st.dataframe(df_fb, use_container_width=True, hide_index=True)
         
@@ -822,11 +1074,7 @@ elif section == "Social Media Audit":
         
         st.markdown("---")
         
-        tweet_performance = {
-            'Tweet': ['Birthday + song announcement', 'Music video promo', 'Scripture + promo'],
-            'Views': [14, 4, 2],
-            'Engagement': ['0 likes, 0 retweets', '0 likes, 0 retweets', '0 likes, 0 retweets']
-        }
+        tweet_performance = TABLES["Social Media Audit"]["tweet_performance"]
         
         df_tweets = pd.DataFrame(tweet_performance)
         st.dataframe(df_tweets, use_container_width=True, hide_index=True)
@@ -863,13 +1111,7 @@ elif section == "Social Media Audit":
     
     st.subheader("Cross-Platform Strategy Summary")
     
-    strategy_matrix = {
-        'Platform': ['YouTube', 'Instagram', 'TikTok', 'Facebook', 'Twitter/X'],
-        'Priority': ['Medium', 'High', 'High', 'Low', 'Medium'],
-        'Time/Day': ['20 min', '30 min', '20 min', '10 min', '10 min'],
-        'Focus': ['Fix conversion, content strategy', 'Daily Reels, community building', 'Viral content, daily posting', 'Group engagement, Live events', 'Networking, curator relationships'],
-        '30-Day Target': ['+20 subs', '+50 followers', '+100 followers', '+50 followers', '+50 followers']
-    }
+    strategy_matrix = TABLES["Social Media Audit"]["strategy_matrix"]
     
     df_strategy = pd.DataFrame(strategy_matrix)
     st.dataframe(df_strategy, use_container_width=True, hide_index=True)
@@ -1088,11 +1330,7 @@ elif section == "Critical Issues":
             """)
         
         with col2:
-            collaboration_data = {
-                'Type': ['Featured Artist', 'Cross-Promotion', 'Joint Live', 'Playlist Exchange'],
-                'Status': ['✅ Has (unused)', '❌ Missing', '❌ Missing', '❌ Missing'],
-                'Potential Reach': ['100-500 listeners', '50-200 followers', '20-50 viewers', '50-100 streams']
-            }
+            collaboration_data = TABLES["Critical Issues"]["collaboration_data"]
             
             df_collab = pd.DataFrame(collaboration_data)
             st.dataframe(df_collab, use_container_width=True, hide_index=True)
@@ -1116,6 +1354,53 @@ elif section == "Critical Issues":
         <p><strong>Target (90 Days):</strong> 3 collaboration features secured</p>
         </div>
         """, unsafe_allow_html=True)
+        
+        st.markdown("**Collaboration Partner Finder:**")
+        
+        artists_upload = st.file_uploader(
+            "Artist dataset (CSV: Artist, Genres, Monthly Listeners, Audience <segment>...)",
+            type="csv",
+            key="artists_upload"
+        )
+        if artists_upload is not None and st.session_state.get("collab_file") != artists_upload.file_id:
+            try:
+                st.session_state["collab_index"] = CollaboratorIndex(read_artists(artists_upload))
+            except ValueError as error:
+                st.session_state.pop("collab_index", None)
+                st.error(f"Couldn't read {artists_upload.name}: {error}")
+            st.session_state["collab_file"] = artists_upload.file_id
+        
+        collab_index = st.session_state.get("collab_index")
+        if collab_index is not None:
+            col1, col2 = st.columns(2)
+            with col1:
+                collab_genres = st.text_input("Genre tags", "gospel, worship, afro gospel")
+            with col2:
+                collab_range = st.slider("Partner monthly listeners", 0, 50000, (500, 5000), step=100)
+            
+            # Our audience mix from the loaded follower sketches, as 'Audience <platform>' shares
+            audience = st.session_state.get("audience_sketches")
+            audience_mix = None
+            if audience and audience.platforms():
+                platform_reach = {platform: audience.reach([platform]) for platform in audience.platforms()}
+                total_reach = sum(platform_reach.values())
+                if total_reach:
+                    audience_mix = {f"Audience {platform}": n / total_reach for platform, n in platform_reach.items()}
+            
+            started = datetime.now()
+            partners = collab_index.query(
+                collab_genres, 2, audience=audience_mix, k=10,
+                min_listeners=collab_range[0], max_listeners=collab_range[1],
+                exclude=(ARTIST,)
+            )
+            elapsed_ms = (datetime.now() - started).total_seconds() * 1000
+            st.dataframe(partners, use_container_width=True, hide_index=True)
+            matched = [segment for segment in collab_index.segments if audience_mix and segment in audience_mix]
+            audience_note = (
+                f"audience matched on {', '.join(m[len('Audience '):] for m in matched)}" if matched
+                else "load follower IDs under Social Media Audit to match on audience"
+            )
+            st.caption(f"Searched {len(collab_index.artists):,} artists in {elapsed_ms:.0f} ms; {audience_note}")
     
     # Issue 5: Campaign Abandonment
     with issue_tabs[4]:
@@ -1194,12 +1479,7 @@ elif section == "Critical Issues":
         
         st.markdown("---")
         
-        budget_scenarios = {
-            'Scenario': ['£0 Budget', '£50/Month', '£100/Month', '£200/Month'],
-            'Expected Followers/Month': ['5-15', '30-50', '50-100', '100-200'],
-            'Expected Listeners/Month': ['2-5', '10-20', '20-40', '50-100'],
-            'ROI': ['Slow organic', '10x better', '20x better', '40x better']
-        }
+        budget_scenarios = TABLES["Critical Issues"]["budget_scenarios"]
         
         df_budget = pd.DataFrame(budget_scenarios)
         st.dataframe(df_budget, use_container_width=True, hide_index=True)
@@ -1278,6 +1558,51 @@ elif section == "Critical Issues":
             - Higher conversion than social media
             """)
         
+        st.markdown("**What If the Assumptions Are Off?**")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            sens_subscribers = st.slider("Email subscribers", 10, 500, (50, 200), step=10, key="sens_subscribers")
+        with col2:
+            sens_open = st.slider("Open rate (%)", 5, 60, (20, 40), key="sens_open")
+        with col3:
+            sens_click = st.slider("Click rate of opens (%)", 5, 80, (20, 60), key="sens_click")
+        
+        def clamp(value, bounds):
+            return min(max(value, bounds[0]), bounds[1])
+        
+        sens_overrides = {
+            "subscribers": (clamp(100, sens_subscribers), *sens_subscribers),
+            "open_rate": (clamp(0.30, (sens_open[0] / 100, sens_open[1] / 100)), sens_open[0] / 100, sens_open[1] / 100),
+            "click_rate": (clamp(0.50, (sens_click[0] / 100, sens_click[1] / 100)), sens_click[0] / 100, sens_click[1] / 100)
+        }
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig = tornado_figure("email_presaves", "Pre-Saves Sensitivity", "Pre-saves", sens_overrides, height=350)
+            
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            open_values, click_values, presave_grid = heatmap("email_presaves", "open_rate", "click_rate", sens_overrides)
+            fig = go.Figure(data=go.Heatmap(
+                z=presave_grid,
+                x=open_values * 100,
+                y=click_values * 100,
+                colorscale=[[0, '#f8f9fa'], [1, '#8B4789']],
+                colorbar=dict(title="Pre-saves")
+            ))
+            
+            fig.update_layout(
+                title=f"Open Rate × Click Rate ({sens_overrides['subscribers'][0]:.0f} subscribers)",
+                xaxis_title="Open rate (%)",
+                yaxis_title="Click rate of opens (%)",
+                height=350
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+        
         st.markdown("""
         <div class="action-box">
         <h4>✅ Solution: Email List Foundation (Week 1)</h4>
@@ -1323,22 +1648,7 @@ elif section == "90-Day Action Plan":
     with month_tabs[0]:
         st.subheader("Month 1: Stop the Bleeding (Days 1-30)")
         
-        weekly_tasks = {
-            'Week': ['Week 1', 'Week 2', 'Week 3', 'Week 4'],
-            'Focus': ['Emergency Fixes', 'Content & Engagement', 'Paid Promotion Launch', 'Optimization'],
-            'Key Tasks': [
-                'Fix YouTube, Instagram, TikTok, Email, Facebook, Twitter',
-                'Batch create content, first email campaign, community engagement',
-                'Launch ads (£50-100), playlist pitching, collaboration outreach',
-                'Analytics review, content repurposing, month 2 planning'
-            ],
-            'Targets': [
-                'All platforms reactivated, 5-10 new followers',
-                '10-15 new followers, 5-10 email subs',
-                '20-30 new followers, 10-15 new listeners',
-                'Optimize based on data, plan month 2'
-            ]
-        }
+        weekly_tasks = TABLES["90-Day Action Plan"]["weekly_tasks"]
         
         df_week1 = pd.DataFrame(weekly_tasks)
         st.dataframe(df_week1, use_container_width=True, hide_index=True)
@@ -1410,22 +1720,7 @@ elif section == "90-Day Action Plan":
         """, unsafe_allow_html=True)
         
         # Month 2 Timeline
-        timeline_data = {
-            'Week': ['Week 5', 'Week 6', 'Week 7', 'Week 8'],
-            'Theme': ['Content System', 'Growth Sprints', 'Email & Fans', 'Optimization'],
-            'Key Activities': [
-                'Batch creation, collaboration launch, playlist pitching',
-                'Instagram sprint, TikTok sprint, YouTube optimization',
-                'Email campaigns, fan engagement, community deepening',
-                'Content repurposing, paid ads round 2, month 3 planning'
-            ],
-            'Growth Targets': [
-                '40-60 new followers, content system established',
-                '30-50 new followers, platform-specific growth',
-                '20-30 email subs, deeper fan connections',
-                'Optimization based on data, prepare for scale'
-            ]
-        }
+        timeline_data = TABLES["90-Day Action Plan"]["timeline_data"]
         
         df_month2 = pd.DataFrame(timeline_data)
         st.dataframe(df_month2, use_container_width=True, hide_index=True)
@@ -1497,12 +1792,7 @@ elif section == "90-Day Action Plan":
         """, unsafe_allow_html=True)
         
         # Month 3 Goals Chart
-        goals_data = {
-            'Metric': ['Spotify Monthly Listeners', 'Instagram Followers', 'TikTok Followers', 'Email Subscribers'],
-            'Start (Day 60)': [50, 150, 150, 70],
-            'Target (Day 90)': [500, 300, 500, 100],
-            'Growth': ['10x', '2x', '3x', '1.5x']
-        }
+        goals_data = TABLES["90-Day Action Plan"]["goals_data"]
         
         df_goals = pd.DataFrame(goals_data)
         st.dataframe(df_goals, use_container_width=True, hide_index=True)
@@ -1564,7 +1854,7 @@ elif section == "90-Day Action Plan":
         
         # Final growth chart
         days = [0, 30, 60, 90]
-        listeners = [2, 15, 50, 500]
+        listeners = PRIMITIVES["listener_targets"]
         
         fig = go.Figure()
         
@@ -1615,6 +1905,39 @@ elif section == "90-Day Action Plan":
         </ul>
         </div>
         """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Dependency-aware task schedule
+    st.subheader("🧩 Task Scheduler: 90-Day Plan Packed Into Daily Capacity")
+    
+    st.session_state.setdefault("task_slips", {})
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        daily_capacity = st.slider("Daily time available (minutes)", 30, 180, 90, step=15, key="daily_capacity",
+                                   help="Conservative scenario: 90-120 minutes daily")
+    with col2:
+        slip_task = st.selectbox("Task that slipped", list(PLAN_TASKS), format_func=lambda t: PLAN_TASKS[t][0], key="slip_task")
+    with col3:
+        slip_days = st.number_input("Days late", 0, 30, st.session_state["task_slips"].get(slip_task, 0), key=f"slip_days_{slip_task}")
+        st.session_state["task_slips"][slip_task] = slip_days
+    
+    df_tasks = schedule_tasks(PLAN_TASKS, capacity=daily_capacity, slips=st.session_state["task_slips"], start=datetime(2026, 1, 15).date())
+    
+    fig = px.bar(
+        df_tasks,
+        x='Day',
+        y='Minutes',
+        color='Task',
+        title=f"Daily Workload ({daily_capacity} min/day capacity)"
+    )
+    fig.add_hline(y=daily_capacity, line_dash="dash", line_color="#dc3545")
+    fig.update_layout(height=400, showlegend=False)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    with st.expander("View day-by-day task schedule"):
+        st.dataframe(df_tasks.drop(columns='Task ID'), use_container_width=True, hide_index=True)
 
 # ============================================
 # SECTION 6: KPIs & TARGETS
@@ -1640,19 +1963,14 @@ elif section == "KPIs & Targets":
     
     # Streaming KPIs
     with kpi_tabs[0]:
-        streaming_kpis = {
-            'Metric': ['Spotify Monthly Listeners', 'Total Streams (90 days)', 'Playlist Placements', 'Algorithm Playlists', 'Listener Geography'],
-            'Starting': ['2', '500-1,000', '0', 'None', 'Unknown'],
-            'Target': ['500+', '15,000+', '5-10', 'Release Radar, Discover Weekly', 'UK, Nigeria, US'],
-            'Weight': ['30%', '20%', '20%', '15%', '15%']
-        }
+        streaming_kpis = TABLES["KPIs & Targets"]["streaming_kpis"]
         
         df_streaming = pd.DataFrame(streaming_kpis)
         st.dataframe(df_streaming, use_container_width=True, hide_index=True)
         
         # Streaming growth chart
         months = ['Start', 'Month 1', 'Month 2', 'Month 3']
-        listeners = [2, 15, 50, 500]
+        listeners = PRIMITIVES["listener_targets"]
         
         fig = go.Figure(data=[
             go.Bar(
@@ -1660,7 +1978,9 @@ elif section == "KPIs & Targets":
                 y=listeners,
                 marker_color=['#dc3545', '#ffc107', '#17a2b8', '#28a745'],
                 text=listeners,
-                textposition='outside'
+                textposition='outside',
+                customdata=pct_of_target(listeners, 500),
+                hovertemplate='<b>%{x}</b><br>Listeners: %{y}<br>%{customdata:.1f}% of 500 target<extra></extra>'
             )
         ])
         
@@ -1671,18 +1991,43 @@ elif section == "KPIs & Targets":
         )
         
         st.plotly_chart(fig, use_container_width=True)
+        
+        # Actual listeners from the warehouse, when loaded
+        listener_history = section_data["spotify_listeners"]
+        if listener_history:
+            df_listeners = pd.DataFrame(listener_history, columns=['Date', 'Monthly Listeners'])
+            fig = px.line(df_listeners, x='Date', y='Monthly Listeners', title="Actual Spotify Monthly Listeners", markers=True)
+            fig.add_hline(y=500, line_dash="dash", line_color="#28a745", annotation_text="Target: 500+")
+            fig.update_traces(line_color='#8B4789')
+            fig.update_layout(height=350)
+            st.plotly_chart(fig, use_container_width=True)
+        
+        stream_history = section_data["spotify_streams"]
+        if stream_history:
+            df_streams = pd.DataFrame(stream_history, columns=['Date', 'Streams'])
+            fig = px.bar(df_streams, x='Date', y='Streams', title="Actual Daily Spotify Streams")
+            fig.update_traces(marker_color='#D4A574')
+            fig.update_layout(height=300)
+            st.plotly_chart(fig, use_container_width=True)
     
     # Social Media KPIs
     with kpi_tabs[1]:
-        social_kpis = {
-            'Platform': ['Instagram', 'TikTok', 'YouTube', 'Facebook', 'Twitter/X', 'Total'],
-            'Starting': ['33', '1', '849', '3', '0', '886'],
-            'Target': ['300+', '500+', '1,000+', '100+', '100+', '2,000+'],
-            'Growth': ['9x', '500x', '1.2x', '33x', '∞', '2.3x'],
-            'Priority': ['High', 'High', 'Medium', 'Low', 'Medium', 'N/A']
-        }
+        social_kpis = TABLES["KPIs & Targets"]["social_kpis"]
         
         df_social = pd.DataFrame(social_kpis)
+        # Latest follower counts from the warehouse, when loaded
+        latest_metrics = {(platform, metric): value for platform, metric, value in section_data["latest"]}
+        current_followers = [
+            latest_metrics.get((platform, 'followers'), latest_metrics.get((platform, 'subscribers')))
+            for platform in df_social['Platform']
+        ]
+        if any(v is not None for v in current_followers):
+            df_social.insert(2, 'Current', [f"{v:,.0f}" if v is not None else '—' for v in current_followers])
+        audience = st.session_state.get("audience_sketches")
+        if audience and audience.platforms():
+            unique_row = dict.fromkeys(df_social.columns, 'N/A')
+            unique_row.update({'Platform': 'Unique (deduplicated)', 'Starting': f"{audience.reach():,}"})
+            df_social.loc[len(df_social)] = unique_row
         st.dataframe(df_social, use_container_width=True, hide_index=True)
         
         # Social media growth chart
@@ -1724,19 +2069,20 @@ elif section == "KPIs & Targets":
         </div>
         """, unsafe_allow_html=True)
         
-        email_kpis = {
-            'Metric': ['Total Subscribers', 'Open Rate', 'Click Rate', 'Conversion to Streams', 'Superfans Identified'],
-            'Starting': ['0', 'N/A', 'N/A', 'N/A', '0'],
-            'Target': ['100+', '30%+', '20%+', '10%+', '10-20'],
-            'Industry Avg': ['Varies', '20-25%', '10-15%', '5-10%', '1-5%']
-        }
+        email_kpis = TABLES["KPIs & Targets"]["email_kpis"]
         
         df_email = pd.DataFrame(email_kpis)
         st.dataframe(df_email, use_container_width=True, hide_index=True)
         
+        subscriber_history = section_data["email_subscribers"]
+        if subscriber_history:
+            st.metric("Current Subscribers", f"{subscriber_history[-1][1]:,.0f}",
+                      delta=f"{subscriber_history[-1][1] - 100:+,.0f} vs 100 target",
+                      help=f"Warehouse figure for {subscriber_history[-1][0]}")
+        
         # Email growth projection
         months = ['Start', 'Month 1', 'Month 2', 'Month 3']
-        subscribers = [0, 30, 70, 100]
+        subscribers = PRIMITIVES["email_subscriber_targets"]
         
         fig = go.Figure(data=[
             go.Scatter(
@@ -1759,16 +2105,36 @@ elif section == "KPIs & Targets":
     
     # Engagement KPIs
     with kpi_tabs[3]:
-        engagement_kpis = {
-            'Metric': ['Instagram Engagement Rate', 'TikTok Avg Views', 'YouTube Avg Views', 'Email Open Rate', 'Community Activity'],
-            'Starting': ['6-12%', '123', '142', 'N/A', 'None'],
-            'Target': ['15%+', '1,000+', '500+', '30%+', 'Daily'],
-            'Industry Good': ['5-10%', '500-1,000', 'Varies', '20-25%', '3-5x/week']
-        }
+        engagement_kpis = TABLES["KPIs & Targets"]["engagement_kpis"]
         
         df_engagement = pd.DataFrame(engagement_kpis)
         st.dataframe(df_engagement, use_container_width=True, hide_index=True)
         
+        # Measured engagement from ingested per-post events
+        engagement_upload = st.file_uploader(
+            "Upload engagement events (CSV: timestamp, platform, post_id, likes, comments, shares, views)",
+            type="csv",
+            key="engagement_events"
+        )
+        if engagement_upload is not None:
+            social_start = TABLES["KPIs & Targets"]["social_kpis"]
+            followers = {
+                platform: int(count)
+                for platform, count in zip(social_start['Platform'], social_start['Starting'])
+                if platform != 'Total'
+            }
+            windows = EngagementWindows(followers, bucket_seconds=86400, window_buckets=7)
+            windows.ingest_many(read_events(io.TextIOWrapper(engagement_upload, encoding="utf-8")))
+            rates = windows.rates()
+            df_measured = pd.DataFrame({
+                'Platform': list(rates),
+                'Posts (7 days)': [r['posts'] for r in rates.values()],
+                'Engagement Rate': [f"{r['engagement_rate']:.1f}%" if pd.notna(r['engagement_rate']) else 'N/A' for r in rates.values()],
+                'Avg Views': [f"{r['avg_views']:,.0f}" if pd.notna(r['avg_views']) else 'N/A' for r in rates.values()]
+            })
+            st.markdown("**Measured Engagement (Last 7 Days of Ingested Events):**")
+            st.dataframe(df_measured, use_container_width=True, hide_index=True)
+        
         st.markdown("""
         <div class="action-box">
         <h4>🎯 Engagement Quality Over Quantity</h4>
@@ -1792,16 +2158,123 @@ elif section == "KPIs & Targets":
         </div>
         """, unsafe_allow_html=True)
         
-        financial_kpis = {
-            'Metric': ['Total Investment', 'Streaming Revenue', 'ROI (Monetary)', 'Cost Per Listener', 'Strategic ROI'],
-            'Budget £0': ['£0', '£5-10', 'N/A', '£0', 'Audience growth only'],
-            'Budget £50/m': ['£150', '£15-25', '-83% to -87%', '£0.30-0.50', '10x faster growth'],
-            'Budget £100/m': ['£300', '£20-35', '-89% to -93%', '£0.60-1.00', '20x faster growth']
-        }
+        spend_ledger = get_spend_ledger()
+        
+        col1, col2, col3 = st.columns([2, 1, 2])
+        with col1:
+            spend_uploads = st.file_uploader(
+                "Ad spend exports (Meta, TikTok, Google Ads CSV)",
+                type="csv",
+                accept_multiple_files=True,
+                key="spend_uploads"
+            )
+        with col2:
+            spend_channel = st.selectbox("Channel (if not in export)", ["Instagram", "Facebook", "TikTok", "YouTube", "SubmitHub", "Other"])
+        with col3:
+            results_upload = st.file_uploader("Attributed results (CSV: date, channel, result, count)", type="csv", key="results_upload")
+        
+        for upload in spend_uploads or []:
+            digest = file_digest(upload.getvalue())
+            if digest not in spend_ledger.sources:
+                try:
+                    spend_ledger.append_spend(read_spend_export(upload, spend_channel), source=digest)
+                except (ValueError, KeyError) as e:
+                    st.warning(f"Couldn't read {upload.name}: {e}")
+        if results_upload is not None:
+            digest = file_digest(results_upload.getvalue())
+            if digest not in spend_ledger.sources:
+                try:
+                    spend_ledger.append_results(read_results(results_upload), source=digest)
+                except (ValueError, KeyError) as e:
+                    st.warning(f"Couldn't read {results_upload.name}: {e}")
+        
+        royalty_engine = get_royalty_engine()
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            streams_upload = st.file_uploader(
+                "Distributor streams (CSV: date, platform, country, streams)",
+                type="csv",
+                key="royalty_streams_upload"
+            )
+        with col2:
+            rates_upload = st.file_uploader("Per-stream rates (CSV: platform, country, rate)", type="csv", key="royalty_rates_upload")
+        if streams_upload is not None:
+            digest = file_digest(streams_upload.getvalue())
+            if digest not in royalty_engine.sources:
+                royalty_engine.add_rows(read_stream_rows(io.TextIOWrapper(streams_upload, encoding="utf-8")), source=digest)
+        if rates_upload is not None:
+            digest = file_digest(rates_upload.getvalue())
+            if digest != royalty_engine.rates_source:
+                royalty_engine.set_rates(read_rate_table(io.TextIOWrapper(rates_upload, encoding="utf-8")), source=digest)
+        
+        financial_kpis = TABLES["KPIs & Targets"]["financial_kpis"]
         
         df_financial = pd.DataFrame(financial_kpis)
+        if spend_ledger or royalty_engine:
+            spend_totals = spend_ledger.totals()
+            cost_per_listener = spend_totals['Cost per listener']
+            streaming_revenue = royalty_engine.total_revenue()
+            df_financial['Measured'] = [
+                f"£{spend_totals['Spend']:,.2f}",
+                f"£{streaming_revenue:,.2f}" if royalty_engine else 'No streams yet',
+                f"{(streaming_revenue - spend_totals['Spend']) / spend_totals['Spend'] * 100:+.0f}%" if spend_totals['Spend'] else 'N/A',
+                f"£{cost_per_listener:,.2f}" if cost_per_listener is not None else 'No results yet',
+                ''
+            ]
         st.dataframe(df_financial, use_container_width=True, hide_index=True)
         
+        if royalty_engine:
+            df_revenue = royalty_engine.daily_revenue()
+            fig = go.Figure()
+            for platform in df_revenue.columns:
+                if df_revenue[platform].any():
+                    fig.add_trace(go.Scatter(
+                        name=platform,
+                        x=df_revenue.index,
+                        y=df_revenue[platform].cumsum(),
+                        stackgroup='revenue'
+                    ))
+            if spend_ledger:
+                df_roi = royalty_engine.roi(spend_ledger.spend.groupby('day')['amount'].sum())
+                fig.add_trace(go.Scatter(
+                    name='Cumulative Spend',
+                    x=df_roi.index,
+                    y=df_roi['Spend'],
+                    mode='lines',
+                    line=dict(color='#dc3545', width=3, dash='dash')
+                ))
+            
+            fig.update_layout(
+                title="Cumulative Streaming Revenue by Platform",
+                yaxis_title="£",
+                height=400
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+        
+        if spend_ledger:
+            st.markdown("**Measured Cost per Result by Channel:**")
+            df_costs = spend_ledger.cost_per_result(('channel',)).rename(columns={'channel': 'Channel'})
+            money = ['Spend'] + [c for c in df_costs.columns if c.startswith('Cost per')]
+            for column in money:
+                df_costs[column] = df_costs[column].map(lambda v: f"£{v:,.2f}" if pd.notna(v) else 'N/A')
+            st.dataframe(df_costs, use_container_width=True, hide_index=True)
+            
+            daily_spend = spend_ledger.cost_per_result(('day', 'channel'))
+            fig = go.Figure()
+            for channel, rows in daily_spend.groupby('channel'):
+                fig.add_trace(go.Bar(name=channel, x=rows['day'], y=rows['Spend']))
+            
+            fig.update_layout(
+                title="Daily Spend by Channel",
+                barmode='stack',
+                yaxis_title="Spend (£)",
+                height=350
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+        
         st.markdown("""
         <div class="action-box">
         <h4>📈 Strategic ROI (What Really Matters)</h4>
@@ -1855,6 +2328,12 @@ elif section == "KPIs & Targets":
         <p>Major strategy overhaul</p>
         </div>
         """, unsafe_allow_html=True)
+    
+    budget_comparison = TABLES["Budget Scenarios"]["comparison_data"]
+    assessment_scenario = st.selectbox("Simulate tiers for budget scenario", budget_comparison['Investment Tier'], index=2)
+    assessment_range = budget_comparison['Projected Listeners'][budget_comparison['Investment Tier'].index(assessment_scenario)]
+    assessment_odds = tier_probabilities(first_passage(*parse_range(assessment_range))['assessment'])
+    st.caption(" | ".join(f"{label} listeners: {p * 100:.0f}% chance" for label, p in assessment_odds.items()))
 
 # ============================================
 # SECTION 7: CONTENT STRATEGY
@@ -2001,17 +2480,77 @@ elif section == "Content Strategy":
     # Posting Schedule
     st.subheader("📅 Weekly Posting Schedule")
     
-    schedule_data = {
-        'Platform': ['Instagram', 'TikTok', 'YouTube', 'Email', 'Facebook', 'Twitter'],
-        'Daily': ['1 Reel + 3-5 Stories', '1-2 videos', 'As needed', 'N/A', 'N/A', 'N/A'],
-        'Weekly': ['7 Reels, 20+ Stories', '7-14 videos', '1-3 Shorts or 1 main video', '1 newsletter', '3-4 posts', 'Daily engagement'],
-        'Time/Day': ['30 min', '20 min', '20 min', '15 min', '10 min', '10 min'],
-        'Best Time': ['6-8pm UK', '12-2pm & 7-9pm', '2-4pm weekdays', 'Tuesday 10am', '7-9pm weekdays', 'Throughout day']
-    }
+    schedule_data = TABLES["Content Strategy"]["schedule_data"]
     
     df_schedule = pd.DataFrame(schedule_data)
+    
+    # Data-backed posting times from ingested post history
+    history_upload = st.file_uploader(
+        "Upload post history to optimise posting times (CSV: timestamp, platform, post_id, likes, comments, shares, views)",
+        type="csv",
+        key="post_history"
+    )
+    if history_upload is not None and st.session_state.get("posting_index_file") != history_upload.file_id:
+        posting_index = PostingTimeIndex(df_schedule['Platform'])
+        posting_index.add_events(read_events(io.TextIOWrapper(history_upload, encoding="utf-8")))
+        st.session_state["posting_index"] = posting_index
+        st.session_state["posting_index_file"] = history_upload.file_id
+    
+    posting_index = st.session_state.get("posting_index")
+    data_cells = None
+    if posting_index is not None:
+        df_schedule['Data-Backed Best Time'] = [
+            format_best_time(posting_index.recommend(platform)) for platform in df_schedule['Platform']
+        ]
+    
     st.dataframe(df_schedule, use_container_width=True, hide_index=True)
     
+    if posting_index is not None:
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            heatmap_platform = st.selectbox("Engagement by hour", list(df_schedule['Platform']), key="heatmap_platform")
+            use_data_times = st.toggle("Schedule with data-backed times", value=True, key="use_data_times")
+        with col2:
+            fig = px.imshow(
+                posting_index.expected(heatmap_platform),
+                x=list(range(24)),
+                y=['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'],
+                color_continuous_scale=['#f8f9fa', '#8B4789'],
+                labels=dict(x="Hour (UK)", y="", color="Expected engagement"),
+                aspect="auto"
+            )
+            fig.update_layout(height=300)
+            st.plotly_chart(fig, use_container_width=True)
+        
+        if use_data_times:
+            data_cells = {platform: best_cells(posting_index.recommend(platform)) for platform in df_schedule['Platform']}
+    
+    # Pillar assets expanded into dated post slots
+    st.subheader("🗓️ 90-Day Post Calendar")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        calendar_start = st.date_input("Calendar start", datetime(2026, 1, 18), key="calendar_start")
+    with col2:
+        pillar_every = st.slider("New pillar asset every (days)", 3, 14, 7, key="pillar_every")
+    
+    df_posts = expand_calendar([ARTIST], df_schedule, calendar_start, days=90, pillar_every=pillar_every,
+                               best_cells=data_cells)
+    df_posts['Week'] = (df_posts['Slot'] - pd.Timestamp(calendar_start)).dt.days // 7 + 1
+    
+    fig = px.bar(
+        df_posts.groupby(['Week', 'Platform']).size().reset_index(name='Posts'),
+        x='Week',
+        y='Posts',
+        color='Platform',
+        title=f"Scheduled Posts per Week ({len(df_posts)} slots from {90 // pillar_every + (90 % pillar_every > 0)} pillar assets)"
+    )
+    fig.update_layout(height=350)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    with st.expander("View full post calendar"):
+        st.dataframe(df_posts.drop(columns='Week'), use_container_width=True, hide_index=True)
+    
     st.markdown("---")
     
     # Batch Creation System
@@ -2166,6 +2705,8 @@ elif section == "Budget Scenarios":
     """, unsafe_allow_html=True)
     
     # Budget Scenario Tabs
+    df_scenarios = table_frame("Budget Scenarios", "comparison_data")
+    scenario_timelines = dict(zip(df_scenarios['Investment Tier'], df_scenarios['Timeline to 500']))
     budget_tabs = st.tabs(["Conservative Estimate", "Entry Investment", "Standard Investment", "Growth Investment"])
     
     # Conservative Estimate (formerly £0)
@@ -2191,7 +2732,7 @@ elif section == "Budget Scenarios":
             """)
         
         with col2:
-            st.markdown("""
+            st.markdown(f"""
             **90-Day Projections:**
             
             **Expected Growth Metrics:**
@@ -2202,7 +2743,7 @@ elif section == "Budget Scenarios":
             - Total Audience Reach: 280-500
             
             **Growth Velocity:**
-            - Timeline to 500 listeners: 6-12 months
+            - Timeline to 500 listeners: {scenario_timelines['Conservative Estimate']}
             - Requires consistent daily execution
             - Platform algorithm dependency high
             """)
@@ -2241,22 +2782,7 @@ elif section == "Budget Scenarios":
         st.subheader("Scenario B: Entry Investment (£50/Month)")
         
         # Budget Allocation
-        budget_data = {
-            'Channel': ['Instagram Promotion', 'Facebook Targeted Ads', 'Platform Tools', 'Monthly Total'],
-            'Allocation': ['£30', '£20', '£0', '£50'],
-            'Strategic Purpose': [
-                'Music video and Reel amplification',
-                'Gospel community targeting and group reach',
-                'Utilize free-tier scheduling and analytics tools',
-                'Baseline digital marketing investment'
-            ],
-            'Expected Monthly Impact': [
-                '20-30 followers | 10-15 listeners',
-                '10-15 followers | 5-10 listeners',
-                'Improved workflow efficiency',
-                '30-50 followers | 15-25 listeners'
-            ]
-        }
+        budget_data = TABLES["Budget Scenarios"]["budget_data"]
         
         df_budget50 = pd.DataFrame(budget_data)
         st.dataframe(df_budget50, use_container_width=True, hide_index=True)
@@ -2344,15 +2870,7 @@ elif section == "Budget Scenarios":
         st.markdown("---")
         
         # Detailed Channel Performance
-        results_data = {
-            'Marketing Channel': ['Instagram', 'TikTok', 'YouTube', 'Retargeting', 'Combined Total'],
-            'Budget': ['£30', '£30', '£30', '£10', '£100'],
-            'Projected Impressions': ['2,000-3,000', '5,000-10,000', '1,000-2,000', '500-1,000', '8,500-16,000'],
-            'Profile Visits': ['80-120', '150-250', '30-50', '20-30', '280-450'],
-            'New Followers': ['30-40', '40-60', '10-15', '5-10', '85-125'],
-            'New Listeners': ['15-20', '20-30', '5-10', '3-5', '43-65'],
-            'Cost Per Acquisition': ['£1.00-1.33', '£0.50-0.75', '£2.00-4.00', '£2.00-3.33', '£0.80-1.16']
-        }
+        results_data = TABLES["Budget Scenarios"]["results_data"]
         
         df_results100 = pd.DataFrame(results_data)
         st.dataframe(df_results100, use_container_width=True, hide_index=True)
@@ -2394,24 +2912,7 @@ elif section == "Budget Scenarios":
         """, unsafe_allow_html=True)
         
         # Comprehensive Budget Breakdown
-        monthly_allocation = {
-            'Investment Category': ['Paid Advertising', 'Content Production', 'Professional Tools', 'Playlist Promotion', 'Monthly Total'],
-            'Allocation': ['£120', '£50', '£20', '£10', '£200'],
-            'Strategic Application': [
-                'Multi-platform advertising campaigns (Instagram, TikTok, YouTube, Facebook)',
-                'Enhanced production quality, location fees, collaboration investments',
-                'Premium scheduling platforms, advanced analytics, content creation tools',
-                'SubmitHub campaigns, curator outreach, professional pitching services',
-                'Comprehensive growth infrastructure investment'
-            ],
-            'Expected Impact': [
-                'Primary audience acquisition driver',
-                'Improved content quality and engagement',
-                'Operational efficiency and data insights',
-                'Playlist placement opportunities',
-                'Integrated growth ecosystem'
-            ]
-        }
+        monthly_allocation = TABLES["Budget Scenarios"]["monthly_allocation"]
         
         df_monthly200 = pd.DataFrame(monthly_allocation)
         st.dataframe(df_monthly200, use_container_width=True, hide_index=True)
@@ -2497,24 +2998,57 @@ elif section == "Budget Scenarios":
     # Comprehensive Comparison
     st.subheader("📊 Investment Scenario Comparative Analysis")
     
-    comparison_data = {
-        'Investment Tier': ['Conservative Estimate', 'Entry Investment', 'Standard Investment', 'Growth Investment'],
-        '90-Day Investment': ['£0', '£150', '£300', '£600'],
-        'Projected Listeners': ['50-100', '45-75', '120-180', '250-375'],
-        'Projected Followers': ['100-200', '90-150', '240-345', '500-750'],
-        'Timeline to 500': ['6-12 months', '4-6 months', '3-4 months', '2-3 months'],
-        'Daily Time Required': ['90-120 min', '60-90 min', '60-90 min', '60-120 min'],
-        'Optimal Application': [
-            'Long-term community building',
-            'Emerging independent artists',
-            'Serious career development',
-            'Professional acceleration'
-        ]
+    df_comparison = table_frame("Budget Scenarios", "comparison_data")
+    # Same cached simulations the table's 'Timeline to 500' column came from
+    scenario_paths = {
+        tier: first_passage(*parse_range(projected))
+        for tier, projected in zip(df_comparison['Investment Tier'], df_comparison['Projected Listeners'])
     }
-    
-    df_comparison = pd.DataFrame(comparison_data)
     st.dataframe(df_comparison, use_container_width=True, hide_index=True)
     
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        fig = go.Figure()
+        scenario_colors = ['#6c757d', '#D4A574', '#8B4789', '#28a745']
+        goal_days = list(range(1, 731))
+        for (tier, paths), color in zip(scenario_paths.items(), scenario_colors):
+            fig.add_trace(go.Scatter(
+                x=goal_days,
+                y=hit_curve(paths['days']) * 100,
+                mode='lines',
+                name=tier,
+                line=dict(color=color, width=3)
+            ))
+        fig.add_vline(x=90, line_dash="dash", line_color="#dc3545", annotation_text="90-day assessment")
+        
+        fig.update_layout(
+            title="Chance of Reaching 500 Monthly Listeners by Day",
+            xaxis_title="Days from start",
+            yaxis_title="Paths at 500+ (%)",
+            height=400
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        st.markdown("**Day-90 Assessment Tier Probabilities:**")
+        df_tiers = pd.DataFrame({
+            tier: {label: f"{p * 100:.0f}%" for label, p in tier_probabilities(paths['assessment']).items()}
+            for tier, paths in scenario_paths.items()
+        }).T.rename_axis('Investment Tier').reset_index()
+        st.dataframe(df_tiers, use_container_width=True, hide_index=True)
+        st.caption("20,000 simulated growth paths per scenario, calibrated to each 90-day listener projection.")
+    
+    email_projection = get_artifact_store().latest("email_projection", ARTIST)
+    if email_projection is not None:
+        version, created_at, projection = email_projection
+        st.caption(
+            f"Email list after 3 months with all four lead magnets (precomputed v{version}): "
+            f"median {projection['list_size'][1][-1]:,.0f}, 80% range "
+            f"{projection['list_size'][0][-1]:,.0f}-{projection['list_size'][2][-1]:,.0f} subscribers"
+        )
+    
     st.markdown("""
     <div class="insight-box">
     <h4>💡 Strategic Recommendation</h4>
@@ -2908,21 +3442,87 @@ elif section == "Email Marketing":
     
     st.markdown("---")
     
+    # List Growth Simulator
+    st.subheader("📈 List Growth Simulator")
+    
+    @st.cache_data
+    def run_email_simulation(magnets, months, churn_pct, draws):
+        return simulate_list(list(magnets), months=months, draws=draws, churn=(churn_pct[0] / 100, churn_pct[1] / 100))
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        sim_magnets = st.multiselect("Active lead magnets", list(LEAD_MAGNETS), default=["7-Day Worship Challenge"])
+        sim_months = st.slider("Months to simulate", 1, 12, 3)
+    with col2:
+        sim_churn = st.slider("Monthly unsubscribe rate (%)", 0.0, 10.0, (1.0, 3.0), step=0.5)
+        sim_draws = st.select_slider("Parameter draws", [1000, 2000, 5000, 10000], value=5000)
+    
+    if sim_magnets:
+        sim = run_email_simulation(tuple(sim_magnets), sim_months, sim_churn, sim_draws)
+        sim_x = ['Start'] + [f'Month {m}' for m in range(1, sim_months + 1)]
+        
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=sim_x,
+            y=sim['list_size'][0],
+            mode='lines',
+            name='10th percentile',
+            line=dict(color='#D4A574', width=1)
+        ))
+        
+        fig.add_trace(go.Scatter(
+            x=sim_x,
+            y=sim['list_size'][2],
+            mode='lines',
+            name='90th percentile',
+            line=dict(color='#D4A574', width=1),
+            fill='tonexty',
+            fillcolor='rgba(212, 165, 116, 0.25)'
+        ))
+        
+        fig.add_trace(go.Scatter(
+            x=sim_x,
+            y=sim['list_size'][1],
+            mode='lines+markers',
+            name='Median list size',
+            line=dict(color='#8B4789', width=3)
+        ))
+        
+        fig.add_trace(go.Scatter(
+            x=['Start', 'Month 1', 'Month 2', 'Month 3'],
+            y=PRIMITIVES["email_subscriber_targets"],
+            mode='markers',
+            name='90-Day Targets',
+            marker=dict(color='#28a745', size=12, symbol='star')
+        ))
+        
+        fig.update_layout(
+            title=f"Projected Email List Size ({sim_draws:,} simulations)",
+            yaxis_title="Subscribers",
+            height=400,
+            hovermode='x unified'
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Final List Size (median)", f"{sim['list_size'][1][-1]:,.0f}",
+                      help=f"80% range: {sim['list_size'][0][-1]:,.0f}-{sim['list_size'][2][-1]:,.0f}")
+        with col2:
+            st.metric("Monthly Clicks (median)", f"{sim['monthly_clicks'][1][-1]:,.0f}",
+                      help=f"80% range: {sim['monthly_clicks'][0][-1]:,.0f}-{sim['monthly_clicks'][2][-1]:,.0f}")
+        with col3:
+            st.metric("Launch Email Streams (median)", f"{sim['launch_streams'][1][-1]:,.0f}",
+                      help=f"80% range: {sim['launch_streams'][0][-1]:,.0f}-{sim['launch_streams'][2][-1]:,.0f}")
+    
+    st.markdown("---")
+    
     # Implementation Timeline
     st.subheader("⏰ Email List Implementation Timeline")
     
-    timeline_data = {
-        'Week': ['Week 1', 'Week 2', 'Week 3', 'Week 4', 'Month 2', 'Month 3'],
-        'Action': [
-            'Set up Mailchimp, create lead magnet, add to Linktree',
-            'Promote in content, launch welcome sequence',
-            'First weekly newsletter, analyze open rates',
-            'Segment list (new vs engaged), optimize',
-            'Launch survey, collect testimonials',
-            '100+ subscribers, plan song launch sequence'
-        ],
-        'Target': ['10-20 subs', '20-30 subs', '30-40 subs', '40-50 subs', '50-70 subs', '70-100+ subs']
-    }
+    timeline_data = TABLES["Email Marketing"]["timeline_data"]
     
     df_email_timeline = pd.DataFrame(timeline_data)
     st.dataframe(df_email_timeline, use_container_width=True, hide_index=True)
@@ -2993,12 +3593,7 @@ elif section == "Quick Wins":
         
         # Content Calendar Template
         st.markdown("**Weekly Content Calendar Template:**")
-        calendar_data = {
-            'Day': ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'],
-            'Instagram': ['Reel: Worship moment', 'Reel: Behind scenes', 'Reel: Testimony', 'Reel: Scripture', 'Reel: Music video clip', 'Reel: Q&A', 'Story only'],
-            'TikTok': ['Trending sound', 'POV video', 'Duet challenge', 'Raw worship', 'Song snippet', 'Testimony', 'Rest day'],
-            'YouTube': ['Shorts: Piano clip', 'N/A', 'Shorts: Lyrics', 'N/A', 'Shorts: BTS', 'N/A', 'Potential main video']
-        }
+        calendar_data = TABLES["Quick Wins"]["calendar_data"]
         
         df_calendar = pd.DataFrame(calendar_data)
         st.dataframe(df_calendar, use_container_width=True, hide_index=True)
@@ -3412,16 +4007,41 @@ elif section == "Quick Wins":
     # Tools Checklist
     st.subheader("🛠️ Week 1 Tools Checklist")
     
-    tools_data = {
-        'Tool': ['Canva', 'CapCut', 'Mailchimp', 'Later/Buffer', 'Linktree', 'Spotify for Artists'],
-        'Purpose': ['Graphics/design', 'Video editing', 'Email marketing', 'Scheduling', 'Link management', 'Analytics'],
-        'Status': ['Free account created', 'App downloaded', 'Account set up', 'Free account created', 'Optimized', 'Claimed profile'],
-        'Time': ['30 min', '15 min', '20 min', '15 min', '10 min', '15 min']
-    }
+    tools_data = TABLES["Quick Wins"]["tools_data"]
     
     df_tools = pd.DataFrame(tools_data)
     st.dataframe(df_tools, use_container_width=True, hide_index=True)
     
+    st.markdown("---")
+    
+    # Week 1 progress tracker, persisted per artist
+    st.subheader("✅ Week 1 Progress Tracker")
+    
+    progress_store = get_progress_store()
+    quick_win_days = {}
+    for task_id, (task_name, task_minutes, task_day, _) in PLAN_TASKS.items():
+        if task_day <= 7:
+            quick_win_days.setdefault(f"Quick Wins: Day {task_day}", []).append((task_id, task_name, task_minutes))
+    
+    progress_bars = {}
+    progress_cols = st.columns(len(quick_win_days))
+    for col, (checklist, day_tasks) in zip(progress_cols, quick_win_days.items()):
+        progress_store.register(ARTIST, checklist, [task_id for task_id, _, _ in day_tasks])
+        with col:
+            done_state = progress_store.state(ARTIST, checklist)
+            st.markdown(f"**{checklist.split(': ')[1]}**")
+            for task_id, task_name, task_minutes in day_tasks:
+                key = f"{checklist}:{task_id}"
+                st.checkbox(f"{task_name} ({task_minutes} min)", value=done_state.get(task_id, False), key=key,
+                            on_change=record_tick, args=(checklist, task_id, key))
+            progress_bars[checklist] = st.empty()
+    
+    # completion() includes ticks still waiting for their batch to be written
+    completion = progress_store.completion(ARTIST)
+    for checklist, bar in progress_bars.items():
+        tasks_done, tasks_total = completion[checklist]
+        bar.progress(tasks_done / tasks_total, text=f"{tasks_done}/{tasks_total}")
+    
     st.markdown("""
     <div class="success-box">
     <h4>🎉 Week 1 Transformation Complete!</h4>
@@ -4121,44 +4741,7 @@ elif section == "Age to Age Campaign":
         """, unsafe_allow_html=True)
         
         # Hour-by-hour breakdown chart
-        hourly_data = {
-            'Time Block': [
-                '12:00 AM - 6:00 AM',
-                '6:00 AM - 9:00 AM',
-                '9:00 AM - 12:00 PM',
-                '12:00 PM - 3:00 PM',
-                '3:00 PM - 6:00 PM',
-                '6:00 PM - 9:00 PM',
-                '9:00 PM - 12:00 AM'
-            ],
-            'Key Actions': [
-                'Launch on all platforms, email blast, Stories blitz',
-                'Morning engagement, respond to comments, TikTok post',
-                'Instagram Reel, community engagement, track metrics',
-                'Facebook Live performance, email update, playlist pitching',
-                'User-generated content sharing, continued engagement',
-                'Evening push, milestone celebration, final content push',
-                'Final countdown to 24hrs, thank supporters, prep Week 1'
-            ],
-            'Target Streams': [
-                '50-100',
-                '100-150',
-                '150-250',
-                '250-350',
-                '350-450',
-                '450-550',
-                '500-600'
-            ],
-            'Priority': [
-                'Critical',
-                'High',
-                'High',
-                'High',
-                'Medium',
-                'Medium',
-                'High'
-            ]
-        }
+        hourly_data = TABLES["Age to Age Campaign"]["hourly_data"]
         
         df_hourly = pd.DataFrame(hourly_data)
         st.dataframe(df_hourly, use_container_width=True, hide_index=True)
@@ -4167,8 +4750,8 @@ elif section == "Age to Age Campaign":
         
         # Stream Growth Visualization
         hours = list(range(0, 25, 3))
-        min_streams = [0, 50, 150, 300, 450, 550, 650, 750, 850]
-        max_streams = [0, 100, 250, 450, 650, 850, 1050, 1250, 1500]
+        min_streams = cumulative_series(PRIMITIVES["launch_conservative_3h"])
+        max_streams = cumulative_series(PRIMITIVES["launch_optimistic_3h"])
         target_line = [500] * len(hours)
         
         fig = go.Figure()
@@ -4208,7 +4791,120 @@ elif section == "Age to Age Campaign":
             hovermode='x unified'
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        # Live tracker: polls a feed and redraws the projection with the actuals on top
+        st.markdown("**📡 Live Launch Day Tracker**")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            tracker_source = st.radio("Event Source", ["Simulated feed", "Event file"], key="tracker_source")
+        with col2:
+            tracker_path = st.text_input("Event file (timestamp,count per line)", "launch_events.csv", key="tracker_path")
+        with col3:
+            tracker_live = st.toggle("Live polling", key="tracker_live")
+            if st.button("Reset tracker"):
+                st.session_state.pop("launch_tracker", None)
+        
+        tracker_key = (tracker_source, tracker_path)
+        if st.session_state.get("launch_tracker", {}).get("key") != tracker_key:
+            st.session_state["launch_tracker"] = {
+                "key": tracker_key,
+                # Midnight UK time on 18 January is midnight UTC, the buffer's clock
+                "buffer": HourlyRingBuffer(launch_date, hours=24),
+                "source": SimulatedStreamSource(launch_date) if tracker_source == "Simulated feed" else EventFileTail(tracker_path)
+            }
+        
+        @st.fragment(run_every=5 if tracker_live else None)
+        def launch_tracker_chart():
+            tracker = st.session_state["launch_tracker"]
+            tracker["buffer"].extend(tracker["source"].poll())
+            actual_hours, actual_streams = tracker["buffer"].cumulative()
+            
+            live_fig = go.Figure(fig)
+            live_fig.add_trace(go.Scatter(
+                x=[0] + actual_hours.tolist(),
+                y=[0] + actual_streams.tolist(),
+                mode='lines+markers',
+                name='Actual Streams',
+                line=dict(color='#dc3545', width=3)
+            ))
+            live_fig.update_layout(title="Launch Day Actuals vs. Projection")
+            st.plotly_chart(live_fig, use_container_width=True)
+            st.metric("Streams So Far", f"{int(actual_streams[-1]) if len(actual_streams) else 0:,}")
+            if tracker["buffer"].late or tracker["buffer"].before_start:
+                st.caption(
+                    f"{tracker['buffer'].late:,} late streams counted in the total but not in an hourly bucket; "
+                    f"{tracker['buffer'].before_start:,} timestamped before launch ignored"
+                )
+        
+        launch_tracker_chart()
+        
+        st.markdown("---")
+        
+        st.markdown("**🔗 Measured Stream Attribution**")
+        
+        if "attribution_engine" not in st.session_state:
+            st.session_state["attribution_engine"] = AttributionEngine()
+            st.session_state["attribution_files"] = set()
+        attribution_engine = st.session_state["attribution_engine"]
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            clicks_upload = st.file_uploader("Link clicks (CSV: timestamp, visitor_id, channel)", type="csv", key="clicks_upload")
+        with col2:
+            conversions_upload = st.file_uploader("Streams (CSV: timestamp, visitor_id, streams)", type="csv", key="conversions_upload")
+        new_clicks, st.session_state["attribution_click_id"] = get_link_store().clicks_after(
+            st.session_state.get("attribution_click_id", 0)
+        )
+        if new_clicks:
+            attribution_engine.add_touchpoints(pd.DataFrame({
+                'timestamp': pd.to_datetime([c[0] for c in new_clicks], unit='s'),
+                'visitor': [c[1] for c in new_clicks],
+                'channel': [c[2] for c in new_clicks]
+            }))
+        for upload, reader, add in (
+            (clicks_upload, read_touchpoints, attribution_engine.add_touchpoints),
+            (conversions_upload, read_conversions, attribution_engine.add_conversions)
+        ):
+            if upload is None:
+                continue
+            # Keyed on content, so a re-upload under a new file id isn't counted twice
+            digest = file_digest(upload.getvalue())
+            if digest not in st.session_state["attribution_files"]:
+                try:
+                    add(reader(upload))
+                except KeyError as e:
+                    st.error(f"{upload.name} is missing column {e}")
+                except ValueError as e:
+                    st.error(f"Couldn't read {upload.name}: {e}")
+                st.session_state["attribution_files"].add(digest)
+        
+        if attribution_engine:
+            df_attribution = attribution_engine.compare().round(0)
+            
+            fig = go.Figure()
+            model_colors = {'last_touch': '#D4A574', 'linear': '#8B4789', 'time_decay': '#28a745'}
+            for model in ATTRIBUTION_MODELS:
+                fig.add_trace(go.Bar(
+                    name=model.replace('_', ' ').title(),
+                    x=df_attribution.index,
+                    y=df_attribution[model],
+                    marker_color=model_colors[model]
+                ))
+            
+            fig.update_layout(
+                title="Streams Credited per Channel by Attribution Model",
+                barmode='group',
+                yaxis_title="Streams",
+                height=400
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+            st.dataframe(
+                df_attribution.rename(columns=lambda m: m.replace('_', ' ').title()).rename_axis('Channel').reset_index(),
+                use_container_width=True,
+                hide_index=True
+            )
+            st.caption("Budget assumptions: Instagram Reels Boost 200-300 and TikTok Promote 100-200 Day 1 streams.")
         
         st.markdown("""
         <div class="insight-box">
@@ -4237,33 +4933,7 @@ elif section == "Age to Age Campaign":
         """, unsafe_allow_html=True)
         
         # Day-by-day Week 1 plan
-        week1_data = {
-            'Day': ['Day 2 (Jan 19)', 'Day 3 (Jan 20)', 'Day 4 (Jan 21)', 'Day 5 (Jan 22)', 'Day 6 (Jan 23)', 'Day 7 (Jan 24)'],
-            'Content Focus': [
-                'Thank you + behind-the-scenes',
-                'User testimonies + lyric focus',
-                'Collaboration announcements',
-                'Playlist update + milestone celebration',
-                'Acoustic/alternate version',
-                'Week 1 recap + Week 2 preview'
-            ],
-            'Platform Priority': [
-                'Instagram Stories + Email',
-                'TikTok + Instagram Reels',
-                'All platforms',
-                'Email + Twitter',
-                'YouTube + Instagram',
-                'All platforms recap'
-            ],
-            'Stream Target': [
-                '200-300',
-                '150-250',
-                '150-200',
-                '100-150',
-                '100-150',
-                '150-200'
-            ]
-        }
+        week1_data = TABLES["Age to Age Campaign"]["week1_data"]
         
         df_week1 = pd.DataFrame(week1_data)
         st.dataframe(df_week1, use_container_width=True, hide_index=True)
@@ -4331,8 +5001,8 @@ elif section == "Age to Age Campaign":
         
         # Week 1 projection chart
         days = ['Launch', 'Day 2', 'Day 3', 'Day 4', 'Day 5', 'Day 6', 'Day 7']
-        daily_streams = [600, 250, 200, 175, 125, 125, 175]
-        cumulative = [600, 850, 1050, 1225, 1350, 1475, 1650]
+        daily_streams = PRIMITIVES["week1_daily_streams"]
+        cumulative = cumulative_series(daily_streams)
         
         fig = go.Figure()
         
@@ -4369,6 +5039,83 @@ elif section == "Age to Age Campaign":
         )
         
         st.plotly_chart(fig, use_container_width=True)
+        
+        # Decay-curve forecast fitted to actuals as they arrive
+        st.markdown("**🔮 Day 2-30 Forecast from Actuals:**")
+        
+        stream_forecast = get_artifact_store().latest("stream_forecast", ARTIST)
+        if stream_forecast is not None:
+            st.caption(
+                f"Loaded-data forecast (precomputed v{stream_forecast[0]}): "
+                f"{stream_forecast[2]['forecast'].sum():,.0f} streams over the next 30 days"
+            )
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            actuals_text = st.text_input("Daily streams so far (Day 1, Day 2, ...)", "600", key="forecast_actuals")
+        with col2:
+            playlist_days = st.multiselect("Playlist adds landed on day", list(range(2, 31)), key="forecast_bumps")
+        
+        try:
+            stream_actuals = tuple(float(v) for v in actuals_text.replace(" ", "").split(",") if v)
+        except ValueError:
+            stream_actuals = ()
+            st.warning("Enter daily streams as comma-separated numbers.")
+        
+        if stream_actuals:
+            projection = forecast_release("Age to Age", stream_actuals, tuple(sorted(playlist_days)))
+            
+            fig = go.Figure()
+            
+            fig.add_trace(go.Scatter(
+                x=projection['days'],
+                y=projection['lower'],
+                mode='lines',
+                name='Lower (95%)',
+                line=dict(color='#D4A574', width=1)
+            ))
+            
+            fig.add_trace(go.Scatter(
+                x=projection['days'],
+                y=projection['upper'],
+                mode='lines',
+                name='Upper (95%)',
+                line=dict(color='#D4A574', width=1),
+                fill='tonexty',
+                fillcolor='rgba(212, 165, 116, 0.25)'
+            ))
+            
+            fig.add_trace(go.Scatter(
+                x=projection['days'],
+                y=projection['forecast'],
+                mode='lines',
+                name=f"Forecast ({projection['model']})",
+                line=dict(color='#8B4789', width=3)
+            ))
+            
+            fig.add_trace(go.Scatter(
+                x=list(range(1, len(stream_actuals) + 1)),
+                y=stream_actuals,
+                mode='markers',
+                name='Actual Streams',
+                marker=dict(color='#dc3545', size=10)
+            ))
+            
+            fig.update_layout(
+                title="30-Day Stream Forecast",
+                xaxis_title="Day Since Launch",
+                yaxis_title="Daily Streams",
+                height=400,
+                hovermode='x unified'
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Projected 30-Day Total", f"{projection['forecast'].sum():,.0f}")
+            with col2:
+                st.metric("Projected Day 30 Streams", f"{projection['forecast'][-1]:,.0f}")
     
     # Content Calendar
     with campaign_tabs[3]:
@@ -4382,33 +5129,7 @@ elif section == "Age to Age Campaign":
         """, unsafe_allow_html=True)
         
         # 30-day content calendar
-        calendar_data = {
-            'Week': ['Week 1 (Jan 18-24)', 'Week 2 (Jan 25-31)', 'Week 3 (Feb 1-7)', 'Week 4 (Feb 8-14)'],
-            'Instagram': [
-                '7 Reels (launch, BTS, lyrics, testimonies), 40+ Stories',
-                '7 Reels (acoustic, cover challenge, fan reactions), 30+ Stories',
-                '7 Reels (worship moments, Scripture connections), 30+ Stories',
-                '5 Reels (milestone celebration, looking ahead), 20+ Stories'
-            ],
-            'TikTok': [
-                '10-14 videos (launch, reactions, duets, trending sounds)',
-                '7-10 videos (challenges, POVs, worship moments)',
-                '7-10 videos (user-generated content, collaborations)',
-                '5-7 videos (recap, thank you, next chapter tease)'
-            ],
-            'Email': [
-                '3 emails (launch, Day 3 update, Week 1 thank you)',
-                '2 emails (exclusive content, playlist update)',
-                '1-2 emails (testimony collection, milestone)',
-                '1 email (30-day reflection, what\'s next)'
-            ],
-            'YouTube': [
-                '1 main video (music video or lyric video), 5-7 Shorts',
-                '3-5 Shorts (repurposed TikTok content)',
-                '1 video (acoustic/BTS), 3-5 Shorts',
-                '3-5 Shorts, plan next main video'
-            ]
-        }
+        calendar_data = TABLES["Age to Age Campaign"]["calendar_data"]
         
         df_calendar = pd.DataFrame(calendar_data)
         st.dataframe(df_calendar, use_container_width=True, hide_index=True)
@@ -4473,15 +5194,7 @@ elif section == "Age to Age Campaign":
         st.subheader("💰 Campaign Budget Allocation")
         
         # Budget scenario comparison
-        budget_scenarios = {
-            'Investment Level': ['Conservative (Organic)', 'Entry (£100)', 'Standard (£200)', 'Growth (£400)'],
-            'Pre-Launch': ['£0', '£30', '£60', '£120'],
-            'Launch Day': ['£0', '£30', '£60', '£120'],
-            'Week 1': ['£0', '£40', '£80', '£160'],
-            'Total': ['£0', '£100', '£200', '£400'],
-            'Expected Day 1 Streams': ['300-500', '500-800', '800-1,200', '1,200-2,000'],
-            'Expected Week 1 Total': ['1,000-1,500', '1,500-2,500', '2,500-4,000', '4,000-6,000']
-        }
+        budget_scenarios = TABLES["Age to Age Campaign"]["budget_scenarios"]
         
         df_budget_scenarios = pd.DataFrame(budget_scenarios)
         st.dataframe(df_budget_scenarios, use_container_width=True, hide_index=True)
@@ -4491,41 +5204,7 @@ elif section == "Age to Age Campaign":
         # Recommended £100 budget breakdown
         st.markdown("**Recommended Budget Breakdown (£100 Total):**")
         
-        detailed_budget = {
-            'Phase': [
-                'Pre-Launch (£30)',
-                'Pre-Launch (£30)',
-                'Launch Day (£30)',
-                'Launch Day (£30)',
-                'Week 1 (£40)',
-                'Week 1 (£40)'
-            ],
-            'Channel': [
-                'Instagram Story Ads',
-                'Facebook Group Targeting',
-                'Instagram Reels Boost',
-                'TikTok Promote',
-                'Retargeting Campaigns',
-                'Playlist Pitching (SubmitHub)'
-            ],
-            'Budget': ['£20', '£10', '£20', '£10', '£30', '£10'],
-            'Goal': [
-                '30-50 pre-saves',
-                '20-30 email signups',
-                '200-300 Day 1 streams',
-                '100-200 Day 1 streams',
-                'Sustained Week 1 momentum',
-                '2-3 playlist placements'
-            ],
-            'Timing': [
-                'Jan 15-17 (3 days)',
-                'Jan 15-17 (3 days)',
-                'Jan 18 only',
-                'Jan 18-19',
-                'Jan 19-24',
-                'Jan 18-24'
-            ]
-        }
+        detailed_budget = TABLES["Age to Age Campaign"]["detailed_budget"]
         
         df_detailed = pd.DataFrame(detailed_budget)
         st.dataframe(df_detailed, use_container_width=True, hide_index=True)
@@ -4549,6 +5228,82 @@ elif section == "Age to Age Campaign":
         </ul>
         </div>
         """, unsafe_allow_html=True)
+        
+        platform_streams = TABLES["Streaming Performance"]["platforms"]
+        royalty_engine = get_royalty_engine()
+        per_stream = blended_rate(
+            dict(zip(platform_streams['Platform'], platform_streams['Est. Monthly Streams'])),
+            royalty_engine.country_mix(),
+            royalty_engine.rates
+        )
+        st.caption(
+            f"Royalty estimate at a blended £{per_stream:.4f}/stream "
+            f"({'measured' if royalty_engine else 'assumed'} listener geography): "
+            f"1,500-2,500 streams ≈ £{1500 * per_stream:,.2f}-{2500 * per_stream:,.2f}"
+        )
+        
+        st.markdown("**Which Day 1 Assumptions Matter Most:**")
+        fig = tornado_figure("day1_streams", "Day 1 Streams Sensitivity", "Day 1 streams", height=450)
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        st.markdown("---")
+        
+        # Playlist pitching queue for the SubmitHub line of the budget
+        st.markdown("**Playlist Pitching Queue:**")
+        
+        curator_store = get_curator_store()
+        curator_upload = st.file_uploader(
+            "Curator playlists (CSV: curator, playlist, genres, followers, fee)",
+            type="csv",
+            key="curator_upload"
+        )
+        if curator_upload is not None and st.session_state.get("curator_file") != curator_upload.file_id:
+            curator_store.ingest_playlists(read_curator_rows(io.TextIOWrapper(curator_upload, encoding="utf-8")))
+            st.session_state["curator_file"] = curator_upload.file_id
+        
+        curator_genres = curator_store.genres()
+        if curator_genres:
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                pitch_genres = st.multiselect(
+                    "Genres", curator_genres,
+                    default=[g for g in curator_genres if g in ("gospel", "worship", "christian")] or curator_genres[:1]
+                )
+            with col2:
+                pitch_count = st.number_input("Pitches", 1, 100, 20)
+            
+            pitch_queue = curator_store.queue("Age to Age", pitch_genres, limit=pitch_count)
+            df_queue = pd.DataFrame(pitch_queue, columns=[
+                'ID', 'Curator', 'Playlist', 'Followers', 'Fee (£)', 'Acceptance', 'Expected Streams', 'Streams per £'
+            ])
+            df_queue['Acceptance'] = (df_queue['Acceptance'] * 100).round(0).astype(int).astype(str) + '%'
+            df_queue['Expected Streams'] = df_queue['Expected Streams'].round(0)
+            df_queue['Streams per £'] = df_queue['Streams per £'].round(1)
+            st.dataframe(df_queue.drop(columns='ID'), use_container_width=True, hide_index=True)
+            st.caption(f"Queue cost: £{df_queue['Fee (£)'].sum():,.2f} | Expected streams: {df_queue['Expected Streams'].sum():,.0f}")
+            
+            if st.button("Mark queue as pitched", disabled=df_queue.empty):
+                curator_store.record_pitches("Age to Age", df_queue['ID'].tolist())
+                st.rerun()
+            
+            pending_pitches = curator_store.pending("Age to Age")
+            if pending_pitches:
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    pitch = st.selectbox(
+                        "Record a curator response",
+                        pending_pitches,
+                        format_func=lambda p: f"{p[1]} - {p[2]}"
+                    )
+                with col2:
+                    pitch_outcome = st.radio("Outcome", ["Accepted", "Declined"], horizontal=True)
+                if st.button("Save response"):
+                    curator_store.record_response(pitch[0], pitch_outcome == "Accepted")
+                    st.rerun()
+            
+            pitch_results = curator_store.results("Age to Age")
+            st.caption(" | ".join(f"{status.title()}: {count}" for status, count in sorted(pitch_results.items())))
     
     # Success Metrics
     with campaign_tabs[5]:
@@ -4564,44 +5319,7 @@ elif section == "Age to Age Campaign":
         st.markdown("---")
         
         # Tiered success framework
-        success_tiers = {
-            'Metric': [
-                'Day 1 Streams',
-                'Day 1 Saves',
-                'Week 1 Total Streams',
-                'Playlist Placements (Week 1)',
-                'Email List Growth',
-                'Social Media Engagement',
-                'Pre-Saves Secured'
-            ],
-            'Minimum Success': [
-                '300-500',
-                '50-100',
-                '1,000-1,500',
-                '1-2',
-                '30-50',
-                '100-200 interactions',
-                '30-50'
-            ],
-            'Target Success': [
-                '500-800',
-                '100-150',
-                '1,500-2,500',
-                '3-5',
-                '50-100',
-                '200-400 interactions',
-                '50-80'
-            ],
-            'Exceptional Success': [
-                '800+',
-                '150+',
-                '2,500+',
-                '5+',
-                '100+',
-                '400+ interactions',
-                '80+'
-            ]
-        }
+        success_tiers = TABLES["Age to Age Campaign"]["success_tiers"]
         
         df_success = pd.DataFrame(success_tiers)
         st.dataframe(df_success, use_container_width=True, hide_index=True)
@@ -4836,29 +5554,46 @@ elif section == "Age to Age Campaign":
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        **Immediate Actions (Next 24 Hours):**
-        
-        ✅ **Set Up Infrastructure:**
-        - [ ] Update Linktree with pre-save link
-        - [ ] Create email list opt-in (Mailchimp)
-        - [ ] Design lead magnet PDF
-        - [ ] Prepare all countdown content
-        - [ ] Schedule Day -3 posts
-        
-        ✅ **Content Preparation:**
-        - [ ] Design campaign graphics (Canva)
-        - [ ] Edit 10+ TikTok videos
-        - [ ] Create 7+ Instagram Reels
-        - [ ] Write all email copy
-        - [ ] Prepare launch day content
-        
-        ✅ **Community Outreach:**
-        - [ ] DM 20 gospel artists for support
-        - [ ] Post in 5 Facebook groups
-        - [ ] Engage with gospel community
-        - [ ] Build anticipation
-        """)
+        st.markdown("**Immediate Actions (Next 24 Hours):**")
+        
+        immediate_actions = {
+            'Set Up Infrastructure': [
+                'Update Linktree with pre-save link',
+                'Create email list opt-in (Mailchimp)',
+                'Design lead magnet PDF',
+                'Prepare all countdown content',
+                'Schedule Day -3 posts'
+            ],
+            'Content Preparation': [
+                'Design campaign graphics (Canva)',
+                'Edit 10+ TikTok videos',
+                'Create 7+ Instagram Reels',
+                'Write all email copy',
+                'Prepare launch day content'
+            ],
+            'Community Outreach': [
+                'DM 20 gospel artists for support',
+                'Post in 5 Facebook groups',
+                'Engage with gospel community',
+                'Build anticipation'
+            ]
+        }
+        
+        progress_store = get_progress_store()
+        for group, actions in immediate_actions.items():
+            checklist = f"Age to Age: {group}"
+            progress_store.register(ARTIST, checklist, actions)
+            done_state = progress_store.state(ARTIST, checklist)
+            st.markdown(f"✅ **{group}:**")
+            for action in actions:
+                key = f"{checklist}:{action}"
+                st.checkbox(action, value=done_state.get(action, False), key=key,
+                            on_change=record_tick, args=(checklist, action, key))
+        
+        completion = progress_store.completion(ARTIST)
+        actions_done = sum(completion[f"Age to Age: {g}"][0] for g in immediate_actions)
+        actions_total = sum(completion[f"Age to Age: {g}"][1] for g in immediate_actions)
+        st.progress(actions_done / actions_total, text=f"{actions_done}/{actions_total} immediate actions complete")
     
     with col2:
         st.markdown("""
@@ -0,0 +1,167 @@
+# Multi-touch attribution of streams to the channels that drove them. Clicks
+# (smart-link / UTM touchpoints) and conversions are kept as sorted arrays
+# keyed by (visitor, time), so each conversion's touchpoints are found with
+# two binary searches and every model is a vectorised pass over the matches.
+import numpy as np
+import pandas as pd
+
+MODELS = ("last_touch", "linear", "time_decay")
+DIRECT = "(direct)"
+
+# Visitor code in the high bits, seconds since the first event in the low bits
+_TIME_BITS = 40
+
+
+def _utc(values):
+    """Parse timestamps to naive UTC; naive inputs are taken as UTC, offsets are honoured."""
+    return pd.to_datetime(values, errors='coerce', utc=True).dt.tz_convert(None)
+
+
+def read_touchpoints(fileobj):
+    """Read click events from `timestamp,visitor_id,channel` CSV text.
+
+    A `utm_source` column is accepted in place of `channel`.
+    """
+    raw = pd.read_csv(fileobj)
+    channel = raw['channel'] if 'channel' in raw else raw['utm_source']
+    frame = pd.DataFrame({
+        'timestamp': _utc(raw['timestamp']),
+        'visitor': raw['visitor_id'].astype(str),
+        'channel': channel.astype(str),
+    })
+    return frame.dropna(subset=['timestamp'])
+
+
+def read_conversions(fileobj):
+    """Read stream conversions from `timestamp,visitor_id,streams` CSV text."""
+    raw = pd.read_csv(fileobj)
+    frame = pd.DataFrame({
+        'timestamp': _utc(raw['timestamp']),
+        'visitor': raw['visitor_id'].astype(str),
+        'value': pd.to_numeric(raw['streams'], errors='coerce'),
+    })
+    return frame.dropna(subset=['timestamp', 'value'])
+
+
+class AttributionEngine:
+    """Touchpoints and conversions appended in batches; models computed on demand.
+
+    A conversion is credited to its visitor's touchpoints within `lookback`
+    before it. Conversions with no touchpoint are credited to '(direct)'.
+    Results are cached per model until the next batch lands.
+    """
+
+    def __init__(self, lookback=pd.Timedelta(days=7), half_life=pd.Timedelta(hours=24)):
+        self.lookback = lookback
+        self.half_life = half_life
+        self.touch_chunks = []
+        self.conversion_chunks = []
+        self.version = 0
+        self.cache = {}
+
+    def add_touchpoints(self, frame):
+        self.touch_chunks.append(frame[['timestamp', 'visitor', 'channel']])
+        self._changed()
+
+    def add_conversions(self, frame):
+        self.conversion_chunks.append(frame[['timestamp', 'visitor', 'value']])
+        self._changed()
+
+    def _changed(self):
+        self.version += 1
+        self.cache = {}
+
+    def __bool__(self):
+        return bool(self.conversion_chunks)
+
+    def _arrays(self):
+        if "arrays" in self.cache:
+            return self.cache["arrays"]
+        touches = pd.concat(self.touch_chunks, ignore_index=True) if self.touch_chunks else \
+            pd.DataFrame({'timestamp': pd.Series(dtype='datetime64[ns]'), 'visitor': [], 'channel': []})
+        conversions = pd.concat(self.conversion_chunks, ignore_index=True)
+        # One visitor coding shared by both sides of the join
+        visitors, _ = pd.factorize(pd.concat([touches['visitor'], conversions['visitor']], ignore_index=True))
+        touch_visitor, conv_visitor = visitors[:len(touches)], visitors[len(touches):]
+        channel_codes, channels = pd.factorize(touches['channel'])
+        origin = conversions['timestamp'].min()
+        if len(touches):
+            origin = min(origin, touches['timestamp'].min())
+        touch_ts = ((touches['timestamp'] - origin).dt.total_seconds()).to_numpy(dtype=np.int64)
+        conv_ts = ((conversions['timestamp'] - origin).dt.total_seconds()).to_numpy(dtype=np.int64)
+
+        keys = (touch_visitor.astype(np.int64) << _TIME_BITS) | touch_ts
+        order = np.argsort(keys, kind="stable")
+        arrays = {
+            "keys": keys[order],
+            "touch_ts": touch_ts[order],
+            "touch_channel": channel_codes[order],
+            "channels": list(channels),
+            "conv_visitor": conv_visitor.astype(np.int64),
+            "conv_ts": conv_ts,
+            "conv_value": conversions['value'].to_numpy(dtype=np.float64),
+            "conv_day": conversions['timestamp'].dt.normalize().to_numpy(),
+        }
+        self.cache["arrays"] = arrays
+        return arrays
+
+    def _matches(self):
+        """(conversion index, touch index) for every touchpoint inside a lookback window."""
+        if "matches" in self.cache:
+            return self.cache["matches"]
+        a = self._arrays()
+        base = a["conv_visitor"] << _TIME_BITS
+        window = int(self.lookback.total_seconds())
+        hi = np.searchsorted(a["keys"], base | a["conv_ts"], side="right")
+        lo = np.searchsorted(a["keys"], base | np.maximum(a["conv_ts"] - window, 0), side="left")
+        counts = hi - lo
+        conv_idx = np.repeat(np.arange(len(counts)), counts)
+        # Position of each match within its conversion's run of touchpoints
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        touch_idx = np.repeat(lo, counts) + offsets
+        self.cache["matches"] = (conv_idx, touch_idx, counts, hi)
+        return self.cache["matches"]
+
+    def _weights(self, model):
+        """Credit share of each match; shares for one conversion sum to 1."""
+        a = self._arrays()
+        conv_idx, touch_idx, counts, hi = self._matches()
+        if model == "last_touch":
+            return (touch_idx == hi[conv_idx] - 1).astype(np.float64)
+        if model == "linear":
+            return 1.0 / counts[conv_idx]
+        if model == "time_decay":
+            age = a["conv_ts"][conv_idx] - a["touch_ts"][touch_idx]
+            raw = np.exp2(-age / self.half_life.total_seconds())
+            totals = np.bincount(conv_idx, weights=raw, minlength=len(counts))
+            return raw / totals[conv_idx]
+        raise ValueError(f"unknown attribution model: {model}")
+
+    def attribute(self, model="time_decay"):
+        """Conversion value credited to each channel (plus '(direct)')."""
+        key = ("attribute", model)
+        if key not in self.cache:
+            a = self._arrays()
+            conv_idx, touch_idx, counts, _ = self._matches()
+            credit = a["conv_value"][conv_idx] * self._weights(model)
+            by_channel = np.bincount(a["touch_channel"][touch_idx], weights=credit, minlength=len(a["channels"]))
+            result = pd.Series(by_channel, index=a["channels"], dtype=np.float64)
+            result[DIRECT] = a["conv_value"][counts == 0].sum()
+            self.cache[key] = result
+        return self.cache[key]
+
+    def compare(self):
+        """Channel x model table of attributed conversions."""
+        return pd.DataFrame({model: self.attribute(model) for model in MODELS}).fillna(0)
+
+    def attribute_daily(self, model="time_decay"):
+        """Credited value per (day, channel), by conversion day."""
+        a = self._arrays()
+        conv_idx, touch_idx, counts, _ = self._matches()
+        credited = pd.DataFrame({
+            'day': a["conv_day"][conv_idx],
+            'channel': np.asarray(a["channels"], dtype=object)[a["touch_channel"][touch_idx]],
+            'value': a["conv_value"][conv_idx] * self._weights(model),
+        })
+        direct = pd.DataFrame({'day': a["conv_day"][counts == 0], 'channel': DIRECT, 'value': a["conv_value"][counts == 0]})
+        return pd.concat([credited, direct], ignore_index=True).groupby(['day', 'channel'], as_index=False)['value'].sum()
@@ -0,0 +1,462 @@
+# Every table the audit renders with st.dataframe, keyed by artist and then by
+# sidebar section so exports and batch jobs can reach them without running the
+# Streamlit script. app.py reads its tables from here.
+import pandas as pd
+
+from peers import gap_labels
+from time_to_goal import first_passage, parse_range, timeline_label
+
+ARTIST = "JohnGreat"
+
+ARTIST_TABLES = {
+    ARTIST: {
+        "Executive Summary": {
+            "benchmark_data": {
+                'Metric': ['Spotify Monthly Listeners', 'Instagram Followers', 'Email Subscribers', 'Playlist Placements'],
+                'JohnGreat (Current)': [2, 33, 0, 0],
+                'Industry Minimum': [500, 500, 100, 5]
+            },
+        },
+        "Streaming Performance": {
+            "platforms": {
+                'Platform': ['Spotify', 'Apple Music', 'YouTube Music', 'TIDAL', 'Amazon Music', 'Deezer'],
+                'Status': ['✅ Active', '✅ Active', '✅ Active', '✅ Active', '✅ Likely', '✅ Likely'],
+                'Est. Monthly Streams': [90, 50, 30, 10, 15, 5],
+                'Note': ['2 listeners', 'Unknown metrics', 'Unknown', 'Unknown', 'Unknown', 'Unknown']
+            },
+        },
+        "Social Media Audit": {
+            "historical_data": {
+                'Metric': ['Views', 'Profile Visits', 'Link Taps', 'Saves'],
+                'Value': [1662, 88, 1, 2],
+                'Trend': ['-57.7%', '-43.2%', '0.06% conv', 'Low utility']
+            },
+            "best_posts": {
+                'Post': ['Staircase/outdoor piano', 'Music video teaser', 'Spotify player graphic'],
+                'Engagement': ['100 likes, 1 comment', '1,887 views (Reel)', '263 views (Reel)']
+            },
+            "facebook_posts": {
+                'Post': ['Song announcement', 'Reel teaser', 'Made Up My Mind video'],
+                'Engagement': ['0 reactions, 0 comments', '0 reactions, 0 comments', '2 comments']
+            },
+            "tweet_performance": {
+                'Tweet': ['Birthday + song announcement', 'Music video promo', 'Scripture + promo'],
+                'Views': [14, 4, 2],
+                'Engagement': ['0 likes, 0 retweets', '0 likes, 0 retweets', '0 likes, 0 retweets']
+            },
+            "strategy_matrix": {
+                'Platform': ['YouTube', 'Instagram', 'TikTok', 'Facebook', 'Twitter/X'],
+                'Priority': ['Medium', 'High', 'High', 'Low', 'Medium'],
+                'Time/Day': ['20 min', '30 min', '20 min', '10 min', '10 min'],
+                'Focus': ['Fix conversion, content strategy', 'Daily Reels, community building', 'Viral content, daily posting', 'Group engagement, Live events', 'Networking, curator relationships'],
+                '30-Day Target': ['+20 subs', '+50 followers', '+100 followers', '+50 followers', '+50 followers']
+            },
+        },
+        "Critical Issues": {
+            "collaboration_data": {
+                'Type': ['Featured Artist', 'Cross-Promotion', 'Joint Live', 'Playlist Exchange'],
+                'Status': ['✅ Has (unused)', '❌ Missing', '❌ Missing', '❌ Missing'],
+                'Potential Reach': ['100-500 listeners', '50-200 followers', '20-50 viewers', '50-100 streams']
+            },
+            "budget_scenarios": {
+                'Scenario': ['£0 Budget', '£50/Month', '£100/Month', '£200/Month'],
+                'Expected Followers/Month': ['5-15', '30-50', '50-100', '100-200'],
+                'Expected Listeners/Month': ['2-5', '10-20', '20-40', '50-100'],
+                'ROI': ['Slow organic', '10x better', '20x better', '40x better']
+            },
+        },
+        "90-Day Action Plan": {
+            "weekly_tasks": {
+                'Week': ['Week 1', 'Week 2', 'Week 3', 'Week 4'],
+                'Focus': ['Emergency Fixes', 'Content & Engagement', 'Paid Promotion Launch', 'Optimization'],
+                'Key Tasks': [
+                    'Fix YouTube, Instagram, TikTok, Email, Facebook, Twitter',
+                    'Batch create content, first email campaign, community engagement',
+                    'Launch ads (£50-100), playlist pitching, collaboration outreach',
+                    'Analytics review, content repurposing, month 2 planning'
+                ],
+                'Targets': [
+                    'All platforms reactivated, 5-10 new followers',
+                    '10-15 new followers, 5-10 email subs',
+                    '20-30 new followers, 10-15 new listeners',
+                    'Optimize based on data, plan month 2'
+                ]
+            },
+            "timeline_data": {
+                'Week': ['Week 5', 'Week 6', 'Week 7', 'Week 8'],
+                'Theme': ['Content System', 'Growth Sprints', 'Email & Fans', 'Optimization'],
+                'Key Activities': [
+                    'Batch creation, collaboration launch, playlist pitching',
+                    'Instagram sprint, TikTok sprint, YouTube optimization',
+                    'Email campaigns, fan engagement, community deepening',
+                    'Content repurposing, paid ads round 2, month 3 planning'
+                ],
+                'Growth Targets': [
+                    '40-60 new followers, content system established',
+                    '30-50 new followers, platform-specific growth',
+                    '20-30 email subs, deeper fan connections',
+                    'Optimization based on data, prepare for scale'
+                ]
+            },
+            "goals_data": {
+                'Metric': ['Spotify Monthly Listeners', 'Instagram Followers', 'TikTok Followers', 'Email Subscribers'],
+                'Start (Day 60)': [50, 150, 150, 70],
+                'Target (Day 90)': [500, 300, 500, 100],
+                'Growth': ['10x', '2x', '3x', '1.5x']
+            },
+        },
+        "KPIs & Targets": {
+            "streaming_kpis": {
+                'Metric': ['Spotify Monthly Listeners', 'Total Streams (90 days)', 'Playlist Placements', 'Algorithm Playlists', 'Listener Geography'],
+                'Starting': ['2', '500-1,000', '0', 'None', 'Unknown'],
+                'Target': ['500+', '15,000+', '5-10', 'Release Radar, Discover Weekly', 'UK, Nigeria, US'],
+                'Weight': ['30%', '20%', '20%', '15%', '15%']
+            },
+            "social_kpis": {
+                'Platform': ['Instagram', 'TikTok', 'YouTube', 'Facebook', 'Twitter/X', 'Total'],
+                'Starting': ['33', '1', '849', '3', '0', '886'],
+                'Target': ['300+', '500+', '1,000+', '100+', '100+', '2,000+'],
+                'Growth': ['9x', '500x', '1.2x', '33x', '∞', '2.3x'],
+                'Priority': ['High', 'High', 'Medium', 'Low', 'Medium', 'N/A']
+            },
+            "email_kpis": {
+                'Metric': ['Total Subscribers', 'Open Rate', 'Click Rate', 'Conversion to Streams', 'Superfans Identified'],
+                'Starting': ['0', 'N/A', 'N/A', 'N/A', '0'],
+                'Target': ['100+', '30%+', '20%+', '10%+', '10-20'],
+                'Industry Avg': ['Varies', '20-25%', '10-15%', '5-10%', '1-5%']
+            },
+            "engagement_kpis": {
+                'Metric': ['Instagram Engagement Rate', 'TikTok Avg Views', 'YouTube Avg Views', 'Email Open Rate', 'Community Activity'],
+                'Starting': ['6-12%', '123', '142', 'N/A', 'None'],
+                'Target': ['15%+', '1,000+', '500+', '30%+', 'Daily'],
+                'Industry Good': ['5-10%', '500-1,000', 'Varies', '20-25%', '3-5x/week']
+            },
+            "financial_kpis": {
+                'Metric': ['Total Investment', 'Streaming Revenue', 'ROI (Monetary)', 'Cost Per Listener', 'Strategic ROI'],
+                'Budget £0': ['£0', '£5-10', 'N/A', '£0', 'Audience growth only'],
+                'Budget £50/m': ['£150', '£15-25', '-83% to -87%', '£0.30-0.50', '10x faster growth'],
+                'Budget £100/m': ['£300', '£20-35', '-89% to -93%', '£0.60-1.00', '20x faster growth']
+            },
+        },
+        "Content Strategy": {
+            "schedule_data": {
+                'Platform': ['Instagram', 'TikTok', 'YouTube', 'Email', 'Facebook', 'Twitter'],
+                'Daily': ['1 Reel + 3-5 Stories', '1-2 videos', 'As needed', 'N/A', 'N/A', 'N/A'],
+                'Weekly': ['7 Reels, 20+ Stories', '7-14 videos', '1-3 Shorts or 1 main video', '1 newsletter', '3-4 posts', 'Daily engagement'],
+                'Time/Day': ['30 min', '20 min', '20 min', '15 min', '10 min', '10 min'],
+                'Best Time': ['6-8pm UK', '12-2pm & 7-9pm', '2-4pm weekdays', 'Tuesday 10am', '7-9pm weekdays', 'Throughout day']
+            },
+        },
+        "Budget Scenarios": {
+            "budget_data": {
+                'Channel': ['Instagram Promotion', 'Facebook Targeted Ads', 'Platform Tools', 'Monthly Total'],
+                'Allocation': ['£30', '£20', '£0', '£50'],
+                'Strategic Purpose': [
+                    'Music video and Reel amplification',
+                    'Gospel community targeting and group reach',
+                    'Utilize free-tier scheduling and analytics tools',
+                    'Baseline digital marketing investment'
+                ],
+                'Expected Monthly Impact': [
+                    '20-30 followers | 10-15 listeners',
+                    '10-15 followers | 5-10 listeners',
+                    'Improved workflow efficiency',
+                    '30-50 followers | 15-25 listeners'
+                ]
+            },
+            "results_data": {
+                'Marketing Channel': ['Instagram', 'TikTok', 'YouTube', 'Retargeting', 'Combined Total'],
+                'Budget': ['£30', '£30', '£30', '£10', '£100'],
+                'Projected Impressions': ['2,000-3,000', '5,000-10,000', '1,000-2,000', '500-1,000', '8,500-16,000'],
+                'Profile Visits': ['80-120', '150-250', '30-50', '20-30', '280-450'],
+                'New Followers': ['30-40', '40-60', '10-15', '5-10', '85-125'],
+                'New Listeners': ['15-20', '20-30', '5-10', '3-5', '43-65'],
+                'Cost Per Acquisition': ['£1.00-1.33', '£0.50-0.75', '£2.00-4.00', '£2.00-3.33', '£0.80-1.16']
+            },
+            "monthly_allocation": {
+                'Investment Category': ['Paid Advertising', 'Content Production', 'Professional Tools', 'Playlist Promotion', 'Monthly Total'],
+                'Allocation': ['£120', '£50', '£20', '£10', '£200'],
+                'Strategic Application': [
+                    'Multi-platform advertising campaigns (Instagram, TikTok, YouTube, Facebook)',
+                    'Enhanced production quality, location fees, collaboration investments',
+                    'Premium scheduling platforms, advanced analytics, content creation tools',
+                    'SubmitHub campaigns, curator outreach, professional pitching services',
+                    'Comprehensive growth infrastructure investment'
+                ],
+                'Expected Impact': [
+                    'Primary audience acquisition driver',
+                    'Improved content quality and engagement',
+                    'Operational efficiency and data insights',
+                    'Playlist placement opportunities',
+                    'Integrated growth ecosystem'
+                ]
+            },
+            "comparison_data": {
+                'Investment Tier': ['Conservative Estimate', 'Entry Investment', 'Standard Investment', 'Growth Investment'],
+                '90-Day Investment': ['£0', '£150', '£300', '£600'],
+                'Projected Listeners': ['50-100', '45-75', '120-180', '250-375'],
+                'Projected Followers': ['100-200', '90-150', '240-345', '500-750'],
+                'Daily Time Required': ['90-120 min', '60-90 min', '60-90 min', '60-120 min'],
+                'Optimal Application': [
+                    'Long-term community building',
+                    'Emerging independent artists',
+                    'Serious career development',
+                    'Professional acceleration'
+                ]
+            },
+        },
+        "Email Marketing": {
+            "timeline_data": {
+                'Week': ['Week 1', 'Week 2', 'Week 3', 'Week 4', 'Month 2', 'Month 3'],
+                'Action': [
+                    'Set up Mailchimp, create lead magnet, add to Linktree',
+                    'Promote in content, launch welcome sequence',
+                    'First weekly newsletter, analyze open rates',
+                    'Segment list (new vs engaged), optimize',
+                    'Launch survey, collect testimonials',
+                    '100+ subscribers, plan song launch sequence'
+                ],
+                'Target': ['10-20 subs', '20-30 subs', '30-40 subs', '40-50 subs', '50-70 subs', '70-100+ subs']
+            },
+        },
+        "Quick Wins": {
+            "calendar_data": {
+                'Day': ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'],
+                'Instagram': ['Reel: Worship moment', 'Reel: Behind scenes', 'Reel: Testimony', 'Reel: Scripture', 'Reel: Music video clip', 'Reel: Q&A', 'Story only'],
+                'TikTok': ['Trending sound', 'POV video', 'Duet challenge', 'Raw worship', 'Song snippet', 'Testimony', 'Rest day'],
+                'YouTube': ['Shorts: Piano clip', 'N/A', 'Shorts: Lyrics', 'N/A', 'Shorts: BTS', 'N/A', 'Potential main video']
+            },
+            "tools_data": {
+                'Tool': ['Canva', 'CapCut', 'Mailchimp', 'Later/Buffer', 'Linktree', 'Spotify for Artists'],
+                'Purpose': ['Graphics/design', 'Video editing', 'Email marketing', 'Scheduling', 'Link management', 'Analytics'],
+                'Status': ['Free account created', 'App downloaded', 'Account set up', 'Free account created', 'Optimized', 'Claimed profile'],
+                'Time': ['30 min', '15 min', '20 min', '15 min', '10 min', '15 min']
+            },
+        },
+        "Age to Age Campaign": {
+            "hourly_data": {
+                'Time Block': [
+                    '12:00 AM - 6:00 AM',
+                    '6:00 AM - 9:00 AM',
+                    '9:00 AM - 12:00 PM',
+                    '12:00 PM - 3:00 PM',
+                    '3:00 PM - 6:00 PM',
+                    '6:00 PM - 9:00 PM',
+                    '9:00 PM - 12:00 AM'
+                ],
+                'Key Actions': [
+                    'Launch on all platforms, email blast, Stories blitz',
+                    'Morning engagement, respond to comments, TikTok post',
+                    'Instagram Reel, community engagement, track metrics',
+                    'Facebook Live performance, email update, playlist pitching',
+                    'User-generated content sharing, continued engagement',
+                    'Evening push, milestone celebration, final content push',
+                    'Final countdown to 24hrs, thank supporters, prep Week 1'
+                ],
+                'Target Streams': [
+                    '50-100',
+                    '100-150',
+                    '150-250',
+                    '250-350',
+                    '350-450',
+                    '450-550',
+                    '500-600'
+                ],
+                'Priority': [
+                    'Critical',
+                    'High',
+                    'High',
+                    'High',
+                    'Medium',
+                    'Medium',
+                    'High'
+                ]
+            },
+            "week1_data": {
+                'Day': ['Day 2 (Jan 19)', 'Day 3 (Jan 20)', 'Day 4 (Jan 21)', 'Day 5 (Jan 22)', 'Day 6 (Jan 23)', 'Day 7 (Jan 24)'],
+                'Content Focus': [
+                    'Thank you + behind-the-scenes',
+                    'User testimonies + lyric focus',
+                    'Collaboration announcements',
+                    'Playlist update + milestone celebration',
+                    'Acoustic/alternate version',
+                    'Week 1 recap + Week 2 preview'
+                ],
+                'Platform Priority': [
+                    'Instagram Stories + Email',
+                    'TikTok + Instagram Reels',
+                    'All platforms',
+                    'Email + Twitter',
+                    'YouTube + Instagram',
+                    'All platforms recap'
+                ],
+                'Stream Target': [
+                    '200-300',
+                    '150-250',
+                    '150-200',
+                    '100-150',
+                    '100-150',
+                    '150-200'
+                ]
+            },
+            "calendar_data": {
+                'Week': ['Week 1 (Jan 18-24)', 'Week 2 (Jan 25-31)', 'Week 3 (Feb 1-7)', 'Week 4 (Feb 8-14)'],
+                'Instagram': [
+                    '7 Reels (launch, BTS, lyrics, testimonies), 40+ Stories',
+                    '7 Reels (acoustic, cover challenge, fan reactions), 30+ Stories',
+                    '7 Reels (worship moments, Scripture connections), 30+ Stories',
+                    '5 Reels (milestone celebration, looking ahead), 20+ Stories'
+                ],
+                'TikTok': [
+                    '10-14 videos (launch, reactions, duets, trending sounds)',
+                    '7-10 videos (challenges, POVs, worship moments)',
+                    '7-10 videos (user-generated content, collaborations)',
+                    '5-7 videos (recap, thank you, next chapter tease)'
+                ],
+                'Email': [
+                    '3 emails (launch, Day 3 update, Week 1 thank you)',
+                    '2 emails (exclusive content, playlist update)',
+                    '1-2 emails (testimony collection, milestone)',
+                    '1 email (30-day reflection, what\'s next)'
+                ],
+                'YouTube': [
+                    '1 main video (music video or lyric video), 5-7 Shorts',
+                    '3-5 Shorts (repurposed TikTok content)',
+                    '1 video (acoustic/BTS), 3-5 Shorts',
+                    '3-5 Shorts, plan next main video'
+                ]
+            },
+            "budget_scenarios": {
+                'Investment Level': ['Conservative (Organic)', 'Entry (£100)', 'Standard (£200)', 'Growth (£400)'],
+                'Pre-Launch': ['£0', '£30', '£60', '£120'],
+                'Launch Day': ['£0', '£30', '£60', '£120'],
+                'Week 1': ['£0', '£40', '£80', '£160'],
+                'Total': ['£0', '£100', '£200', '£400'],
+                'Expected Day 1 Streams': ['300-500', '500-800', '800-1,200', '1,200-2,000'],
+                'Expected Week 1 Total': ['1,000-1,500', '1,500-2,500', '2,500-4,000', '4,000-6,000']
+            },
+            "detailed_budget": {
+                'Phase': [
+                    'Pre-Launch (£30)',
+                    'Pre-Launch (£30)',
+                    'Launch Day (£30)',
+                    'Launch Day (£30)',
+                    'Week 1 (£40)',
+                    'Week 1 (£40)'
+                ],
+                'Channel': [
+                    'Instagram Story Ads',
+                    'Facebook Group Targeting',
+                    'Instagram Reels Boost',
+                    'TikTok Promote',
+                    'Retargeting Campaigns',
+                    'Playlist Pitching (SubmitHub)'
+                ],
+                'Budget': ['£20', '£10', '£20', '£10', '£30', '£10'],
+                'Goal': [
+                    '30-50 pre-saves',
+                    '20-30 email signups',
+                    '200-300 Day 1 streams',
+                    '100-200 Day 1 streams',
+                    'Sustained Week 1 momentum',
+                    '2-3 playlist placements'
+                ],
+                'Timing': [
+                    'Jan 15-17 (3 days)',
+                    'Jan 15-17 (3 days)',
+                    'Jan 18 only',
+                    'Jan 18-19',
+                    'Jan 19-24',
+                    'Jan 18-24'
+                ]
+            },
+            "success_tiers": {
+                'Metric': [
+                    'Day 1 Streams',
+                    'Day 1 Saves',
+                    'Week 1 Total Streams',
+                    'Playlist Placements (Week 1)',
+                    'Email List Growth',
+                    'Social Media Engagement',
+                    'Pre-Saves Secured'
+                ],
+                'Minimum Success': [
+                    '300-500',
+                    '50-100',
+                    '1,000-1,500',
+                    '1-2',
+                    '30-50',
+                    '100-200 interactions',
+                    '30-50'
+                ],
+                'Target Success': [
+                    '500-800',
+                    '100-150',
+                    '1,500-2,500',
+                    '3-5',
+                    '50-100',
+                    '200-400 interactions',
+                    '50-80'
+                ],
+                'Exceptional Success': [
+                    '800+',
+                    '150+',
+                    '2,500+',
+                    '5+',
+                    '100+',
+                    '400+ interactions',
+                    '80+'
+                ]
+            },
+        },
+    },
+}
+
+TABLES = ARTIST_TABLES[ARTIST]
+
+
+def _benchmark_gap(frame, artist):
+    frame['Gap'] = gap_labels(frame[f'{artist} (Current)'], frame['Industry Minimum'])
+
+
+def _scenario_timeline(frame, artist):
+    frame.insert(
+        frame.columns.get_loc('Projected Followers') + 1,
+        'Timeline to 500',
+        [timeline_label(first_passage(*parse_range(projected))['days']) for projected in frame['Projected Listeners']]
+    )
+
+
+# Columns computed from a table's own data instead of typed into it, so the
+# dashboard and every export show the same values: (section, table) -> fn(frame, artist)
+DERIVED_COLUMNS = {
+    ("Executive Summary", "benchmark_data"): _benchmark_gap,
+    ("Budget Scenarios", "comparison_data"): _scenario_timeline,
+}
+
+
+def table_frame(section, name, artist=ARTIST, data=None):
+    """One audit table as a DataFrame, derived columns included.
+
+    `data` supplies the table's columns for artists outside ARTIST_TABLES.
+    """
+    frame = pd.DataFrame(ARTIST_TABLES[artist][section][name] if data is None else data)
+    derive = DERIVED_COLUMNS.get((section, name))
+    if derive is not None:
+        derive(frame, artist)
+    return frame
+
+
+def iter_tables(artist=None, section=None, tables=ARTIST_TABLES):
+    """Yield (artist, section, name, DataFrame) lazily, one table at a time.
+
+    `tables` is an {artist: {section: {name: columns}}} mapping like
+    ARTIST_TABLES, e.g. one built from warehouse metrics.
+    """
+    artists = [artist] if artist else list(tables)
+    for artist_name in artists:
+        sections = tables.get(artist_name, {})
+        names = [section] if section else list(sections)
+        for section_name in names:
+            for table_name, data in sections.get(section_name, {}).items():
+                yield artist_name, section_name, table_name, table_frame(section_name, table_name, artist_name, data)
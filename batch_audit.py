@@ -0,0 +1,169 @@
+# Builds the audit bundle (tables, scores, figures, forecast) for every
+# artist in parallel across CPU cores. Stream histories are loaded once and
+# shared with the worker processes through shared memory.
+#
+#     python batch_audit.py --out audit_bundles --workers 8
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from audit_tables import ARTIST, ARTIST_TABLES, iter_tables
+from exports import slug, write_csv_zip
+from forecast import forecast_history
+from series import ratio_series
+from warehouse import DEFAULT_PATH, Warehouse
+
+# Set in each worker process by _attach_streams
+_streams = None
+_stream_lengths = None
+_artist_rows = None
+
+
+def load_streams(warehouse, artists):
+    """Daily Spotify streams per artist as one (artists × days) matrix plus lengths."""
+    histories = [
+        [value for _, value in warehouse.query(
+            "metric_series", artist=artist, platform="Spotify", metric="streams", start="2000-01-01", end="2100-01-01"
+        )]
+        for artist in artists
+    ]
+    lengths = np.array([len(h) for h in histories], dtype=np.int64)
+    matrix = np.zeros((len(artists), max(lengths.max(initial=0), 1)))
+    for row, history in enumerate(histories):
+        matrix[row, :len(history)] = history
+    return matrix, lengths
+
+
+def _attach_streams(shm_name, shape, lengths, artists):
+    global _streams, _stream_lengths, _artist_rows
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _streams = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    _streams.flags.writeable = False
+    _stream_lengths = lengths
+    _artist_rows = {artist: row for row, artist in enumerate(artists)}
+    # Keep the mapping alive for the life of the worker
+    _attach_streams.shm = shm
+
+
+# Benchmark rows that can be measured for any artist: (metric, platform, warehouse metric)
+MEASURED_BENCHMARKS = [
+    ('Spotify Monthly Listeners', "Spotify", "monthly_listeners"),
+    ('Instagram Followers', "Instagram", "followers"),
+    ('Email Subscribers', "Email", "subscribers"),
+]
+
+
+def warehouse_tables(warehouse, artist):
+    """Audit tables for an artist outside ARTIST_TABLES, from their latest warehouse metrics.
+
+    Only the Executive Summary benchmark can be rebuilt from metrics; the
+    rest of the audit is written per artist. Returns {} when nothing is loaded.
+    """
+    latest = {(platform, metric): value for platform, metric, value in warehouse.query("latest_metrics", artist=artist)}
+    reference = ARTIST_TABLES[ARTIST]["Executive Summary"]["benchmark_data"]
+    minimums = dict(zip(reference['Metric'], reference['Industry Minimum']))
+    rows = [
+        (label, latest[(platform, metric)], minimums[label])
+        for label, platform, metric in MEASURED_BENCHMARKS if (platform, metric) in latest
+    ]
+    if not rows:
+        return {}
+    labels, current, minimum = zip(*rows)
+    return {"Executive Summary": {"benchmark_data": {
+        'Metric': list(labels), f'{artist} (Current)': list(current), 'Industry Minimum': list(minimum)
+    }}}
+
+
+def benchmark_scores(artist, tables):
+    """Percent of the industry minimum reached on each benchmark metric."""
+    benchmark = tables.get("Executive Summary", {}).get("benchmark_data")
+    if benchmark is None:
+        return {}
+    pct = ratio_series(benchmark[f'{artist} (Current)'], benchmark['Industry Minimum']) * 100
+    return {metric: round(float(p), 1) for metric, p in zip(benchmark['Metric'], pct)}
+
+
+def build_bundle(artist, tables, out_dir):
+    """Write one artist's bundle and return (artist, seconds, files written)."""
+    started = time.perf_counter()
+    bundle = os.path.join(out_dir, slug(artist))
+    os.makedirs(bundle, exist_ok=True)
+    written = []
+
+    if tables:
+        with open(os.path.join(bundle, "tables.zip"), "wb") as f:
+            write_csv_zip(iter_tables(artist, tables={artist: tables}), f)
+        written.append("tables.zip")
+
+    scores = benchmark_scores(artist, tables)
+    if scores:
+        with open(os.path.join(bundle, "scores.json"), "w") as f:
+            json.dump(scores, f, indent=2)
+        written.append("scores.json")
+
+        fig = go.Figure(data=[go.Bar(x=list(scores), y=list(scores.values()), marker_color='#8B4789')])
+        fig.update_layout(title=f"{artist}: % of Industry Minimum", yaxis_title="% of minimum", height=400)
+        fig.write_html(os.path.join(bundle, "benchmarks.html"), include_plotlyjs="cdn")
+        written.append("benchmarks.html")
+
+    row = _artist_rows.get(artist) if _artist_rows else None
+    if row is not None and _stream_lengths[row] > 0:
+        # The 30 days after the stored history, as on the dashboard
+        projection = forecast_history(artist, _streams[row, :_stream_lengths[row]])
+        pd.DataFrame({
+            'Day': projection['days'],
+            'Forecast': projection['forecast'].round(),
+            'Lower': projection['lower'].round(),
+            'Upper': projection['upper'].round()
+        }).to_csv(os.path.join(bundle, "forecast.csv"), index=False)
+        written.append("forecast.csv")
+
+    return artist, time.perf_counter() - started, written
+
+
+def run(out_dir, db_path=DEFAULT_PATH, workers=None):
+    warehouse = Warehouse(db_path)
+    artists = list(ARTIST_TABLES) + [
+        name for (name,) in warehouse.conn.execute("SELECT name FROM artists") if name not in ARTIST_TABLES
+    ]
+    matrix, lengths = load_streams(warehouse, artists)
+    tables = {artist: ARTIST_TABLES.get(artist) or warehouse_tables(warehouse, artist) for artist in artists}
+    # Artists with neither audit tables, metrics nor streams would get an empty bundle
+    skipped = [artist for artist, length in zip(artists, lengths) if not tables[artist] and not length]
+    for artist in skipped:
+        print(f"{artist:<30} skipped: no audit tables, metrics or streams loaded", flush=True)
+    bundled = [artist for artist in artists if artist not in skipped]
+
+    shm = shared_memory.SharedMemory(create=True, size=matrix.nbytes)
+    try:
+        np.ndarray(matrix.shape, dtype=matrix.dtype, buffer=shm.buf)[:] = matrix
+        started = time.perf_counter()
+        with ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            initializer=_attach_streams,
+            initargs=(shm.name, matrix.shape, lengths, artists)
+        ) as pool:
+            futures = [pool.submit(build_bundle, artist, tables[artist], out_dir) for artist in bundled]
+            for future in as_completed(futures):
+                artist, seconds, written = future.result()
+                print(f"{artist:<30} {seconds * 1000:8.1f} ms  {', '.join(written)}", flush=True)
+        print(f"{len(bundled)} bundles in {time.perf_counter() - started:.2f}s, {len(skipped)} skipped", flush=True)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build audit bundles for every artist in parallel.")
+    parser.add_argument("--out", default="audit_bundles", help="output directory")
+    parser.add_argument("--db", default=DEFAULT_PATH, help="warehouse database path")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args()
+    run(args.out, args.db, args.workers)
@@ -0,0 +1,150 @@
+# Expands pillar assets through the repurposing matrix into dated post slots.
+# Slots come from the Weekly Posting Schedule's 'Best Time' windows and
+# 'Time/Day' budgets; pieces are matched to slots with searchsorted over the
+# sorted slot index instead of scanning day by day.
+import re
+
+import numpy as np
+import pandas as pd
+
+# The 22-piece flywheel from Content Strategy: (piece, platform, count, minutes)
+REPURPOSING_MATRIX = [
+    ("Full YouTube video", "YouTube", 1, 20),
+    ("YouTube Short", "YouTube", 3, 10),
+    ("Instagram Reel", "Instagram", 3, 15),
+    ("TikTok video", "TikTok", 3, 10),
+    ("Audiogram clip", "Twitter", 3, 5),
+    ("Podcast snippet", "Facebook", 1, 10),
+    ("Behind-the-scenes audio", "Instagram", 1, 10),
+    ("Blog post", "Facebook", 1, 10),
+    ("Quote graphic", "Instagram", 3, 10),
+    ("Instagram carousel", "Instagram", 1, 15),
+    ("Email: Behind the scenes", "Email", 1, 15),
+    ("Email: Exclusive clip", "Email", 1, 15),
+]
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+
+def _hour(text, meridiem):
+    hour = int(text)
+    if meridiem == "pm" and hour != 12:
+        hour += 12
+    return hour
+
+
+def parse_best_time(text):
+    """Turn a 'Best Time' cell into ([(start_hour, end_hour)], weekday mask).
+
+    Handles ranges like '6-8pm UK' and '12-2pm & 7-9pm', single times like
+    'Tuesday 10am', and weekday/named-day qualifiers. 'Throughout day' and
+    anything unparseable fall back to 9am-9pm.
+    """
+    lowered = text.lower()
+    windows = []
+    for start, end, meridiem in re.findall(r'(\d{1,2})\s*-\s*(\d{1,2})\s*(am|pm)', lowered):
+        end_hour = _hour(end, meridiem)
+        start_hour = _hour(start, meridiem)
+        # '12-2pm' starts at noon, '11-1pm' starts in the morning
+        if start_hour > end_hour:
+            start_hour -= 12
+        windows.append((start_hour, end_hour))
+    if not windows:
+        windows = [(_hour(h, m), _hour(h, m) + 1) for h, m in re.findall(r'(\d{1,2})\s*(am|pm)', lowered)]
+    if not windows:
+        windows = [(9, 21)]
+
+    mask = np.ones(7, dtype=bool)
+    named = [i for i, day in enumerate(WEEKDAYS) if day in lowered]
+    if named:
+        mask[:] = False
+        mask[named] = True
+    elif "weekday" in lowered:
+        mask[5:] = False
+    return windows, mask
+
+
+def _budget_minutes(text):
+    match = re.search(r'(\d+)\s*min', text)
+    return int(match.group(1)) if match else 30
+
+
+def _offsets(windows, per_day):
+    """Minutes past midnight of `per_day` posts spread across the day's windows, in ns."""
+    offsets = []
+    for i in range(per_day):
+        window_start, window_end = windows[i % len(windows)]
+        in_window = per_day // len(windows) + (i % len(windows) < per_day % len(windows))
+        step = (window_end - window_start) * 60 / max(in_window, 1)
+        offsets.append(window_start * 60 + step * (i // len(windows)))
+    return (np.sort(offsets) * 60e9).astype(np.int64)
+
+
+def build_slots(schedule, start, days, best_cells=None):
+    """Sorted slot datetimes (as int64 ns) per platform over `days` days.
+
+    `best_cells` optionally maps a platform to the (weekday, hour) cells it
+    should post in; those replace the platform's 'Best Time' text.
+    """
+    slots = {}
+    # Slots are int64 nanoseconds; pandas 3 defaults to microseconds, so fix the unit
+    dates = pd.date_range(start, periods=days, freq="D").as_unit("ns")
+    weekdays = dates.weekday.to_numpy()
+    piece_minutes = {}
+    for _, platform, _, minutes in REPURPOSING_MATRIX:
+        piece_minutes.setdefault(platform, []).append(minutes)
+
+    for platform, best_time, time_per_day in zip(schedule['Platform'], schedule['Best Time'], schedule['Time/Day']):
+        if platform not in piece_minutes:
+            continue
+        cells = (best_cells or {}).get(platform)
+        if cells:
+            day_windows = {}
+            for weekday, hour in sorted(cells):
+                day_windows.setdefault(weekday, []).append((hour, hour + 1))
+        else:
+            windows, mask = parse_best_time(best_time)
+            day_windows = {weekday: windows for weekday in np.flatnonzero(mask)}
+        # How many typical pieces fit into the platform's daily time budget
+        per_day = max(1, _budget_minutes(time_per_day) // int(np.mean(piece_minutes[platform])))
+        parts = [
+            (dates[weekdays == weekday].asi8[:, None] + _offsets(windows, per_day)[None, :]).ravel()
+            for weekday, windows in day_windows.items()
+        ]
+        slots[platform] = np.sort(np.concatenate(parts))
+    return slots
+
+
+def expand_calendar(artists, schedule, start, days=90, pillar_every=7, best_cells=None):
+    """Dated post slots for every artist's pillar assets over `days` days.
+
+    Each artist releases a pillar asset every `pillar_every` days; its pieces
+    may go out from that day onwards. Per platform, pieces sorted by earliest
+    date take the next free slot: slot_k = k + cummax(searchsorted(earliest) - k).
+    Pieces that don't fit before the horizon are left unscheduled.
+    `best_cells` is passed through to build_slots.
+    """
+    start = pd.Timestamp(start).normalize()
+    slots = build_slots(schedule, start, days, best_cells)
+    asset_days = np.arange(0, days, pillar_every)
+    columns = {'Slot': [], 'Platform': [], 'Piece': [], 'Pillar Asset': []}
+    for platform, platform_slots in slots.items():
+        pieces = [(name, count) for name, p, count, _ in REPURPOSING_MATRIX if p == platform]
+        names = np.repeat([n for n, _ in pieces], [c for _, c in pieces])
+        earliest = (start + pd.to_timedelta(np.repeat(asset_days, len(names)), unit="D")).as_unit("ns").asi8
+        k = np.arange(len(earliest))
+        index = k + np.maximum.accumulate(np.searchsorted(platform_slots, earliest) - k)
+        scheduled = index < len(platform_slots)
+        columns['Slot'].append(platform_slots[index[scheduled]])
+        columns['Platform'].append(np.full(scheduled.sum(), platform, dtype=object))
+        columns['Piece'].append(np.tile(names, len(asset_days))[scheduled])
+        columns['Pillar Asset'].append((np.repeat(asset_days, len(names)) // pillar_every + 1)[scheduled])
+
+    # Every artist shares the posting schedule, so one plan is tiled across them
+    plan = pd.DataFrame({name: np.concatenate(parts) if parts else [] for name, parts in columns.items()})
+    plan['Slot'] = pd.to_datetime(plan['Slot'].astype(np.int64), unit="ns")
+    plan = plan.sort_values('Slot', ignore_index=True)
+    artists = list(artists)
+    calendar = plan.loc[np.tile(plan.index, len(artists))].reset_index(drop=True)
+    calendar.insert(0, 'Artist', np.repeat(artists, len(plan)))
+    return calendar
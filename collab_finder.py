@@ -0,0 +1,129 @@
+# Collaboration partner search. Artists are embedded by genre tags, audience
+# mix and size band, and indexed with random-hyperplane LSH so a query only
+# reranks the handful of artists that share a bucket with it.
+import numpy as np
+import pandas as pd
+
+# Monthly-listener band edges: <100, 100-1k, 1k-10k, 10k-100k, 100k+
+SIZE_BANDS = (100, 1_000, 10_000, 100_000)
+
+# Share of the similarity each part of the embedding carries
+WEIGHTS = {"genres": 0.6, "audience": 0.25, "size": 0.15}
+
+REQUIRED_COLUMNS = ('Artist', 'Genres', 'Monthly Listeners')
+
+
+def split_tags(text):
+    return [t.strip().lower() for t in str(text).replace(",", "|").split("|") if t.strip()]
+
+
+def size_band(listeners):
+    return np.searchsorted(SIZE_BANDS, listeners, side="right")
+
+
+def read_artists(lines):
+    """Read an artist dataset CSV.
+
+    Columns: Artist, Genres ('gospel|worship'), Monthly Listeners, and any
+    number of 'Audience <segment>' columns holding listener shares. Raises
+    ValueError if the file can't be read or a required column is missing.
+    """
+    artists = pd.read_csv(lines)
+    missing = [c for c in REQUIRED_COLUMNS if c not in artists.columns]
+    if missing:
+        raise ValueError(f"artist file is missing column(s): {', '.join(missing)}")
+    artists['Genres'] = artists['Genres'].fillna('')
+    artists['Monthly Listeners'] = pd.to_numeric(artists['Monthly Listeners'], errors='coerce')
+    return artists.dropna(subset=['Monthly Listeners'])
+
+
+def _unit_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+class CollaboratorIndex:
+    """Approximate nearest-neighbour index over an artist dataset."""
+
+    def __init__(self, artists, tables=8, bits=12, seed=0):
+        self.artists = artists.reset_index(drop=True)
+        self.tags = sorted({t for text in self.artists['Genres'] for t in split_tags(text)})
+        self.tag_ids = {t: i for i, t in enumerate(self.tags)}
+        self.segments = [c for c in self.artists.columns if c.startswith("Audience ")]
+        self.listeners = self.artists['Monthly Listeners'].to_numpy(dtype=np.float64)
+
+        genres = np.zeros((len(self.artists), len(self.tags)))
+        for row, text in enumerate(self.artists['Genres']):
+            genres[row, [self.tag_ids[t] for t in split_tags(text)]] = 1.0
+        audience = self.artists[self.segments].fillna(0).to_numpy(dtype=np.float64)
+        self.vectors = self._combine(genres, audience, self.listeners)
+
+        rng = np.random.default_rng(seed)
+        self.planes = rng.standard_normal((tables, self.vectors.shape[1], bits))
+        self.powers = 1 << np.arange(bits)
+        codes = self._codes(self.vectors)
+        # Per table: bucket codes sorted, so a bucket is one searchsorted slice
+        self.order = np.argsort(codes, axis=0, kind="stable")
+        self.sorted_codes = np.take_along_axis(codes, self.order, axis=0)
+
+    def _combine(self, genres, audience, listeners):
+        bands = size_band(listeners)
+        size = np.zeros((len(bands), len(SIZE_BANDS) + 1))
+        rows = np.arange(len(bands))
+        size[rows, bands] = 1.0
+        # Neighbouring bands count as half a match
+        size[rows[bands > 0], bands[bands > 0] - 1] = 0.5
+        size[rows[bands < len(SIZE_BANDS)], bands[bands < len(SIZE_BANDS)] + 1] = 0.5
+        parts = [
+            np.sqrt(WEIGHTS["genres"]) * _unit_rows(genres),
+            np.sqrt(WEIGHTS["audience"]) * _unit_rows(audience),
+            np.sqrt(WEIGHTS["size"]) * _unit_rows(size),
+        ]
+        return _unit_rows(np.hstack(parts))
+
+    def _codes(self, vectors):
+        # (tables, n, bits) sign pattern -> one integer bucket code per table
+        bits = np.einsum("nd,tdb->tnb", vectors, self.planes) > 0
+        return (bits @ self.powers).T
+
+    def embed(self, genres, listeners, audience=None):
+        """Query vector for an artist outside the dataset.
+
+        `audience` maps 'Audience <segment>' column names to listener shares.
+        """
+        g = np.zeros((1, len(self.tags)))
+        g[0, [self.tag_ids[t] for t in split_tags(genres) if t in self.tag_ids]] = 1.0
+        a = np.array([[(audience or {}).get(s, 0.0) for s in self.segments]])
+        return self._combine(g, a, np.array([listeners], dtype=np.float64))[0]
+
+    def _candidates(self, vector):
+        code = self._codes(vector[None, :])[0]
+        found = []
+        for t, c in enumerate(code):
+            # Probe the query's bucket and every bucket one bit away
+            for probe in np.concatenate(([c], c ^ self.powers)):
+                lo, hi = np.searchsorted(self.sorted_codes[:, t], [probe, probe + 1])
+                found.append(self.order[lo:hi, t])
+        return np.unique(np.concatenate(found))
+
+    def query(self, genres, listeners, audience=None, k=10, min_listeners=0, max_listeners=np.inf, exclude=()):
+        """Top-k similar artists inside a listener range, most similar first."""
+        vector = self.embed(genres, listeners, audience)
+        candidates = self._candidates(vector)
+        eligible = (self.listeners >= min_listeners) & (self.listeners <= max_listeners)
+        if exclude:
+            eligible &= ~self.artists['Artist'].isin(exclude).to_numpy()
+        candidates = candidates[eligible[candidates]]
+        if len(candidates) < k:
+            # Too few eligible bucket hits: rerank every eligible artist instead
+            candidates = np.flatnonzero(eligible)
+
+        scores = self.vectors[candidates] @ vector
+        top = candidates[np.argsort(-scores, kind="stable")[:k]]
+        query_tags = set(split_tags(genres))
+        result = self.artists.loc[top, ['Artist', 'Genres', 'Monthly Listeners']].copy()
+        result['Shared Genres'] = [
+            ", ".join(sorted(query_tags & set(split_tags(text)))) for text in result['Genres']
+        ]
+        result['Similarity'] = (self.vectors[top] @ vector).round(3)
+        return result.reset_index(drop=True)
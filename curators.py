@@ -0,0 +1,200 @@
+# Playlist curator database and pitching queue (SQLite, WAL mode). Playlists
+# are indexed by (genre, follower band), curator acceptance counters are
+# updated as responses arrive, and the queue is one indexed ranking query.
+import csv
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_PATH = os.environ.get("CURATORS_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "curators.db"))
+
+# Follower band edges: <1k, 1k-5k, 5k-20k, 20k-100k, 100k+
+FOLLOWER_BANDS = (1_000, 5_000, 20_000, 100_000)
+
+# Expected streams over a placement per playlist follower, unless a playlist
+# records its own figure
+STREAMS_PER_FOLLOWER = 0.05
+
+# Acceptance prior for curators with no history: 1 accept in 5 (20%)
+PRIOR_ACCEPTS = 1
+PRIOR_PITCHES = 5
+
+# Free pitches still cost time; counted as this many pounds when ranking
+FREE_PITCH_COST = 1.0
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS curators (
+    curator_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    fee REAL NOT NULL DEFAULT 0,
+    responded INTEGER NOT NULL DEFAULT 0,
+    accepted INTEGER NOT NULL DEFAULT 0,
+    acceptance REAL NOT NULL DEFAULT {PRIOR_ACCEPTS / PRIOR_PITCHES}
+);
+CREATE INDEX IF NOT EXISTS curators_by_acceptance ON curators (acceptance, name, responded, fee);
+
+CREATE TABLE IF NOT EXISTS playlists (
+    playlist_id INTEGER PRIMARY KEY,
+    curator_id INTEGER NOT NULL REFERENCES curators,
+    name TEXT NOT NULL,
+    followers INTEGER NOT NULL,
+    streams_per_follower REAL,
+    UNIQUE (curator_id, name)
+);
+
+-- One row per playlist genre, clustered on the queue's genre + band filter
+CREATE TABLE IF NOT EXISTS playlist_genres (
+    genre TEXT NOT NULL,
+    follower_band INTEGER NOT NULL,
+    playlist_id INTEGER NOT NULL REFERENCES playlists,
+    PRIMARY KEY (genre, follower_band, playlist_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS pitches (
+    pitch_id INTEGER PRIMARY KEY,
+    playlist_id INTEGER NOT NULL REFERENCES playlists,
+    track TEXT NOT NULL,
+    sent_at REAL NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    responded_at REAL,
+    UNIQUE (track, playlist_id)
+);
+CREATE INDEX IF NOT EXISTS pitches_by_status ON pitches (status, track, playlist_id);
+"""
+
+QUEUE_QUERY = f"""
+    SELECT p.playlist_id, c.name, p.name, p.followers, c.fee, c.acceptance,
+           c.acceptance * p.followers * COALESCE(p.streams_per_follower, {STREAMS_PER_FOLLOWER}) AS expected,
+           c.acceptance * p.followers * COALESCE(p.streams_per_follower, {STREAMS_PER_FOLLOWER})
+               / MAX(c.fee, {FREE_PITCH_COST}) AS per_pound
+    FROM playlists p JOIN curators c USING (curator_id)
+    WHERE p.playlist_id IN (
+        SELECT playlist_id FROM playlist_genres
+        WHERE genre IN ({{genres}}) AND follower_band BETWEEN ? AND ?
+    )
+    AND p.playlist_id NOT IN (SELECT playlist_id FROM pitches WHERE track = ?)
+    ORDER BY per_pound DESC
+    LIMIT ?
+"""
+
+
+def follower_band(followers):
+    return sum(followers >= edge for edge in FOLLOWER_BANDS)
+
+
+def read_curator_rows(lines):
+    """Parse `curator,playlist,genres,followers[,fee,streams_per_follower]` CSV lines.
+
+    Genres are '|'-separated. Malformed rows are skipped.
+    """
+    for row in csv.DictReader(lines):
+        try:
+            spf = row.get("streams_per_follower")
+            yield (
+                row["curator"], row["playlist"],
+                [g.strip().lower() for g in row["genres"].split("|") if g.strip()],
+                int(row["followers"]), float(row.get("fee") or 0), float(spf) if spf else None
+            )
+        except (KeyError, ValueError, AttributeError):
+            continue
+
+
+class CuratorStore:
+    """Curators, their playlists and every pitch sent to them."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.lock = threading.Lock()
+
+    def ingest_playlists(self, rows):
+        """rows: (curator, playlist, genres, followers, fee, streams_per_follower)."""
+        with self.lock, self.conn:
+            for curator, playlist, genres, followers, fee, spf in rows:
+                self.conn.execute(
+                    "INSERT INTO curators (name, fee) VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET fee = excluded.fee",
+                    (curator, fee)
+                )
+                self.conn.execute(
+                    "INSERT INTO playlists (curator_id, name, followers, streams_per_follower) "
+                    "VALUES ((SELECT curator_id FROM curators WHERE name = ?), ?, ?, ?) "
+                    "ON CONFLICT (curator_id, name) DO UPDATE SET "
+                    "followers = excluded.followers, streams_per_follower = excluded.streams_per_follower",
+                    (curator, playlist, followers, spf)
+                )
+                playlist_id = self.conn.execute(
+                    "SELECT playlist_id FROM playlists WHERE curator_id = (SELECT curator_id FROM curators WHERE name = ?) "
+                    "AND name = ?", (curator, playlist)
+                ).fetchone()[0]
+                # Follower counts move between bands, so genre rows are rewritten
+                self.conn.execute("DELETE FROM playlist_genres WHERE playlist_id = ?", (playlist_id,))
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO playlist_genres VALUES (?, ?, ?)",
+                    [(genre, follower_band(followers), playlist_id) for genre in genres]
+                )
+
+    def genres(self):
+        return [g for (g,) in self.conn.execute("SELECT DISTINCT genre FROM playlist_genres")]
+
+    def queue(self, track, genres, min_band=0, max_band=len(FOLLOWER_BANDS), limit=20):
+        """Unpitched playlists for `track` ranked by expected streams per pound."""
+        if not genres:
+            return []
+        sql = QUEUE_QUERY.format(genres=", ".join("?" * len(genres)))
+        with self.lock:
+            return self.conn.execute(sql, (*genres, min_band, max_band, track, limit)).fetchall()
+
+    def leaderboard(self, limit=10):
+        """(curator, acceptance, responded, fee) for the most receptive curators."""
+        with self.lock:
+            return self.conn.execute(
+                "SELECT name, acceptance, responded, fee FROM curators ORDER BY acceptance DESC LIMIT ?", (limit,)
+            ).fetchall()
+
+    def record_pitches(self, track, playlist_ids, sent_at=None):
+        sent_at = sent_at or time.time()
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO pitches (playlist_id, track, sent_at) VALUES (?, ?, ?)",
+                [(playlist_id, track, sent_at) for playlist_id in playlist_ids]
+            )
+
+    def pending(self, track):
+        """(pitch_id, curator, playlist) for pitches still awaiting a response."""
+        with self.lock:
+            return self.conn.execute(
+                "SELECT s.pitch_id, c.name, p.name FROM pitches s "
+                "JOIN playlists p USING (playlist_id) JOIN curators c USING (curator_id) "
+                "WHERE s.status = 'pending' AND s.track = ? ORDER BY s.sent_at",
+                (track,)
+            ).fetchall()
+
+    def record_response(self, pitch_id, accepted, responded_at=None):
+        """Close a pitch and fold the answer into its curator's acceptance rate."""
+        with self.lock, self.conn:
+            changed = self.conn.execute(
+                "UPDATE pitches SET status = ?, responded_at = ? WHERE pitch_id = ? AND status = 'pending'",
+                ("accepted" if accepted else "declined", responded_at or time.time(), pitch_id)
+            ).rowcount
+            if not changed:
+                return
+            self.conn.execute(
+                f"""UPDATE curators SET
+                    responded = responded + 1,
+                    accepted = accepted + ?,
+                    acceptance = (accepted + ? + {PRIOR_ACCEPTS}) * 1.0 / (responded + 1 + {PRIOR_PITCHES})
+                WHERE curator_id = (
+                    SELECT p.curator_id FROM pitches s JOIN playlists p USING (playlist_id) WHERE s.pitch_id = ?
+                )""",
+                (int(accepted), int(accepted), pitch_id)
+            )
+
+    def results(self, track):
+        """{status: count} of every pitch sent for `track`."""
+        with self.lock:
+            return dict(self.conn.execute(
+                "SELECT status, COUNT(*) FROM pitches WHERE track = ? GROUP BY status", (track,)
+            ).fetchall())
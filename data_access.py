@@ -0,0 +1,104 @@
+# Section-level data access on top of the warehouse. A section's queries run
+# concurrently on a small pool of read connections, and the next section in
+# the sidebar is loaded in the background so it is cached before it's opened.
+import logging
+import queue
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from warehouse import QUERIES
+
+# Warehouse queries each section actually renders: (result name, query, params).
+# Add a row here when a section starts reading a new result.
+SECTION_QUERIES = {
+    "KPIs & Targets": [
+        ("latest", "latest_metrics", {}),
+        ("spotify_listeners", "metric_series", {"platform": "Spotify", "metric": "monthly_listeners"}),
+        ("spotify_streams", "metric_series", {"platform": "Spotify", "metric": "streams"}),
+        ("email_subscribers", "metric_series", {"platform": "Email", "metric": "subscribers"}),
+    ],
+}
+
+log = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """A fixed set of SQLite connections handed out one caller at a time."""
+
+    def __init__(self, path, size=4):
+        self.connections = queue.Queue()
+        for _ in range(size):
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute("PRAGMA query_only=ON")
+            self.connections.put(conn)
+
+    @contextmanager
+    def connection(self):
+        conn = self.connections.get()
+        try:
+            yield conn
+        finally:
+            self.connections.put(conn)
+
+
+class DataAccessLayer:
+    """Loads all of a section's queries at once through a connection pool.
+
+    Results land in the warehouse's own cache, so they are dropped on the
+    next ingest like any other query. In-memory warehouses can't be shared
+    across connections and fall back to the warehouse's single connection.
+    """
+
+    def __init__(self, warehouse, pool_size=4, start="2000-01-01", end="2100-01-01"):
+        self.warehouse = warehouse
+        self.pool = ConnectionPool(warehouse.path, pool_size) if warehouse.path != ":memory:" else None
+        self.executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="section-prefetch")
+        self.start = start
+        self.end = end
+
+    def _run(self, name, params):
+        wh = self.warehouse
+        key = wh.cache_key(name, params)
+        with wh.lock:
+            if key in wh.cache:
+                return wh.cache[key]
+            generation = wh.generation
+        if self.pool is None:
+            return wh.query(name, **params)
+        with self.pool.connection() as conn:
+            rows = conn.execute(QUERIES[name], params).fetchall()
+        with wh.lock:
+            # Don't cache a result an ingest has overtaken mid-query
+            if wh.generation == generation:
+                wh.cache[key] = rows
+        return rows
+
+    def _submit(self, section, artist):
+        futures = {}
+        for result_name, query_name, params in SECTION_QUERIES.get(section, []):
+            params = {"artist": artist, "start": self.start, "end": self.end, **params}
+            futures[result_name] = self.executor.submit(self._run, query_name, params)
+        return futures
+
+    def load_section(self, section, artist):
+        """Run every query the section needs concurrently; {result name: rows}."""
+        return {name: future.result() for name, future in self._submit(section, artist).items()}
+
+    def prefetch_next(self, section, artist, order):
+        """Warm the cache for the section after `section` in sidebar order.
+
+        Nobody waits on a prefetch, so failures are logged rather than
+        raised; the section's own load_section will retry and surface them.
+        """
+        if section not in order:
+            return
+        next_section = order[(order.index(section) + 1) % len(order)]
+        for result_name, future in self._submit(next_section, artist).items():
+            future.add_done_callback(lambda f, name=result_name: self._log_failure(next_section, name, f))
+
+    @staticmethod
+    def _log_failure(section, result_name, future):
+        error = future.exception()
+        if error is not None:
+            log.warning("Prefetch of %s / %s failed: %r", section, result_name, error)
@@ -0,0 +1,132 @@
+# Per-post engagement event ingestion with tumbling and sliding window
+# aggregates held in fixed numpy arrays. Each event is O(1): one bucket add
+# and one running-sum add, with evicted buckets subtracted as the clock moves.
+import csv
+import queue
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+
+METRICS = ("likes", "comments", "shares", "views", "posts")
+LIKES, COMMENTS, SHARES, VIEWS, POSTS = range(len(METRICS))
+
+# Engagement-rate formulas as described on the KPIs & Targets page: video
+# platforms use likes + comments + shares ÷ views, the rest likes + comments ÷ followers
+VIEW_RATE_PLATFORMS = {"TikTok", "YouTube"}
+
+
+def read_events(lines):
+    """Read engagement events from CSV text lines with a header row.
+
+    Expected columns: timestamp, platform, post_id, likes, comments, shares,
+    views. Missing counts default to 0 and malformed rows are skipped.
+    """
+    for row in csv.DictReader(lines):
+        try:
+            yield _event_from_row(row)
+        except (KeyError, ValueError):
+            continue
+
+
+def read_event_file(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from read_events(f)
+
+
+def drain_queue(events_queue):
+    """Pull every event currently waiting on a local queue without blocking."""
+    while True:
+        try:
+            row = events_queue.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            yield _event_from_row(row)
+        except (KeyError, ValueError):
+            continue
+
+
+def _event_from_row(row):
+    timestamp = row["timestamp"]
+    if not isinstance(timestamp, datetime):
+        timestamp = datetime.fromisoformat(timestamp)
+    return {
+        "timestamp": timestamp,
+        "platform": row["platform"],
+        "post_id": row.get("post_id", ""),
+        **{m: int(row.get(m) or 0) for m in METRICS if m != "posts"}
+    }
+
+
+class EngagementWindows:
+    """Tumbling and sliding engagement windows per platform.
+
+    Time is cut into `bucket_seconds` tumbling buckets. The sliding window is
+    the last `window_buckets` buckets, kept as a running sum so reading it
+    never rescans events. Closed buckets are kept in `tumbling` (newest last).
+    """
+
+    def __init__(self, followers, bucket_seconds=86400, window_buckets=7, history=90):
+        self.platforms = list(followers)
+        self.index = {p: i for i, p in enumerate(self.platforms)}
+        self.followers = np.array([followers[p] for p in self.platforms], dtype=np.float64)
+        self.bucket_seconds = bucket_seconds
+        self.window_buckets = window_buckets
+        self.buckets = np.zeros((window_buckets, len(self.platforms), len(METRICS)), dtype=np.int64)
+        self.window = np.zeros((len(self.platforms), len(METRICS)), dtype=np.int64)
+        self.current = None
+        self.tumbling = deque(maxlen=history)
+        self.seen_posts = set()
+
+    def _advance(self, bucket):
+        # Close the current bucket, then clear each slot the window slides past
+        self.tumbling.append((self.current, self.buckets[self.current % self.window_buckets].copy()))
+        for b in range(max(self.current + 1, bucket - self.window_buckets + 1), bucket + 1):
+            slot = b % self.window_buckets
+            self.window -= self.buckets[slot]
+            self.buckets[slot] = 0
+        self.current = bucket
+
+    def ingest(self, event):
+        platform = self.index.get(event["platform"])
+        if platform is None:
+            return
+        bucket = int(event["timestamp"].timestamp() // self.bucket_seconds)
+        if self.current is None:
+            self.current = bucket
+        elif bucket > self.current:
+            self._advance(bucket)
+        elif bucket <= self.current - self.window_buckets:
+            return  # older than the sliding window
+
+        delta = np.zeros(len(METRICS), dtype=np.int64)
+        for i, metric in enumerate(METRICS[:POSTS]):
+            delta[i] = event.get(metric, 0)
+        post_key = (event["platform"], event.get("post_id"))
+        if post_key not in self.seen_posts:
+            self.seen_posts.add(post_key)
+            delta[POSTS] = 1
+
+        self.buckets[bucket % self.window_buckets, platform] += delta
+        self.window[platform] += delta
+
+    def ingest_many(self, events):
+        for event in events:
+            self.ingest(event)
+
+    def rates(self, totals=None):
+        """Engagement rate (%) and average views per post for each platform."""
+        totals = self.window if totals is None else totals
+        totals = totals.astype(np.float64)
+        interactions = totals[:, LIKES] + totals[:, COMMENTS]
+        by_views = np.array([p in VIEW_RATE_PLATFORMS for p in self.platforms])
+        numerator = np.where(by_views, interactions + totals[:, SHARES], interactions)
+        denominator = np.where(by_views, totals[:, VIEWS], self.followers)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rate = np.where(denominator > 0, numerator / denominator * 100, np.nan)
+            avg_views = np.where(totals[:, POSTS] > 0, totals[:, VIEWS] / totals[:, POSTS], np.nan)
+        return {
+            p: {"engagement_rate": rate[i], "avg_views": avg_views[i], "posts": int(totals[i, POSTS])}
+            for i, p in enumerate(self.platforms)
+        }
@@ -0,0 +1,64 @@
+# Bulk export of audit tables as zipped CSVs or one multi-sheet workbook.
+# Tables are pulled from an iterator and written one at a time into a spooled
+# temp file, so only the table being written is ever held in memory.
+import importlib.util
+import io
+import re
+import tempfile
+import zipfile
+
+import pandas as pd
+
+# Exports up to this size stay in memory, anything larger spills to disk
+SPOOL_LIMIT = 8 * 1024 * 1024
+
+
+def slug(text):
+    """Lowercase file-name-safe form of an artist, section or table name."""
+    return re.sub(r'[^A-Za-z0-9]+', '_', text).strip('_').lower()
+
+
+def excel_engine():
+    """Return the first installed Excel writer engine, or None."""
+    for engine in ("xlsxwriter", "openpyxl"):
+        if importlib.util.find_spec(engine) is not None:
+            return engine
+    return None
+
+
+def write_csv_zip(tables, fileobj):
+    """Write each (artist, section, name, df) as its own CSV inside a zip."""
+    with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for artist, section, name, df in tables:
+            path = f"{slug(artist)}/{slug(section)}/{slug(name)}.csv"
+            with archive.open(path, "w") as raw:
+                text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+                df.to_csv(text, index=False)
+                text.flush()
+                text.detach()
+    return fileobj
+
+
+def write_workbook(tables, fileobj, engine=None):
+    """Write each (artist, section, name, df) as a sheet of one workbook."""
+    engine = engine or excel_engine()
+    if engine is None:
+        raise RuntimeError("Excel export needs xlsxwriter or openpyxl installed")
+
+    with pd.ExcelWriter(fileobj, engine=engine) as writer:
+        for index, (artist, section, name, df) in enumerate(tables, start=1):
+            # Excel caps sheet names at 31 characters and forbids []:*?/\
+            sheet = re.sub(r'[\[\]:*?/\\]', '', f"{index:02d} {name}")[:31]
+            df.to_excel(writer, sheet_name=sheet, index=False)
+    return fileobj
+
+
+def export_tables(tables, fmt="zip"):
+    """Export tables into a spooled temp file rewound for reading."""
+    out = tempfile.SpooledTemporaryFile(max_size=SPOOL_LIMIT)
+    if fmt == "xlsx":
+        write_workbook(tables, out)
+    else:
+        write_csv_zip(tables, out)
+    out.seek(0)
+    return out
@@ -0,0 +1,85 @@
+# Post-launch stream decay forecasting. Exponential and power-law curves,
+# each with optional playlist-add bumps, are fitted by ordinary least squares
+# in log space, so a fit is one small lstsq solve.
+from functools import lru_cache
+
+import numpy as np
+
+from series import PRIMITIVES
+
+MODELS = ("exponential", "power law")
+
+
+def _design(days, model, bumps):
+    days = np.asarray(days, dtype=np.float64)
+    trend = days if model == "exponential" else np.log(days)
+    columns = [np.ones_like(days), trend]
+    # Each playlist add is a step up in log streams from that day onwards
+    columns += [(days >= bump).astype(np.float64) for bump in bumps]
+    return np.column_stack(columns)
+
+
+def _fit(days, streams, model, bumps):
+    X = _design(days, model, bumps)
+    y = np.log(np.maximum(streams, 1))
+    coef, _, rank, _ = np.linalg.lstsq(X, y, rcond=None)
+    residuals = y - X @ coef
+    dof = max(len(y) - rank, 1)
+    sigma = np.sqrt(residuals @ residuals / dof)
+    return coef, sigma, X
+
+
+@lru_cache(maxsize=128)
+def forecast_release(release, actuals, bumps=(), horizon=30, z=1.96, ahead=False):
+    """Fit the best decay curve to daily actuals and project to `horizon`.
+
+    `actuals` are daily streams from Day 1 onwards and `bumps` are the days
+    playlist adds landed; bumps after the last observed day can't be sized
+    yet and are ignored. With fewer than three days of actuals the planned
+    Week 1 curve, rescaled to the actuals level, fills in the missing days.
+    By default the result covers Days 1..horizon; with `ahead` it covers the
+    `horizon` days after the last observed one.
+    Results are cached per (release, actuals, bumps, horizon, ahead).
+    """
+    actuals = np.asarray(actuals, dtype=np.float64)
+    bumps = tuple(b for b in bumps if 1 < b <= (len(actuals) if ahead else horizon))
+    if len(actuals) < 3:
+        plan = np.asarray(PRIMITIVES["week1_daily_streams"], dtype=np.float64)
+        scale = actuals.mean() / plan[:len(actuals)].mean() if len(actuals) else 1.0
+        observed = np.concatenate([actuals, plan[len(actuals):] * scale])
+    else:
+        observed = actuals
+    days = np.arange(1, len(observed) + 1)
+    fit_bumps = tuple(b for b in bumps if b <= len(observed))
+
+    best = None
+    for model in MODELS:
+        coef, sigma, X = _fit(days, observed, model, fit_bumps)
+        if best is None or sigma < best[2]:
+            best = (model, coef, sigma, X)
+    model, coef, sigma, X = best
+
+    first = len(observed) + 1 if ahead else 1
+    future = np.arange(first, first + horizon)
+    X_future = _design(future, model, fit_bumps)
+    # Prediction interval in log space, widening away from the fitted days
+    XtX_inv = np.linalg.pinv(X.T @ X)
+    spread = sigma * np.sqrt(1 + np.einsum("ij,jk,ik->i", X_future, XtX_inv, X_future))
+    center = X_future @ coef
+    return {
+        "model": model,
+        "days": future,
+        "forecast": np.exp(center),
+        "lower": np.exp(center - z * spread),
+        "upper": np.exp(center + z * spread),
+        "observed_days": len(actuals),
+    }
+
+
+def forecast_history(release, history, horizon=30):
+    """Project the `horizon` days after a stored daily-streams history.
+
+    The history is taken as Day 1 onwards, so the fit covers every stored
+    day and the result never repeats days that have already happened.
+    """
+    return forecast_release(release, tuple(float(v) for v in history), horizon=horizon, ahead=True)
@@ -0,0 +1,83 @@
+# Channel → Spotify funnel built from per-day stage counts. Days are rows of
+# a preallocated cohort matrix and running totals are updated on every add,
+# so conversion rates cost the same however many days have been ingested.
+import csv
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+CHANNELS = ("YouTube", "Instagram", "TikTok", "Email")
+STAGES = ("Audience", "Engaged", "Link Clicks", "Spotify Listeners")
+
+# The funnel described on the Streaming Performance page (audit baseline)
+BASELINE_FUNNEL = [
+    (date(2026, 1, 15), "YouTube", "Audience", 849),
+    (date(2026, 1, 15), "YouTube", "Engaged", 142),
+    (date(2026, 1, 15), "YouTube", "Spotify Listeners", 2),
+]
+
+
+def read_funnel_rows(lines):
+    """Parse `date,channel,stage,count` CSV lines (header row required)."""
+    for row in csv.DictReader(lines):
+        try:
+            yield date.fromisoformat(row["date"]), row["channel"], row["stage"], int(row["count"])
+        except (KeyError, ValueError):
+            continue
+
+
+class FunnelEngine:
+    """Per-day, per-channel stage counts with incrementally kept totals."""
+
+    def __init__(self, capacity=128):
+        self.days = []
+        self.day_index = {}
+        self.cohorts = np.zeros((capacity, len(CHANNELS), len(STAGES)), dtype=np.int64)
+        self.totals = np.zeros((len(CHANNELS), len(STAGES)), dtype=np.int64)
+
+    def _row(self, day):
+        row = self.day_index.get(day)
+        if row is None:
+            row = len(self.days)
+            if row == len(self.cohorts):
+                # Double the capacity so appends stay amortised O(1)
+                self.cohorts = np.concatenate([self.cohorts, np.zeros_like(self.cohorts)])
+            self.days.append(day)
+            self.day_index[day] = row
+        return row
+
+    def add(self, day, channel, stage, count):
+        if channel not in CHANNELS or stage not in STAGES:
+            return
+        c, s = CHANNELS.index(channel), STAGES.index(stage)
+        self.cohorts[self._row(day), c, s] += count
+        self.totals[c, s] += count
+
+    def add_rows(self, rows):
+        for row in rows:
+            self.add(*row)
+
+    def conversion(self):
+        """Stage-to-stage conversion (%) per channel, plus overall.
+
+        Stages with no data for a channel are skipped, so each rate compares
+        a stage with the previous stage that was actually measured.
+        """
+        rates = {}
+        for c, channel in enumerate(CHANNELS):
+            measured = [(STAGES[s], self.totals[c, s]) for s in range(len(STAGES)) if self.totals[c, s] > 0]
+            if len(measured) < 2:
+                continue
+            steps = {
+                f"{a} → {b}": round(nb / na * 100, 2)
+                for (a, na), (b, nb) in zip(measured, measured[1:])
+            }
+            steps["Overall"] = round(measured[-1][1] / measured[0][1] * 100, 2)
+            rates[channel] = steps
+        return rates
+
+    def cohort_matrix(self, channel):
+        """Day × stage counts for one channel as a DataFrame."""
+        c = CHANNELS.index(channel)
+        return pd.DataFrame(self.cohorts[:len(self.days), c], index=self.days, columns=STAGES)
@@ -0,0 +1,119 @@
+# Launch-day stream tracking: hourly ring buffer plus event sources that can
+# be polled without rerunning the whole Age to Age section.
+import os
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+
+def naive_utc(timestamp):
+    """Aware timestamps converted to UTC and made naive; naive ones are taken as UTC."""
+    if timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class HourlyRingBuffer:
+    """Stream counts in fixed hourly buckets since `start`.
+
+    Only the last `hours` buckets are kept; counts that fall out of the
+    window, or arrive after their hour has left it, are folded into
+    `evicted` so cumulative totals stay exact. Late arrivals are also
+    counted in `late`, and events before `start` in `before_start`.
+    Timestamps may be naive (UTC) or timezone-aware.
+    """
+
+    def __init__(self, start, hours=24):
+        self.start = naive_utc(start)
+        self.hours = hours
+        self.counts = np.zeros(hours, dtype=np.int64)
+        self.latest = -1
+        self.evicted = 0
+        self.late = 0
+        self.before_start = 0
+
+    def add(self, timestamp, count=1):
+        hour = int((naive_utc(timestamp) - self.start).total_seconds() // 3600)
+        if hour < 0:
+            self.before_start += count
+            return
+        if hour <= self.latest - self.hours:
+            # Its bucket has already left the window; keep it in the running total
+            self.evicted += count
+            self.late += count
+            return
+        if hour > self.latest:
+            # Clear every slot the window slides past, at most one full lap
+            for h in range(max(self.latest + 1, hour - self.hours + 1), hour + 1):
+                slot = h % self.hours
+                self.evicted += int(self.counts[slot])
+                self.counts[slot] = 0
+            self.latest = hour
+        self.counts[hour % self.hours] += count
+
+    def extend(self, events):
+        for timestamp, count in events:
+            self.add(timestamp, count)
+
+    def hourly(self):
+        """Return (hour index, count) arrays for the buckets in the window."""
+        if self.latest < 0:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        first = max(0, self.latest - self.hours + 1)
+        hours = np.arange(first, self.latest + 1)
+        return hours, self.counts[hours % self.hours]
+
+    def cumulative(self):
+        """Return (hours since launch, cumulative streams) at each bucket end."""
+        hours, counts = self.hourly()
+        return hours + 1, self.evicted + np.cumsum(counts)
+
+
+class EventFileTail:
+    """Tail an exported `timestamp,count` event file from the last offset."""
+
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+
+    def poll(self):
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            chunk = f.read()
+        # Leave any half-written last line for the next poll
+        end = chunk.rfind(b"\n") + 1
+        events = []
+        for line in chunk[:end].decode("utf-8", errors="ignore").splitlines():
+            parts = line.strip().split(",")
+            try:
+                timestamp = naive_utc(datetime.fromisoformat(parts[0]))
+                count = int(parts[1]) if len(parts) > 1 and parts[1] else 1
+            except (ValueError, IndexError):
+                continue  # header or malformed row
+            events.append((timestamp, count))
+        # Only move past the chunk once it has been parsed, so a failed poll is retried
+        self.offset += end
+        return events
+
+
+class SimulatedStreamSource:
+    """Local stand-in for a streaming analytics feed.
+
+    Each poll advances a simulated clock by `minutes_per_poll` and returns
+    per-minute Poisson stream counts around `streams_per_hour`.
+    """
+
+    def __init__(self, start, streams_per_hour=40, minutes_per_poll=30, seed=None):
+        self.clock = start
+        self.streams_per_hour = streams_per_hour
+        self.minutes_per_poll = minutes_per_poll
+        self.rng = np.random.default_rng(seed)
+
+    def poll(self):
+        counts = self.rng.poisson(self.streams_per_hour / 60, self.minutes_per_poll)
+        minutes = np.flatnonzero(counts)
+        events = [(self.clock + timedelta(minutes=int(m)), int(counts[m])) for m in minutes]
+        self.clock += timedelta(minutes=self.minutes_per_poll)
+        return events
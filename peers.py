@@ -0,0 +1,88 @@
+# Peer-artist benchmarks. Each metric is kept as its own sorted column, so
+# percentile rank, median gap and nearest peers are binary searches rather
+# than scans over the peer set.
+import numpy as np
+import pandas as pd
+
+
+def gap_labels(current, reference):
+    """'x% below' / 'x% above' labels for current values against a reference."""
+    current = np.asarray(current, dtype=np.float64)
+    reference = np.asarray(reference, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gap = np.where(reference > 0, (current - reference) / reference * 100, 0.0)
+    direction = np.where(gap < 0, "below", "above")
+    return [f"{abs(g):.1f}".rstrip("0").rstrip(".") + f"% {d}" for g, d in zip(gap, direction)]
+
+
+class PeerIndex:
+    """Sorted columnar index over a peer-artist dataset.
+
+    `peers` is a DataFrame with an 'Artist' column and one numeric column
+    per metric (e.g. 'Monthly Listeners').
+    """
+
+    def __init__(self, peers):
+        self.names = peers['Artist'].to_numpy()
+        self.metrics = [c for c in peers.columns if c != 'Artist' and pd.api.types.is_numeric_dtype(peers[c])]
+        self.order = {}
+        self.sorted = {}
+        for metric in self.metrics:
+            values = peers[metric].to_numpy(dtype=np.float64)
+            order = np.argsort(values, kind="stable")
+            self.order[metric] = order
+            self.sorted[metric] = values[order]
+
+    def __len__(self):
+        return len(self.names)
+
+    def percentile(self, metric, value):
+        """Share of peers below `value` (ties count half), 0-100."""
+        column = self.sorted[metric]
+        below = np.searchsorted(column, value, side="left")
+        at_or_below = np.searchsorted(column, value, side="right")
+        return (below + at_or_below) / 2 / len(column) * 100
+
+    def median(self, metric):
+        column = self.sorted[metric]
+        mid = len(column) // 2
+        return column[mid] if len(column) % 2 else (column[mid - 1] + column[mid]) / 2
+
+    def gap_to_median(self, metric, value):
+        return value - self.median(metric)
+
+    def nearest(self, metric, value, k=5):
+        """The k peers closest to `value` on a log scale, nearest first."""
+        column = self.sorted[metric]
+        target = np.log1p(value)
+        pos = np.searchsorted(column, value)
+        lo, hi = pos - 1, pos
+        picked = []
+        # Walk outwards from the insertion point, taking the closer side each step
+        while len(picked) < k and (lo >= 0 or hi < len(column)):
+            take_lo = hi >= len(column) or (
+                lo >= 0 and target - np.log1p(column[lo]) <= np.log1p(column[hi]) - target
+            )
+            if take_lo:
+                picked.append(lo)
+                lo -= 1
+            else:
+                picked.append(hi)
+                hi += 1
+        rows = self.order[metric][picked]
+        return pd.DataFrame({'Artist': self.names[rows], metric: column[picked]})
+
+
+def load_peers(lines):
+    """Read a peer dataset CSV (Artist column plus numeric metric columns).
+
+    Raises ValueError if the file can't be read or has no 'Artist' column or
+    no numeric metrics.
+    """
+    peers = pd.read_csv(lines)
+    if 'Artist' not in peers.columns:
+        raise ValueError("peer file needs an 'Artist' column")
+    index = PeerIndex(peers)
+    if not index.metrics:
+        raise ValueError("peer file has no numeric metric columns")
+    return index
@@ -0,0 +1,84 @@
+# Per-platform engagement histograms over the 168 weekday-hour cells of a
+# week. Posts are added in O(1) and recommendations only ever look at 168
+# cells, however many years of history have been ingested.
+import numpy as np
+
+from calendar_engine import WEEKDAYS
+
+
+class PostingTimeIndex:
+    """Sum and count of post engagement per platform, weekday and hour."""
+
+    def __init__(self, platforms, prior_weight=3.0):
+        self.platforms = list(platforms)
+        self.index = {p: i for i, p in enumerate(self.platforms)}
+        self.sums = np.zeros((len(self.platforms), 7, 24))
+        self.counts = np.zeros((len(self.platforms), 7, 24))
+        self.prior_weight = prior_weight
+
+    def add(self, platform, timestamp, engagement):
+        p = self.index.get(platform)
+        if p is None:
+            return
+        self.sums[p, timestamp.weekday(), timestamp.hour] += engagement
+        self.counts[p, timestamp.weekday(), timestamp.hour] += 1
+
+    def add_events(self, events):
+        """Ingest engagement events (see engagement.read_events) as posts."""
+        for event in events:
+            engagement = event.get("likes", 0) + event.get("comments", 0) + event.get("shares", 0)
+            self.add(event["platform"], event["timestamp"], engagement)
+
+    def expected(self, platform):
+        """Expected engagement per weekday-hour, shrunk towards the platform mean.
+
+        Cells with few posts are pulled towards the overall average so one
+        lucky post doesn't win a slot.
+        """
+        p = self.index[platform]
+        total = self.counts[p].sum()
+        mean = self.sums[p].sum() / total if total else 0.0
+        return (self.sums[p] + self.prior_weight * mean) / (self.counts[p] + self.prior_weight)
+
+    def recommend(self, platform, k=3, min_posts=1):
+        """Top-k (weekday, hour, expected engagement) slots for a platform.
+
+        Only cells with at least `min_posts` posts are ranked, so a slot
+        nobody has posted in is never recommended; with too little data
+        fewer than k slots come back.
+        """
+        counts = self.counts[self.index[platform]].ravel()
+        cells = np.flatnonzero(counts >= min_posts)
+        if not len(cells):
+            return []
+        expected = self.expected(platform).ravel()[cells]
+        top = np.argsort(-expected, kind="stable")[:k]
+        return [(int(cells[i] // 24), int(cells[i] % 24), float(expected[i])) for i in top]
+
+
+def _clock(hour):
+    return f"{(hour - 1) % 12 + 1}{'am' if hour % 24 < 12 else 'pm'}"
+
+
+def _hour_range(hour):
+    """'6-7pm', or '11am-12pm' / '11pm-12am' when the hour crosses a meridiem."""
+    start, end = _clock(hour), _clock(hour + 1)
+    return f"{start[:-2]}-{end}" if start[-2:] == end[-2:] else f"{start}-{end}"
+
+
+def best_cells(slots):
+    """(weekday, hour) cells of recommended slots, for calendar_engine.build_slots."""
+    return [(day, hour) for day, hour, _ in slots]
+
+
+def format_best_time(slots):
+    """Render recommended slots in the schedule's 'Best Time' style.
+
+    Each slot keeps its own day: 'Monday 6-7pm & 8-9pm, Friday 7-8pm'.
+    """
+    if not slots:
+        return "Not enough data"
+    by_day = {}
+    for day, hour in sorted(best_cells(slots)):
+        by_day.setdefault(day, []).append(_hour_range(hour))
+    return ", ".join(f"{WEEKDAYS[day].title()} {' & '.join(hours)}" for day, hours in by_day.items())
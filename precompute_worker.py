@@ -0,0 +1,117 @@
+# Background worker that recomputes expensive projections whenever new data
+# lands in the warehouse and publishes them as versioned artifacts. The
+# dashboard only ever reads the latest artifact, never computes it.
+#
+#     python precompute_worker.py            # watch and recompute
+#     python precompute_worker.py --once     # one pass, then exit
+import argparse
+import os
+import pickle
+import sqlite3
+import time
+
+from audit_tables import ARTIST_TABLES
+from email_sim import LEAD_MAGNETS, simulate_list
+from forecast import forecast_history
+from warehouse import DEFAULT_PATH, Warehouse
+
+# Kept apart from the warehouse so publishing never looks like new data
+ARTIFACTS_PATH = os.environ.get("ARTIFACTS_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "artifacts.db"))
+
+ARTIFACT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    name TEXT NOT NULL,
+    artist TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (name, artist, version)
+) WITHOUT ROWID;
+"""
+
+
+class ArtifactStore:
+    """Versioned, pickled results shared between the worker and dashboards."""
+
+    def __init__(self, path=ARTIFACTS_PATH):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(ARTIFACT_SCHEMA)
+
+    def publish(self, name, artist, payload, keep=5):
+        with self.conn:
+            row = self.conn.execute(
+                "SELECT MAX(version) FROM artifacts WHERE name = ? AND artist = ?", (name, artist)
+            ).fetchone()
+            version = (row[0] or 0) + 1
+            self.conn.execute(
+                "INSERT INTO artifacts VALUES (?, ?, ?, ?, ?)",
+                (name, artist, version, time.time(), pickle.dumps(payload))
+            )
+            self.conn.execute(
+                "DELETE FROM artifacts WHERE name = ? AND artist = ? AND version <= ?",
+                (name, artist, version - keep)
+            )
+        return version
+
+    def latest(self, name, artist):
+        """(version, created_at, payload) of the newest artifact, or None."""
+        row = self.conn.execute(
+            "SELECT version, created_at, payload FROM artifacts WHERE name = ? AND artist = ? "
+            "ORDER BY version DESC LIMIT 1",
+            (name, artist)
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1], pickle.loads(row[2])
+
+
+def compute_artifacts(warehouse, artist):
+    """Every precomputed projection for one artist: {artifact name: payload}."""
+    artifacts = {
+        "email_projection": simulate_list(list(LEAD_MAGNETS), months=3, draws=20000),
+    }
+    streams = warehouse.query(
+        "metric_series", artist=artist, platform="Spotify", metric="streams", start="2000-01-01", end="2100-01-01"
+    )
+    if streams:
+        artifacts["stream_forecast"] = forecast_history(artist, [value for _, value in streams])
+    return artifacts
+
+
+def run_once(warehouse, store, artists):
+    for artist in artists:
+        for name, payload in compute_artifacts(warehouse, artist).items():
+            version = store.publish(name, artist, payload)
+            print(f"{artist}: published {name} v{version}", flush=True)
+
+
+def watch(path, artifacts_path=ARTIFACTS_PATH, interval=5.0, once=False):
+    warehouse = Warehouse(path)
+    store = ArtifactStore(artifacts_path)
+    # data_version changes whenever another connection commits to the file
+    watcher = sqlite3.connect(path)
+    last_seen = None
+    while True:
+        version = watcher.execute("PRAGMA data_version").fetchone()[0]
+        if version != last_seen:
+            last_seen = version
+            warehouse.cache.clear()
+            artists = list(ARTIST_TABLES) + [
+                name for (name,) in warehouse.conn.execute("SELECT name FROM artists")
+                if name not in ARTIST_TABLES
+            ]
+            run_once(warehouse, store, artists)
+        if once:
+            return
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute dashboard projections when new data lands.")
+    parser.add_argument("--db", default=DEFAULT_PATH, help="warehouse database path")
+    parser.add_argument("--artifacts", default=ARTIFACTS_PATH, help="artifact database path")
+    parser.add_argument("--interval", type=float, default=5.0, help="seconds between checks for new data")
+    parser.add_argument("--once", action="store_true", help="run a single pass and exit")
+    args = parser.parse_args()
+    watch(args.db, args.artifacts, args.interval, args.once)
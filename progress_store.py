@@ -0,0 +1,134 @@
+# Persistent checklist progress in a local SQLite database (WAL mode).
+# Current state lives in one row per (artist, checklist, task), so completion
+# is a single primary-key range query however long the change history gets.
+import atexit
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_PATH = os.environ.get("PROGRESS_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "progress.db"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS task_progress (
+    artist TEXT NOT NULL,
+    checklist TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (artist, checklist, task_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS task_history (
+    artist TEXT NOT NULL,
+    checklist TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    done INTEGER NOT NULL,
+    changed_at REAL NOT NULL
+);
+"""
+
+
+class ProgressStore:
+    """Per-artist, per-task checklist state with batched writes.
+
+    `set_done` only queues a change. Queued changes are written in one
+    transaction by `flush`, which runs once `batch_size` changes are waiting
+    or `flush_after` seconds after the first change of a batch, whichever
+    comes first. Reads merge in the queued changes, so they never force a
+    write.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, batch_size=50, flush_after=5.0):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.batch_size = batch_size
+        self.flush_after = flush_after
+        self.timer = None
+        self.registered = set()
+        atexit.register(self.flush)
+
+    def register(self, artist, checklist, task_ids):
+        """Make sure every task in a checklist has a row (not done by default).
+
+        Tasks already registered by this store are skipped without touching
+        the database, so calling this on every rerun is free.
+        """
+        with self.lock:
+            missing = [key for key in ((artist, checklist, task_id) for task_id in task_ids) if key not in self.registered]
+            if not missing:
+                return
+            now = time.time()
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO task_progress (artist, checklist, task_id, done, updated_at) VALUES (?, ?, ?, 0, ?)",
+                    [(*key, now) for key in missing]
+                )
+            self.registered.update(missing)
+
+    def set_done(self, artist, checklist, task_id, done):
+        with self.lock:
+            self.pending[(artist, checklist, task_id)] = int(done)
+            full = len(self.pending) >= self.batch_size
+            if not full and self.timer is None:
+                self.timer = threading.Timer(self.flush_after, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+        if full:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if not self.pending:
+                return
+            now = time.time()
+            rows = [(*key, done, now) for key, done in self.pending.items()]
+            self.pending = {}
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT INTO task_progress (artist, checklist, task_id, done, updated_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (artist, checklist, task_id) DO UPDATE SET done = excluded.done, updated_at = excluded.updated_at",
+                    rows
+                )
+                self.conn.executemany("INSERT INTO task_history VALUES (?, ?, ?, ?, ?)", rows)
+
+    def state(self, artist, checklist):
+        """{task_id: done} for one checklist, including unflushed changes."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT task_id, done FROM task_progress WHERE artist = ? AND checklist = ?",
+                (artist, checklist)
+            ).fetchall()
+            state = {task_id: bool(done) for task_id, done in rows}
+            state.update({k[2]: bool(v) for k, v in self.pending.items() if k[:2] == (artist, checklist)})
+        return state
+
+    def completion(self, artist):
+        """{checklist: (done, total)} for an artist in one indexed query, plus queued changes."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT checklist, SUM(done), COUNT(*) FROM task_progress WHERE artist = ? GROUP BY checklist",
+                (artist,)
+            ).fetchall()
+            completion = {checklist: [done, total] for checklist, done, total in rows}
+            for (pending_artist, checklist, task_id), done in self.pending.items():
+                if pending_artist != artist:
+                    continue
+                stored = self.conn.execute(
+                    "SELECT done FROM task_progress WHERE artist = ? AND checklist = ? AND task_id = ?",
+                    (artist, checklist, task_id)
+                ).fetchone()
+                counts = completion.setdefault(checklist, [0, 0])
+                if stored is None:
+                    counts[0] += done
+                    counts[1] += 1
+                else:
+                    counts[0] += done - stored[0]
+        return {checklist: tuple(counts) for checklist, counts in completion.items()}
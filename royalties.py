@@ -0,0 +1,144 @@
+# Streaming royalty estimates. Streams are held as a dense (day × platform ×
+# country) array and rates as a (platform × country) table, so revenue for
+# any span of days is one broadcasted multiply and a sum.
+import csv
+import threading
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+PLATFORMS = ("Spotify", "Apple Music", "YouTube Music", "TIDAL", "Amazon Music", "Deezer")
+COUNTRIES = ("GB", "NG", "US", "Other")
+
+# Approximate gross payout per stream (£), before any distributor share.
+# Replace with the rates on your distributor statements via read_rate_table.
+DEFAULT_RATES = np.array([
+    # GB      NG      US      Other
+    [0.0028, 0.0004, 0.0032, 0.0018],  # Spotify
+    [0.0055, 0.0012, 0.0060, 0.0040],  # Apple Music
+    [0.0014, 0.0003, 0.0016, 0.0010],  # YouTube Music
+    [0.0090, 0.0020, 0.0100, 0.0070],  # TIDAL
+    [0.0030, 0.0008, 0.0035, 0.0025],  # Amazon Music
+    [0.0040, 0.0008, 0.0045, 0.0030],  # Deezer
+])
+
+# Listener geography assumed until country-level streams are loaded
+DEFAULT_COUNTRY_MIX = {"GB": 0.6, "NG": 0.2, "US": 0.1, "Other": 0.1}
+
+
+def _country(code):
+    code = str(code).strip().upper()
+    return "GB" if code == "UK" else code if code in COUNTRIES else "Other"
+
+
+def read_rate_table(lines, base=DEFAULT_RATES):
+    """Override rates from `platform,country,rate` CSV lines; unknown rows are skipped."""
+    rates = base.copy()
+    for row in csv.DictReader(lines):
+        try:
+            rates[PLATFORMS.index(row["platform"]), COUNTRIES.index(_country(row["country"]))] = float(row["rate"])
+        except (KeyError, ValueError):
+            continue
+    return rates
+
+
+def read_stream_rows(lines):
+    """Parse `date,platform,country,streams` CSV lines (distributor exports)."""
+    for row in csv.DictReader(lines):
+        try:
+            yield date.fromisoformat(row["date"]), row["platform"], _country(row["country"]), float(row["streams"])
+        except (KeyError, ValueError):
+            continue
+
+
+def blended_rate(platform_mix, country_mix=DEFAULT_COUNTRY_MIX, rates=DEFAULT_RATES, payout_share=1.0):
+    """Average £ per stream for a platform mix {platform: weight} and country mix."""
+    p = np.array([platform_mix.get(name, 0) for name in PLATFORMS], dtype=np.float64)
+    c = np.array([country_mix.get(name, 0) for name in COUNTRIES], dtype=np.float64)
+    return float(p @ rates @ c / (p.sum() * c.sum())) * payout_share
+
+
+class RoyaltyEngine:
+    """Daily streams per platform and country with revenue and ROI series."""
+
+    def __init__(self, rates=DEFAULT_RATES, payout_share=1.0, capacity=366):
+        self.rates = rates
+        self.payout_share = payout_share
+        self.days = []
+        self.day_index = {}
+        self.streams = np.zeros((capacity, len(PLATFORMS), len(COUNTRIES)))
+        self.sources = set()
+        self.rates_source = None
+        self.lock = threading.Lock()
+
+    def _row(self, day):
+        row = self.day_index.get(day)
+        if row is None:
+            row = len(self.days)
+            if row == len(self.streams):
+                # Double the capacity so appends stay amortised O(1)
+                self.streams = np.concatenate([self.streams, np.zeros_like(self.streams)])
+            self.days.append(day)
+            self.day_index[day] = row
+        return row
+
+    def add_rows(self, rows, source=None):
+        """rows: (date, platform, country, streams); each source (a file digest) is added once."""
+        rows = list(rows)
+        with self.lock:
+            if source is not None:
+                if source in self.sources:
+                    return
+                self.sources.add(source)
+            for day, platform, country, streams in rows:
+                if platform in PLATFORMS:
+                    # _row may reallocate self.streams, so look the row up before indexing
+                    row = self._row(day)
+                    self.streams[row, PLATFORMS.index(platform), COUNTRIES.index(country)] += streams
+
+    def set_rates(self, rates, source=None):
+        """Replace the rate table; re-applying the table already in use is a no-op.
+
+        Rate tables replace each other rather than add up, so `source` is
+        compared with the current table's source only, not with `sources`.
+        """
+        with self.lock:
+            if source is not None and source == self.rates_source:
+                return
+            self.rates = rates
+            self.rates_source = source
+
+    def __bool__(self):
+        return bool(self.days)
+
+    def _ordered(self):
+        with self.lock:
+            order = np.argsort(np.array(self.days, dtype="datetime64[D]"))
+            return [self.days[i] for i in order], self.streams[:len(self.days)][order]
+
+    def daily_revenue(self):
+        """£ per day and platform, days in date order."""
+        days, streams = self._ordered()
+        revenue = np.einsum("dpc,pc->dp", streams, self.rates) * self.payout_share
+        return pd.DataFrame(revenue, index=pd.to_datetime(days), columns=list(PLATFORMS))
+
+    def total_revenue(self):
+        return float(np.einsum("dpc,pc->", self.streams[:len(self.days)], self.rates)) * self.payout_share
+
+    def country_mix(self):
+        """Measured share of streams per country."""
+        totals = self.streams[:len(self.days)].sum(axis=(0, 1))
+        return dict(zip(COUNTRIES, totals / totals.sum())) if totals.sum() else dict(DEFAULT_COUNTRY_MIX)
+
+    def roi(self, daily_spend):
+        """Cumulative revenue, spend and ROI (%) per day; `daily_spend` is a Series indexed by day."""
+        revenue = self.daily_revenue().sum(axis=1)
+        spend = daily_spend.groupby(level=0).sum()
+        index = revenue.index.union(spend.index)
+        table = pd.DataFrame({
+            'Revenue': revenue.reindex(index, fill_value=0).cumsum(),
+            'Spend': spend.reindex(index, fill_value=0).cumsum(),
+        })
+        table['ROI'] = (table['Revenue'] - table['Spend']) / table['Spend'].where(table['Spend'] > 0) * 100
+        return table
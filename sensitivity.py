@@ -0,0 +1,144 @@
+# One-way and two-way sensitivity of the plan's launch maths. Every point of
+# every sweep is a row of one parameter matrix, evaluated in a single
+# vectorised call; results are memoised per set of assumption ranges.
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+
+def _email_presaves(p):
+    return p["subscribers"] * p["open_rate"] * p["click_rate"]
+
+
+def _day1_streams(p):
+    return (
+        p["subscribers"] * p["open_rate"] * p["click_rate"]
+        + p["presaves"] * p["autoplay"]
+        + p["social_streams"]
+        + p["word_of_mouth"]
+        + p["launch_budget"] / p["cost_per_stream"]
+    )
+
+
+# Models and their assumptions: name -> (label, base, low, high). Bases are
+# the figures used in the audit text; ranges are the ones it quotes.
+MODELS = {
+    "email_presaves": {
+        "label": "Email launch pre-saves",
+        "fn": _email_presaves,
+        "assumptions": {
+            "subscribers": ("Email subscribers", 100, 50, 200),
+            "open_rate": ("Open rate", 0.30, 0.20, 0.40),
+            "click_rate": ("Click rate (of opens)", 0.50, 0.20, 0.60),
+        },
+    },
+    "day1_streams": {
+        "label": "Day 1 streams",
+        "fn": _day1_streams,
+        "assumptions": {
+            "subscribers": ("Email subscribers", 50, 25, 100),
+            "open_rate": ("Open rate", 0.30, 0.20, 0.40),
+            "click_rate": ("Stream rate (of opens)", 0.50, 0.30, 0.60),
+            "presaves": ("Pre-saves", 50, 25, 100),
+            "autoplay": ("Pre-save auto-play rate", 0.80, 0.60, 0.90),
+            "social_streams": ("Social media streams", 150, 100, 200),
+            "word_of_mouth": ("Word-of-mouth streams", 75, 50, 100),
+            "launch_budget": ("Launch day ad budget (£)", 30, 0, 60),
+            "cost_per_stream": ("Paid cost per stream (£)", 0.055, 0.04, 0.07),
+        },
+    },
+}
+
+
+def _spec(model, overrides):
+    """Hashable (name, base, low, high) tuple with any overridden ranges applied."""
+    spec = []
+    for name, (_, base, low, high) in MODELS[model]["assumptions"].items():
+        base, low, high = (overrides or {}).get(name, (base, low, high))
+        spec.append((name, float(base), float(low), float(high)))
+    return tuple(spec)
+
+
+def _evaluate(model, spec, matrix):
+    return MODELS[model]["fn"]({name: matrix[:, i] for i, (name, *_) in enumerate(spec)})
+
+
+@lru_cache(maxsize=256)
+def _one_way(model, spec, points):
+    names = [s[0] for s in spec]
+    base = np.array([s[1] for s in spec])
+    # Row block i varies assumption i across its range; the others stay at base
+    matrix = np.tile(base, (len(spec) * points, 1))
+    for i, (_, _, low, high) in enumerate(spec):
+        matrix[i * points:(i + 1) * points, i] = np.linspace(low, high, points)
+    output = _evaluate(model, spec, matrix)
+    return pd.DataFrame({
+        'Assumption': np.repeat(names, points),
+        'Value': matrix[np.arange(len(matrix)), np.repeat(np.arange(len(spec)), points)],
+        'Output': output,
+    })
+
+
+def one_way(model, overrides=None, points=21):
+    """Output as each assumption moves across its range, others at base."""
+    return _one_way(model, _spec(model, overrides), points).copy()
+
+
+def base_output(model, overrides=None):
+    spec = _spec(model, overrides)
+    return float(_evaluate(model, spec, np.array([[s[1] for s in spec]]))[0])
+
+
+def tornado(model, overrides=None, points=21):
+    """Lowest and highest output per assumption, smallest swing first (tornado order)."""
+    sweeps = _one_way(model, _spec(model, overrides), points)
+    labels = {name: spec[0] for name, spec in MODELS[model]["assumptions"].items()}
+    table = sweeps.groupby('Assumption', sort=False)['Output'].agg(Low='min', High='max').reset_index()
+    table['Swing'] = table['High'] - table['Low']
+    table['Assumption'] = table['Assumption'].map(labels)
+    return table.sort_values('Swing').reset_index(drop=True)
+
+
+def tornado_figure(model, title, xaxis_title, overrides=None, height=400):
+    """Tornado chart: low/high bars per assumption around the base output."""
+    base = base_output(model, overrides)
+    table = tornado(model, overrides)
+    fig = go.Figure()
+    for name, column, color in (('Low end', 'Low', '#dc3545'), ('High end', 'High', '#28a745')):
+        fig.add_trace(go.Bar(
+            name=name,
+            y=table['Assumption'],
+            x=table[column] - base,
+            base=base,
+            orientation='h',
+            marker_color=color
+        ))
+    fig.update_layout(
+        title=f"{title} (base: {base:,.0f})",
+        barmode='overlay',
+        xaxis_title=xaxis_title,
+        height=height
+    )
+    return fig
+
+
+@lru_cache(maxsize=256)
+def _two_way(model, spec, x, y, points):
+    names = [s[0] for s in spec]
+    ranges = {s[0]: s[2:] for s in spec}
+    xs, ys = np.linspace(*ranges[x], points), np.linspace(*ranges[y], points)
+    grid_x, grid_y = np.meshgrid(xs, ys)
+    matrix = np.tile([s[1] for s in spec], (points * points, 1))
+    matrix[:, names.index(x)] = grid_x.ravel()
+    matrix[:, names.index(y)] = grid_y.ravel()
+    z = _evaluate(model, spec, matrix).reshape(points, points)
+    for arr in (xs, ys, z):
+        arr.setflags(write=False)
+    return xs, ys, z
+
+
+def heatmap(model, x, y, overrides=None, points=25):
+    """(x values, y values, output grid[y, x]) sweeping two assumptions together."""
+    return _two_way(model, _spec(model, overrides), x, y, points)
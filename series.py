@@ -0,0 +1,60 @@
+# Primitive chart series plus derived series computed from them, so totals
+# and ratios can never drift from the numbers they are built on. Derived
+# results are memoised on the raw bytes of their inputs.
+from functools import lru_cache
+
+import numpy as np
+
+# The only hand-typed series; everything cumulative or relative is derived
+PRIMITIVES = {
+    "listener_targets": [2, 15, 50, 500],
+    "email_subscriber_targets": [0, 30, 70, 100],
+    "week1_daily_streams": [600, 250, 200, 175, 125, 125, 175],
+    # Launch day streams added in each 3-hour block (hours 0, 3, ..., 24)
+    "launch_conservative_3h": [0, 50, 100, 150, 150, 100, 100, 100, 100],
+    "launch_optimistic_3h": [0, 100, 150, 200, 200, 200, 200, 200, 250],
+}
+
+
+def _key(values):
+    arr = np.asarray(values)
+    dtype = "int64" if np.issubdtype(arr.dtype, np.integer) else "float64"
+    return np.ascontiguousarray(arr, dtype=dtype).tobytes(), dtype
+
+
+@lru_cache(maxsize=512)
+def _derive(kind, data, dtype, arg=None, other=None):
+    x = np.frombuffer(data, dtype=dtype)
+    if kind == "cumulative":
+        out = np.cumsum(x)
+    elif kind == "rolling":
+        # Trailing mean over up to `arg` points, shorter at the start
+        sums = np.cumsum(np.concatenate([[0], x.astype(np.float64)]))
+        counts = np.minimum(np.arange(1, len(x) + 1), arg)
+        out = (sums[1:] - sums[np.maximum(np.arange(1, len(x) + 1) - arg, 0)]) / counts
+    elif kind == "ratio":
+        y = np.frombuffer(other[0], dtype=other[1]).astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = np.where(y != 0, x / y, np.nan)
+    elif kind == "pct_of_target":
+        out = x.astype(np.float64) / arg * 100
+    else:
+        raise ValueError(f"Unknown derived series: {kind}")
+    out.setflags(write=False)
+    return out
+
+
+def cumulative_series(values):
+    return _derive("cumulative", *_key(values))
+
+
+def rolling_series(values, window):
+    return _derive("rolling", *_key(values), arg=window)
+
+
+def ratio_series(numerator, denominator):
+    return _derive("ratio", *_key(numerator), other=_key(denominator))
+
+
+def pct_of_target(values, target):
+    return _derive("pct_of_target", *_key(values), arg=float(target))
@@ -0,0 +1,208 @@
+# Self-hosted smart links. Short links resolve from an in-memory dict, clicks
+# are queued and written to SQLite in batches by a background thread, and the
+# dashboard reads per-link counts and new clicks straight from the database.
+#
+#     python smart_links.py add stream https://open.spotify.com/... --channel Instagram
+#     python smart_links.py serve --port 8080
+import argparse
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+DEFAULT_PATH = os.environ.get("LINKS_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "links.db"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (
+    slug TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    label TEXT NOT NULL DEFAULT ''
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS clicks (
+    click_id INTEGER PRIMARY KEY,
+    clicked_at REAL NOT NULL,
+    slug TEXT NOT NULL,
+    visitor TEXT NOT NULL,
+    channel TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS clicks_by_slug ON clicks (slug, clicked_at);
+"""
+
+VISITOR_COOKIE = "jg_visitor"
+
+
+class LinkStore:
+    """Links and their click log in a local SQLite file (WAL mode)."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.lock = threading.Lock()
+
+    def add_link(self, slug, url, channel, label=""):
+        with self.lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO links VALUES (?, ?, ?, ?)", (slug, url, channel, label))
+
+    def table(self):
+        """{slug: (url, channel)} for the redirect server."""
+        with self.lock:
+            return {slug: (url, channel) for slug, url, channel in self.conn.execute("SELECT slug, url, channel FROM links")}
+
+    def log_clicks(self, rows):
+        """rows: (clicked_at, slug, visitor, channel)."""
+        with self.lock, self.conn:
+            self.conn.executemany("INSERT INTO clicks (clicked_at, slug, visitor, channel) VALUES (?, ?, ?, ?)", rows)
+
+    def counts(self):
+        """(slug, label, channel, url, clicks) for every link, most clicked first."""
+        with self.lock:
+            return self.conn.execute(
+                "SELECT l.slug, l.label, l.channel, l.url, COUNT(c.click_id) AS n FROM links l "
+                "LEFT JOIN clicks c ON c.slug = l.slug GROUP BY l.slug ORDER BY n DESC"
+            ).fetchall()
+
+    def clicks_after(self, click_id=0):
+        """Clicks logged after `click_id` and the new high-water id.
+
+        Click ids only grow, so a reader that keeps the returned id never
+        sees a click twice or misses one written late by the batch logger.
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT click_id, clicked_at, visitor, channel FROM clicks WHERE click_id > ? ORDER BY click_id",
+                (click_id,)
+            ).fetchall()
+        return [row[1:] for row in rows], (rows[-1][0] if rows else click_id)
+
+
+def daily_click_rows(clicks, channels=()):
+    """(date, channel, 'Link Clicks', count) funnel rows from (clicked_at, visitor, channel) clicks.
+
+    Days are UTC days. Channel names matching one of `channels` apart from
+    case (e.g. utm_source=instagram) are given that spelling; any others
+    are passed through unchanged for the caller to report.
+    """
+    canonical = {c.lower(): c for c in channels}
+    counts = {}
+    for clicked_at, _, channel in clicks:
+        day = datetime.fromtimestamp(clicked_at, timezone.utc).date()
+        key = (day, canonical.get(channel.strip().lower(), channel))
+        counts[key] = counts.get(key, 0) + 1
+    return [(day, channel, "Link Clicks", n) for (day, channel), n in counts.items()]
+
+
+class ClickLogger:
+    """Background writer: clicks are queued by request threads and written in batches.
+
+    Between batches it also reloads the link table whenever another process
+    has committed to the database (e.g. a link added from the CLI).
+    """
+
+    def __init__(self, store, on_links_changed, batch_size=200, interval=1.0):
+        self.store = store
+        self.on_links_changed = on_links_changed
+        self.batch_size = batch_size
+        self.interval = interval
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="click-logger", daemon=True)
+        self.stopping = threading.Event()
+        self.thread.start()
+
+    def log(self, clicked_at, slug, visitor, channel):
+        self.queue.put((clicked_at, slug, visitor, channel))
+
+    def _run(self):
+        last_version = None
+        while not (self.stopping.is_set() and self.queue.empty()):
+            batch = []
+            deadline = time.monotonic() + self.interval
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            if batch:
+                self.store.log_clicks(batch)
+            with self.store.lock:
+                version = self.store.conn.execute("PRAGMA data_version").fetchone()[0]
+            if version != last_version:
+                last_version = version
+                self.on_links_changed(self.store.table())
+
+    def close(self):
+        self.stopping.set()
+        self.thread.join()
+
+
+class RedirectHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        target = self.server.links.get(parts.path.strip("/"))
+        if target is None:
+            self.send_error(404, "Unknown link")
+            return
+        url, channel = target
+        # ?utm_source= on the short link overrides the link's own channel
+        channel = parse_qs(parts.query).get("utm_source", [channel])[0]
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        visitor = cookie[VISITOR_COOKIE].value if VISITOR_COOKIE in cookie else uuid.uuid4().hex
+        self.server.logger.log(time.time(), parts.path.strip("/"), visitor, channel)
+
+        self.send_response(302)
+        self.send_header("Location", url)
+        self.send_header("Set-Cookie", f"{VISITOR_COOKIE}={visitor}; Max-Age=31536000; Path=/; SameSite=Lax")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host="0.0.0.0", port=8080, path=DEFAULT_PATH):
+    store = LinkStore(path)
+    server = ThreadingHTTPServer((host, port), RedirectHandler)
+    server.links = store.table()
+
+    def swap(links):
+        # Replace the dict wholesale so request threads never see a partial update
+        server.links = links
+
+    server.logger = ClickLogger(store, swap)
+    print(f"Serving {len(server.links)} links on http://{host}:{port}/", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.logger.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Smart-link redirect service with click logging.")
+    parser.add_argument("--db", default=DEFAULT_PATH, help="link database path")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add = commands.add_parser("add", help="create or update a short link")
+    add.add_argument("slug")
+    add.add_argument("url")
+    add.add_argument("--channel", required=True, help="channel the link is shared on, e.g. Instagram")
+    add.add_argument("--label", default="")
+    run = commands.add_parser("serve", help="run the redirect server")
+    run.add_argument("--host", default="0.0.0.0")
+    run.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    if args.command == "add":
+        LinkStore(args.db).add_link(args.slug, args.url, args.channel, args.label)
+    else:
+        serve(args.host, args.port, args.db)
@@ -0,0 +1,146 @@
+# Append-only ledger of paid spend and attributed results. Ad-platform CSV
+# exports are normalised to (day, channel, campaign, amount); cost-per-result
+# rollups are pandas group-bys cached until the next append.
+import threading
+
+import pandas as pd
+
+RESULTS = ("listeners", "streams", "pre-saves", "email signups")
+
+# Header names used by the common ad-platform exports, in order of preference
+EXPORT_COLUMNS = {
+    "day": ("day", "date", "reporting starts", "by day", "start date"),
+    "campaign": ("campaign name", "campaign", "ad set name", "ad group name"),
+    "amount": ("amount spent (gbp)", "amount spent", "cost", "spend", "total cost", "amount"),
+    "channel": ("channel", "platform"),
+}
+
+
+def _column(frame, field):
+    lookup = {c.strip().lower(): c for c in frame.columns}
+    for alias in EXPORT_COLUMNS[field]:
+        if alias in lookup:
+            return frame[lookup[alias]]
+    return None
+
+
+def read_spend_export(fileobj, channel="Other"):
+    """Normalise an ad-platform CSV export to (day, channel, campaign, amount).
+
+    `channel` is used when the export has no channel/platform column. Rows
+    without a parseable day or amount are dropped.
+    """
+    raw = pd.read_csv(fileobj)
+    day, amount = _column(raw, "day"), _column(raw, "amount")
+    if day is None or amount is None:
+        raise ValueError("export needs a day/date column and an amount/cost column")
+    campaign, channels = _column(raw, "campaign"), _column(raw, "channel")
+    frame = pd.DataFrame({
+        'day': pd.to_datetime(day, errors='coerce').dt.normalize(),
+        'channel': channels.astype(str) if channels is not None else channel,
+        'campaign': campaign.astype(str) if campaign is not None else '',
+        'amount': pd.to_numeric(amount.astype(str).str.replace(r'[£$€,]', '', regex=True), errors='coerce'),
+    })
+    return frame.dropna(subset=['day', 'amount'])
+
+
+def read_results(fileobj):
+    """Read attributed results from `date,channel,result,count` CSV text."""
+    raw = pd.read_csv(fileobj)
+    frame = pd.DataFrame({
+        'day': pd.to_datetime(raw['date'], errors='coerce').dt.normalize(),
+        'channel': raw['channel'].astype(str),
+        'result': raw['result'].astype(str).str.strip().str.lower(),
+        'count': pd.to_numeric(raw['count'], errors='coerce'),
+    })
+    return frame.dropna(subset=['day', 'count'])
+
+
+class SpendLedger:
+    """Spend entries and attributed results, appended in chunks and never edited.
+
+    Each source (an uploaded file's file_digest) is appended at most once,
+    so re-uploading an export can't double-count it. The ledger is shared
+    by every session, so appends and rollups are serialised by a lock.
+    """
+
+    def __init__(self):
+        self.spend_chunks = []
+        self.result_chunks = []
+        self.sources = set()
+        self.version = 0
+        self.rollups = {}
+        self.lock = threading.RLock()
+
+    def _append(self, chunks, frame, source):
+        with self.lock:
+            if source is not None:
+                if source in self.sources:
+                    return False
+                self.sources.add(source)
+            chunks.append(frame.reset_index(drop=True))
+            self.version += 1
+            self.rollups = {}
+            return True
+
+    def append_spend(self, frame, source=None):
+        return self._append(self.spend_chunks, frame[['day', 'channel', 'campaign', 'amount']], source)
+
+    def append_results(self, frame, source=None):
+        return self._append(self.result_chunks, frame[['day', 'channel', 'result', 'count']], source)
+
+    def _cached(self, key, build):
+        with self.lock:
+            if key not in self.rollups:
+                self.rollups[key] = build()
+            return self.rollups[key]
+
+    @property
+    def spend(self):
+        return self._cached("spend", lambda: pd.concat(self.spend_chunks, ignore_index=True) if self.spend_chunks
+                            else pd.DataFrame(columns=['day', 'channel', 'campaign', 'amount']))
+
+    @property
+    def results(self):
+        return self._cached("results", lambda: pd.concat(self.result_chunks, ignore_index=True) if self.result_chunks
+                            else pd.DataFrame(columns=['day', 'channel', 'result', 'count']))
+
+    def __bool__(self):
+        return bool(self.spend_chunks)
+
+    def cost_per_result(self, by=('channel',)):
+        """Spend, result counts and cost per result grouped by `by` (channel and/or day)."""
+        by = list(by)
+
+        def build():
+            spend = self.spend.groupby(by)['amount'].sum().rename('Spend')
+            results = self.results[self.results['result'].isin(RESULTS)]
+            if results.empty:
+                counts = pd.DataFrame(0, index=spend.index, columns=list(RESULTS))
+            else:
+                counts = (
+                    results.pivot_table(index=by, columns='result', values='count', aggfunc='sum', fill_value=0)
+                    .reindex(columns=list(RESULTS), fill_value=0)
+                )
+            table = pd.concat([spend, counts], axis=1).fillna(0)
+            for result in RESULTS:
+                # No results for a row leaves its cost undefined rather than zero
+                table[f'Cost per {result[:-1]}'] = (
+                    table['Spend'] / table[result].where(table[result] > 0)
+                )
+            return table.reset_index()
+
+        return self._cached(("cost_per_result", tuple(by)), build)
+
+    def totals(self):
+        """{'Spend': total, 'Cost per listener': ..., ...} across every channel and day."""
+        def build():
+            spend = float(self.spend['amount'].sum())
+            counts = self.results.groupby('result')['count'].sum()
+            totals = {'Spend': spend}
+            for result in RESULTS:
+                count = float(counts.get(result, 0))
+                totals[f'Cost per {result[:-1]}'] = spend / count if count else None
+            return totals
+
+        return self._cached("totals", build)
@@ -0,0 +1,138 @@
+# Dependency-aware scheduling of the 90-day plan into daily time capacity.
+# Tasks are ordered with a topological sort and packed first-fit into days;
+# a union-find over full days means a placement never rescans full days.
+import heapq
+from datetime import timedelta
+
+import pandas as pd
+
+# The 90-day Action Plan: Quick Wins Week 1, the rest of Month 1, Month 2
+# (Weeks 5-8) and Month 3 including the final push.
+# id: (task, minutes, earliest day, dependencies)
+PLAN_TASKS = {
+    "content_audit": ("Content audit of all platforms", 60, 1, []),
+    "content_calendar": ("Strategy session + 30-day content calendar", 60, 1, ["content_audit"]),
+    "yt_thumbnails": ("Redesign 5 YouTube thumbnails", 60, 2, ["content_audit"]),
+    "yt_titles": ("Rewrite 5 YouTube titles for SEO", 30, 2, ["content_audit"]),
+    "yt_pinned": ("Pinned streaming comments on all videos", 30, 2, ["yt_titles"]),
+    "ig_profile": ("Instagram bio + Linktree update", 15, 3, []),
+    "ig_reels": ("Create 7 Reels from existing footage", 60, 3, ["content_calendar"]),
+    "ig_engage": ("Follow and engage 20 UK gospel artists", 15, 3, ["ig_profile"]),
+    "tt_profile": ("TikTok profile optimisation", 10, 4, []),
+    "tt_clips": ("Create 10 TikTok clips", 30, 4, ["content_calendar"]),
+    "tt_engage": ("TikTok community engagement", 20, 4, ["tt_profile"]),
+    "email_setup": ("Mailchimp account + opt-in form", 20, 5, []),
+    "lead_magnet": ("Create lead magnet (7-Day Worship Challenge)", 30, 5, ["email_setup"]),
+    "linktree_magnet": ("Add lead magnet to Linktree as #1 link", 10, 5, ["lead_magnet", "ig_profile"]),
+    "fb_groups": ("Join 5 UK gospel Facebook groups", 30, 6, []),
+    "fb_share": ("Share 'No One Like You' with story", 15, 6, ["fb_groups"]),
+    "tw_profile": ("Twitter/X profile optimisation", 10, 7, []),
+    "tw_network": ("Twitter/X content + networking", 20, 7, ["tw_profile"]),
+    "batch_content": ("Batch create Week 2-3 content", 120, 8, ["content_calendar"]),
+    "first_email": ("First email campaign", 45, 8, ["linktree_magnet"]),
+    "launch_ads": ("Launch ads (£50-100)", 60, 15, ["batch_content"]),
+    "playlist_pitch": ("Pitch independent playlist curators", 60, 15, []),
+    "collab_outreach": ("Collaboration outreach", 45, 15, ["ig_engage", "tt_engage"]),
+    "analytics_review": ("Month 1 analytics review", 60, 22, ["launch_ads"]),
+    "repurpose": ("Content repurposing", 90, 22, ["batch_content"]),
+    "month2_plan": ("Month 2 planning", 60, 22, ["analytics_review"]),
+    # Month 2, Week 5: content system
+    "pillar_asset": ("Record Month 2 pillar asset", 120, 29, ["month2_plan"]),
+    "flywheel_batch": ("Batch 20+ pieces from the pillar asset", 180, 30, ["pillar_asset", "repurpose"]),
+    "scheduling_setup": ("Set up scheduling automation", 45, 30, ["flywheel_batch"]),
+    "collab_live": ("Instagram Live worship session with collaborator", 60, 33, ["collab_outreach"]),
+    "playlist_research": ("Research 20 playlists", 60, 29, ["playlist_pitch"]),
+    "playlist_pitches": ("Send personalised playlist pitches", 90, 31, ["playlist_research"]),
+    "curator_followup": ("Follow up with curators", 30, 38, ["playlist_pitches"]),
+    # Week 6: growth sprints
+    "ig_sprint": ("Instagram sprint: daily Reel + engagement blitz", 180, 36, ["scheduling_setup"]),
+    "tt_sprint": ("TikTok sprint: 2 videos/day + duets", 120, 39, ["scheduling_setup"]),
+    "yt_optimise": ("YouTube optimisation pass", 60, 40, ["yt_thumbnails"]),
+    # Week 7: email and fans
+    "email_campaigns": ("Weekly newsletter + welcome sequence review", 60, 43, ["first_email"]),
+    "fan_survey": ("Launch fan survey, collect testimonials", 45, 45, ["email_campaigns"]),
+    "community_deepen": ("Community deepening: reply to every fan", 60, 46, ["ig_sprint"]),
+    # Week 8: optimisation
+    "ads_round2": ("Paid ads round 2", 60, 50, ["launch_ads", "analytics_review"]),
+    "month2_review": ("Month 2 analytics review", 60, 55, ["ads_round2", "ig_sprint", "tt_sprint"]),
+    "month3_plan": ("Month 3 planning", 60, 56, ["month2_review"]),
+    # Month 3: scale what works
+    "tt_variations": ("Test 10 TikTok variations", 150, 61, ["month3_plan"]),
+    "reels_scale": ("Scale up Instagram Reels on trending sounds", 120, 62, ["month3_plan"]),
+    "ads_streaming": ("Ads campaign 1: streaming focus", 45, 64, ["month3_plan", "ads_round2"]),
+    "ads_profile": ("Ads campaign 2: profile growth", 45, 64, ["ads_streaming"]),
+    "ads_retarget": ("Ads campaign 3: retargeting", 30, 68, ["ads_streaming"]),
+    "song_launch_plan": ("Plan song launch email sequence", 60, 70, ["fan_survey"]),
+    "month3_review": ("Day 80 gap check against targets", 45, 80, ["tt_variations", "reels_scale", "ads_retarget"]),
+    "push_email": ("Final push: email blast + Story series", 60, 82, ["month3_review"]),
+    "push_groups": ("Final push: Facebook groups + WhatsApp broadcast", 45, 83, ["month3_review"]),
+    "push_curators": ("Final push: curator outreach + Twitter push", 45, 84, ["month3_review", "curator_followup"]),
+    "push_ads": ("Final push: ad boost + urgency campaign", 30, 85, ["month3_review"]),
+    "final_review": ("90-day results review", 90, 89, ["push_email", "push_groups", "push_curators", "push_ads"]),
+}
+
+
+def topological_order(tasks):
+    """Kahn's algorithm, releasing ready tasks by (earliest day, longest first)."""
+    indegree = {t: 0 for t in tasks}
+    children = {t: [] for t in tasks}
+    for task_id, (_, _, _, deps) in tasks.items():
+        for dep in deps:
+            if dep in tasks:
+                indegree[task_id] += 1
+                children[dep].append(task_id)
+    ready = [(tasks[t][2], -tasks[t][1], t) for t, n in indegree.items() if n == 0]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        _, _, task_id = heapq.heappop(ready)
+        order.append(task_id)
+        for child in children[task_id]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                heapq.heappush(ready, (tasks[child][2], -tasks[child][1], child))
+    if len(order) != len(tasks):
+        raise ValueError("Task dependencies contain a cycle")
+    return order
+
+
+def schedule_tasks(tasks, capacity=90, horizon=90, slips=None, start=None):
+    """Pack tasks into days of `capacity` minutes, respecting dependencies.
+
+    A task starts no earlier than its earliest day (pushed back by any
+    `slips` in days) and no earlier than the day its dependencies finish.
+    Tasks longer than the time left in a day carry over to the next free
+    day. Returns one row per (task, day) chunk.
+    """
+    slips = slips or {}
+    free = [capacity] * (horizon + 2)
+    next_open = list(range(horizon + 2))  # union-find: next day with time left
+
+    def find(day):
+        while next_open[day] != day:
+            next_open[day] = next_open[next_open[day]]
+            day = next_open[day]
+        return day
+
+    finish = {}
+    rows = []
+    for task_id in topological_order(tasks):
+        name, minutes, earliest, deps = tasks[task_id]
+        day = max([earliest + slips.get(task_id, 0)] + [finish[d] for d in deps if d in finish])
+        remaining = minutes
+        while remaining > 0:
+            day = find(min(day, horizon + 1))
+            if day > horizon:
+                break
+            chunk = min(remaining, free[day])
+            free[day] -= chunk
+            remaining -= chunk
+            rows.append((day, task_id, name, chunk))
+            if free[day] == 0:
+                next_open[day] = day + 1
+        finish[task_id] = day if remaining == 0 else horizon + 1
+
+    df = pd.DataFrame(rows, columns=['Day', 'Task ID', 'Task', 'Minutes'])
+    if start is not None:
+        df.insert(1, 'Date', [start + timedelta(days=int(d) - 1) for d in df['Day']])
+    return df
@@ -0,0 +1,55 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+from attribution import DIRECT, AttributionEngine, read_conversions, read_touchpoints
+
+TOUCHES = """timestamp,visitor_id,channel
+2026-01-18T08:00:00Z,v1,Instagram
+2026-01-18T10:00:00+01:00,v1,TikTok
+2026-01-10T09:00:00Z,v2,Email
+"""
+CONVERSIONS = """timestamp,visitor_id,streams
+2026-01-18T10:00:00Z,v1,4
+2026-01-18T12:00:00Z,v2,2
+2026-01-18T12:00:00Z,v3,1
+"""
+
+
+def _engine():
+    engine = AttributionEngine()
+    engine.add_touchpoints(read_touchpoints(io.StringIO(TOUCHES)))
+    engine.add_conversions(read_conversions(io.StringIO(CONVERSIONS)))
+    return engine
+
+
+def test_timestamps_are_naive_utc():
+    touches = read_touchpoints(io.StringIO(TOUCHES))
+    assert touches['timestamp'].dt.tz is None
+    assert touches['timestamp'][1] == pd.Timestamp("2026-01-18 09:00")
+
+
+def test_models_credit_every_stream_once():
+    for model, credit in _engine().compare().items():
+        assert np.isclose(credit.sum(), 7), model
+
+
+def test_last_touch_and_linear_split():
+    engine = _engine()
+    last = engine.attribute("last_touch")
+    assert last['TikTok'] == 4 and last['Instagram'] == 0
+    linear = engine.attribute("linear")
+    assert linear['TikTok'] == linear['Instagram'] == 2
+
+
+def test_time_decay_favours_the_recent_touch():
+    decay = _engine().attribute("time_decay")
+    assert decay['TikTok'] > decay['Instagram'] > 0
+
+
+def test_touches_outside_lookback_and_untouched_visitors_go_direct():
+    # v2's Email click is 8 days old (lookback is 7); v3 never clicked
+    credit = _engine().attribute("linear")
+    assert credit[DIRECT] == 3
+    assert credit.get('Email', 0) == 0
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from audit_tables import TABLES
+from calendar_engine import build_slots, expand_calendar, parse_best_time
+
+SCHEDULE = pd.DataFrame(TABLES["Content Strategy"]["schedule_data"])
+
+
+def test_parse_best_time_ranges_and_days():
+    assert parse_best_time("12-2pm & 7-9pm")[0] == [(12, 14), (19, 21)]
+    windows, mask = parse_best_time("Tuesday 10am")
+    assert windows == [(10, 11)]
+    assert list(mask) == [False, True, False, False, False, False, False]
+    assert not parse_best_time("2-4pm weekdays")[1][5:].any()
+
+
+def test_slots_land_on_their_days_and_hours():
+    # 2026-01-18 is a Sunday
+    slots = build_slots(SCHEDULE, "2026-01-18", 14)
+    email = pd.to_datetime(slots["Email"])
+    assert list(email) == [pd.Timestamp("2026-01-20 10:00"), pd.Timestamp("2026-01-27 10:00")]
+    instagram = pd.to_datetime(slots["Instagram"])
+    assert instagram.min() == pd.Timestamp("2026-01-18 18:00")
+    assert set(instagram.hour) <= {18, 19}
+
+
+def test_calendar_stays_inside_the_horizon():
+    calendar = expand_calendar(["A", "B"], SCHEDULE, "2026-01-18", days=28)
+    assert calendar['Slot'].min() >= pd.Timestamp("2026-01-18")
+    assert calendar['Slot'].max() < pd.Timestamp("2026-02-15")
+    assert set(calendar['Artist']) == {"A", "B"}
+    # No piece goes out before its pillar asset is released
+    released = pd.Timestamp("2026-01-18") + pd.to_timedelta((calendar['Pillar Asset'] - 1) * 7, unit="D")
+    assert (calendar['Slot'] >= released).all()
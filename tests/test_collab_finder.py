@@ -0,0 +1,42 @@
+import io
+
+import pytest
+
+from collab_finder import CollaboratorIndex, read_artists
+
+CSV = """Artist,Genres,Monthly Listeners,Audience Instagram,Audience TikTok
+JohnGreat,gospel|worship,2,0.7,0.3
+Near,gospel|worship,900,0.7,0.3
+Other Genre,drill,900,0.1,0.9
+Big,gospel|worship,40000,0.5,0.5
+Far,gospel,1200,0.0,1.0
+"""
+
+
+def _index():
+    return CollaboratorIndex(read_artists(io.StringIO(CSV)), seed=1)
+
+
+def test_read_artists_rejects_missing_columns():
+    with pytest.raises(ValueError, match="Monthly Listeners"):
+        read_artists(io.StringIO("Artist,Genres\nA,gospel\n"))
+
+
+def test_exclude_is_applied_before_the_fallback():
+    result = _index().query("gospel, worship", 2, k=3, min_listeners=0, max_listeners=5000, exclude=("JohnGreat",))
+    assert "JohnGreat" not in set(result['Artist'])
+    assert len(result) == 3
+
+
+def test_listener_range_and_genre_ranking():
+    result = _index().query("gospel, worship", 2, k=2, min_listeners=500, max_listeners=5000)
+    assert set(result['Artist']) <= {"Near", "Other Genre", "Far"}
+    assert result['Artist'][0] == "Near"
+
+
+def test_audience_mix_moves_the_ranking():
+    index = _index()
+    tiktok = index.query("gospel", 2, audience={"Audience TikTok": 1.0}, k=1, min_listeners=500, max_listeners=5000)
+    instagram = index.query("gospel", 2, audience={"Audience Instagram": 1.0}, k=1, min_listeners=500, max_listeners=5000)
+    assert tiktok['Artist'][0] == "Far"
+    assert instagram['Artist'][0] == "Near"
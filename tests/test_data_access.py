@@ -0,0 +1,40 @@
+import time
+
+from data_access import SECTION_QUERIES, DataAccessLayer
+from warehouse import Warehouse
+
+ROWS = [
+    ("JohnGreat", "Spotify", "monthly_listeners", "2026-01-18", 12),
+    ("JohnGreat", "Spotify", "monthly_listeners", "2026-01-19", 15),
+    ("JohnGreat", "Spotify", "streams", "2026-01-19", 140),
+    ("JohnGreat", "Instagram", "followers", "2026-01-19", 41),
+]
+
+
+def _layer(tmp_path):
+    warehouse = Warehouse(str(tmp_path / "warehouse.db"))
+    warehouse.ingest_daily_metrics(ROWS)
+    return warehouse, DataAccessLayer(warehouse)
+
+
+def test_load_section_returns_every_query(tmp_path):
+    _, layer = _layer(tmp_path)
+    data = layer.load_section("KPIs & Targets", "JohnGreat")
+    assert set(data) == {name for name, _, _ in SECTION_QUERIES["KPIs & Targets"]}
+    assert [value for _, value in data["spotify_listeners"]] == [12, 15]
+    assert ("Instagram", "followers", 41) in data["latest"]
+    assert data["email_subscribers"] == []
+
+
+def test_prefetch_warms_the_next_section(tmp_path):
+    warehouse, layer = _layer(tmp_path)
+    layer.prefetch_next("90-Day Action Plan", "JohnGreat", ["90-Day Action Plan", "KPIs & Targets"])
+    deadline = time.monotonic() + 5
+    while len(warehouse.cache) < len(SECTION_QUERIES["KPIs & Targets"]) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(warehouse.cache) == len(SECTION_QUERIES["KPIs & Targets"])
+
+
+def test_unknown_section_loads_nothing(tmp_path):
+    _, layer = _layer(tmp_path)
+    assert layer.load_section("Executive Summary", "JohnGreat") == {}
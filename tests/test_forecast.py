@@ -0,0 +1,26 @@
+import numpy as np
+
+from forecast import forecast_history, forecast_release
+
+
+def _history(days, start=400.0, rate=0.05):
+    return [start * np.exp(-rate * day) + 20 for day in range(days)]
+
+
+def test_history_forecast_starts_after_last_observed_day():
+    projection = forecast_history("Test Release", _history(40))
+    assert list(projection["days"]) == list(range(41, 71))
+    assert len(projection["forecast"]) == 30
+    assert projection["observed_days"] == 40
+
+
+def test_history_forecast_continues_the_decay():
+    history = _history(40)
+    projection = forecast_history("Test Release", history)
+    assert projection["forecast"][0] <= history[-1] * 1.1
+    assert np.all(np.diff(projection["forecast"]) <= 1e-9)
+
+
+def test_release_forecast_covers_days_one_to_horizon():
+    projection = forecast_release("Test Release", tuple(_history(5)))
+    assert list(projection["days"]) == list(range(1, 31))
@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta, timezone
+
+from launch_tracker import EventFileTail, HourlyRingBuffer
+
+START = datetime(2026, 1, 18)
+
+
+def test_cumulative_total_survives_eviction_and_late_events():
+    buffer = HourlyRingBuffer(START, hours=3)
+    for hour in range(6):
+        buffer.add(START + timedelta(hours=hour, minutes=5), 10)
+    buffer.add(START + timedelta(minutes=30), 7)  # hour 0 left the window long ago
+    hours, totals = buffer.cumulative()
+    assert list(hours) == [4, 5, 6]
+    assert totals[-1] == 67
+    assert buffer.late == 7
+
+
+def test_events_before_start_are_counted_not_bucketed():
+    buffer = HourlyRingBuffer(START)
+    buffer.add(START - timedelta(minutes=1), 3)
+    assert buffer.before_start == 3
+    assert len(buffer.cumulative()[1]) == 0
+
+
+def test_aware_timestamps_are_normalised_to_utc():
+    buffer = HourlyRingBuffer(START)
+    buffer.add(datetime(2026, 1, 18, 3, 30, tzinfo=timezone(timedelta(hours=2))), 1)
+    assert buffer.latest == 1
+
+
+def test_tail_keeps_half_written_lines_for_the_next_poll(tmp_path):
+    path = tmp_path / "events.csv"
+    path.write_text("timestamp,count\n2026-01-18T01:00:00Z,4\n2026-01-18T02:")
+    tail = EventFileTail(str(path))
+    assert tail.poll() == [(datetime(2026, 1, 18, 1), 4)]
+    with open(path, "a") as f:
+        f.write("00:00,2\n")
+    assert tail.poll() == [(datetime(2026, 1, 18, 2), 2)]
@@ -0,0 +1,48 @@
+from datetime import datetime
+
+import pandas as pd
+
+from calendar_engine import build_slots
+from posting_times import PostingTimeIndex, _hour_range, format_best_time
+
+SCHEDULE = pd.DataFrame({'Platform': ['Instagram'], 'Best Time': ['6-8pm UK'], 'Time/Day': ['15 min']})
+
+
+def test_hour_range_crossing_midnight():
+    assert _hour_range(23) == "11pm-12am"
+
+
+def test_hour_range_crossing_noon():
+    assert _hour_range(11) == "11am-12pm"
+    assert _hour_range(0) == "12-1am"
+    assert _hour_range(18) == "6-7pm"
+
+
+def test_format_best_time_keeps_each_slot_on_its_own_day():
+    text = format_best_time([(0, 18, 5.0), (4, 9, 4.0), (0, 20, 3.0)])
+    assert text == "Monday 6-7pm & 8-9pm, Friday 9-10am"
+
+
+def test_build_slots_uses_structured_cells():
+    # 2026-01-19 is a Monday
+    slots = build_slots(SCHEDULE, "2026-01-19", 14, best_cells={'Instagram': [(0, 23), (4, 9)]})
+    stamps = pd.to_datetime(slots['Instagram'])
+    assert set(zip(stamps.weekday, stamps.hour)) == {(0, 23), (4, 9)}
+
+
+def test_recommend_only_ranks_cells_with_posts():
+    index = PostingTimeIndex(['Instagram'])
+    # 2026-01-19 is a Monday
+    index.add('Instagram', datetime(2026, 1, 19, 18), 100)
+    index.add('Instagram', datetime(2026, 1, 20, 9), 10)
+    index.add('Instagram', datetime(2026, 1, 21, 9), 10)
+    slots = index.recommend('Instagram', k=3)
+    assert [(day, hour) for day, hour, _ in slots] == [(0, 18), (1, 9), (2, 9)]
+    assert index.recommend('Instagram', k=3, min_posts=2) == []
+
+
+def test_recommend_returns_fewer_slots_than_k_on_sparse_data():
+    index = PostingTimeIndex(['Instagram', 'TikTok'])
+    index.add('Instagram', datetime(2026, 1, 19, 18), 100)
+    assert len(index.recommend('Instagram', k=3)) == 1
+    assert index.recommend('TikTok') == []
@@ -0,0 +1,39 @@
+from datetime import date
+
+import numpy as np
+
+from royalties import COUNTRIES, DEFAULT_RATES, PLATFORMS, RoyaltyEngine, read_rate_table
+from uploads import file_digest
+
+RATES_A = b"platform,country,rate\nSpotify,GB,0.004\n"
+RATES_B = b"platform,country,rate\nSpotify,GB,0.002\n"
+
+
+def _apply(engine, data):
+    engine.set_rates(read_rate_table(data.decode().splitlines()), source=file_digest(data))
+
+
+def _spotify_gb(engine):
+    return engine.rates[PLATFORMS.index("Spotify"), COUNTRIES.index("GB")]
+
+
+def test_reapplying_an_earlier_rate_table_replaces_the_current_one():
+    engine = RoyaltyEngine()
+    _apply(engine, RATES_A)
+    _apply(engine, RATES_B)
+    _apply(engine, RATES_A)
+    assert _spotify_gb(engine) == 0.004
+
+
+def test_rate_table_keeps_defaults_for_missing_rows():
+    rates = read_rate_table(RATES_A.decode().splitlines())
+    assert rates[PLATFORMS.index("TIDAL"), 0] == DEFAULT_RATES[PLATFORMS.index("TIDAL"), 0]
+
+
+def test_stream_report_is_added_once_and_priced_by_rates():
+    engine = RoyaltyEngine(capacity=1)
+    rows = [(date(2026, 1, 18), "Spotify", "GB", 1000.0), (date(2026, 1, 19), "Spotify", "GB", 500.0)]
+    engine.add_rows(rows, source="report")
+    engine.add_rows(rows, source="report")
+    assert np.isclose(engine.total_revenue(), 1500 * DEFAULT_RATES[0, 0])
+    assert list(engine.daily_revenue().index.day) == [18, 19]
@@ -0,0 +1,40 @@
+import numpy as np
+
+from sensitivity import MODELS, base_output, heatmap, one_way, tornado, tornado_figure
+
+
+def test_base_output_uses_the_audit_figures():
+    assert np.isclose(base_output("email_presaves"), 100 * 0.30 * 0.50)
+
+
+def test_tornado_brackets_the_base_and_is_sorted():
+    base = base_output("day1_streams")
+    table = tornado("day1_streams")
+    assert (table['Low'] <= base + 1e-9).all() and (table['High'] >= base - 1e-9).all()
+    assert list(table['Swing']) == sorted(table['Swing'])
+    assert set(table['Assumption']) == {label for label, *_ in MODELS["day1_streams"]["assumptions"].values()}
+
+
+def test_overrides_change_the_sweep():
+    wide = tornado("email_presaves", {"subscribers": (100, 10, 1000)})
+    swing = wide.set_index('Assumption').loc["Email subscribers", 'Swing']
+    assert np.isclose(swing, (1000 - 10) * 0.30 * 0.50)
+
+
+def test_one_way_sweeps_each_assumption_across_its_range():
+    sweeps = one_way("email_presaves", points=5)
+    opens = sweeps[sweeps['Assumption'] == "open_rate"]
+    assert np.allclose(opens['Value'], np.linspace(0.20, 0.40, 5))
+
+
+def test_heatmap_grid_matches_direct_evaluation():
+    xs, ys, z = heatmap("email_presaves", "open_rate", "click_rate", points=5)
+    assert z.shape == (5, 5)
+    assert np.isclose(z[2, 3], 100 * xs[3] * ys[2])
+    assert not z.flags.writeable
+
+
+def test_tornado_figure_has_low_and_high_bars():
+    fig = tornado_figure("email_presaves", "Pre-Saves Sensitivity", "Pre-saves")
+    assert [trace.name for trace in fig.data] == ['Low end', 'High end']
+    assert "base: 15" in fig.layout.title.text
@@ -0,0 +1,30 @@
+from datetime import date, datetime, timezone
+
+from smart_links import LinkStore, daily_click_rows
+
+
+def _ts(*args):
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+def test_clicks_are_bucketed_by_utc_day():
+    clicks = [(_ts(2026, 1, 18, 23, 30), "v1", "Instagram"), (_ts(2026, 1, 19, 0, 30), "v2", "Instagram")]
+    rows = sorted(daily_click_rows(clicks))
+    assert rows == [(date(2026, 1, 18), "Instagram", "Link Clicks", 1), (date(2026, 1, 19), "Instagram", "Link Clicks", 1)]
+
+
+def test_channels_are_canonicalised_and_unknown_ones_kept():
+    clicks = [(_ts(2026, 1, 18, 9), "v1", "instagram"), (_ts(2026, 1, 18, 10), "v2", "Linktree")]
+    rows = dict(((channel, n) for _, channel, _, n in daily_click_rows(clicks, ("Instagram", "TikTok"))))
+    assert rows == {"Instagram": 1, "Linktree": 1}
+
+
+def test_clicks_after_is_a_high_water_mark(tmp_path):
+    store = LinkStore(str(tmp_path / "links.db"))
+    store.add_link("stream", "https://example.com", "Instagram")
+    store.log_clicks([(1.0, "stream", "v1", "Instagram"), (2.0, "stream", "v2", "TikTok")])
+    clicks, high = store.clicks_after(0)
+    assert len(clicks) == 2
+    store.log_clicks([(3.0, "stream", "v3", "Email")])
+    assert store.clicks_after(high)[0] == [(3.0, "v3", "Email")]
+    assert store.counts()[0][-1] == 3
@@ -0,0 +1,40 @@
+import io
+import threading
+
+from spend_ledger import SpendLedger, read_spend_export
+from uploads import file_digest
+
+EXPORT = b"Day,Campaign name,Amount spent (GBP)\n2026-01-18,Launch,12.50\n2026-01-19,Launch,7.50\n"
+
+
+def _upload(ledger, data):
+    digest = file_digest(data)
+    if digest in ledger.sources:
+        return False
+    return ledger.append_spend(read_spend_export(io.BytesIO(data), "Instagram"), source=digest)
+
+
+def test_reupload_of_same_export_is_counted_once():
+    ledger = SpendLedger()
+    assert _upload(ledger, EXPORT)
+    # A fresh upload of identical bytes gets a new upload id but the same digest
+    assert not _upload(ledger, bytes(EXPORT))
+    assert ledger.totals()['Spend'] == 20.0
+
+
+def test_different_exports_are_both_counted():
+    ledger = SpendLedger()
+    _upload(ledger, EXPORT)
+    _upload(ledger, EXPORT.replace(b"7.50", b"2.50"))
+    assert ledger.totals()['Spend'] == 35.0
+
+
+def test_concurrent_reuploads_append_once():
+    ledger = SpendLedger()
+    frame = read_spend_export(io.BytesIO(EXPORT), "Instagram")
+    threads = [threading.Thread(target=ledger.append_spend, args=(frame, file_digest(EXPORT))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(ledger.spend_chunks) == 1
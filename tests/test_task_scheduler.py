@@ -0,0 +1,30 @@
+import pytest
+
+from task_scheduler import PLAN_TASKS, schedule_tasks, topological_order
+
+
+def test_plan_covers_all_three_months():
+    assert max(day for _, _, day, _ in PLAN_TASKS.values()) > 60
+    assert all(dep in PLAN_TASKS for *_, deps in PLAN_TASKS.values() for dep in deps)
+
+
+def test_schedule_respects_dependencies_and_capacity():
+    df = schedule_tasks(PLAN_TASKS, capacity=90)
+    assert (df.groupby('Day')['Minutes'].sum() <= 90).all()
+    assert df.groupby('Task ID')['Minutes'].sum().to_dict() == {t: v[1] for t, v in PLAN_TASKS.items()}
+    first, last = df.groupby('Task ID')['Day'].min(), df.groupby('Task ID')['Day'].max()
+    for task_id, (_, _, earliest, deps) in PLAN_TASKS.items():
+        assert first[task_id] >= earliest
+        assert all(first[task_id] >= last[dep] for dep in deps)
+
+
+def test_slip_pushes_dependents_back():
+    base = schedule_tasks(PLAN_TASKS, capacity=90)
+    slipped = schedule_tasks(PLAN_TASKS, capacity=90, slips={"month3_plan": 10})
+    assert slipped.loc[slipped['Task ID'] == "tt_variations", 'Day'].min() > \
+        base.loc[base['Task ID'] == "tt_variations", 'Day'].min()
+
+
+def test_cycle_is_rejected():
+    with pytest.raises(ValueError):
+        topological_order({"a": ("A", 10, 1, ["b"]), "b": ("B", 10, 1, ["a"])})
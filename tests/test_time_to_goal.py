@@ -0,0 +1,39 @@
+import numpy as np
+
+from time_to_goal import GOAL, first_passage, hit_curve, parse_range, tier_probabilities, timeline_label
+
+
+def test_parse_range():
+    assert parse_range("120-180") == (120.0, 180.0)
+    assert parse_range("1,000") == (1000.0, 1000.0)
+
+
+def test_assessment_day_matches_the_projection_range():
+    # The range is read as the 10th-90th percentile on assessment day
+    low, mid, high = np.quantile(first_passage(120, 180)['assessment'], [0.1, 0.5, 0.9])
+    assert abs(low - 120) / 120 < 0.03
+    assert abs(mid - np.sqrt(120 * 180)) / mid < 0.03
+    assert abs(high - 180) / 180 < 0.03
+
+
+def test_first_passage_days_agree_with_the_paths():
+    result = first_passage(250, 375)
+    days = result['days']
+    reached_by_90 = np.mean(days <= 90)
+    # A path at or above the goal on day 90 has reached it by then
+    assert reached_by_90 >= np.mean(result['assessment'] >= GOAL)
+    curve = hit_curve(days)
+    assert np.all(np.diff(curve) >= 0)
+    assert np.isclose(curve[89], reached_by_90)
+
+
+def test_bigger_scenarios_reach_the_goal_sooner():
+    small, big = first_passage(50, 100)['days'], first_passage(250, 375)['days']
+    assert np.median(big) < np.median(small)
+
+
+def test_labels_and_tiers():
+    assert timeline_label(np.full(100, np.inf)) == "Not within 2 years"
+    assert timeline_label(np.linspace(100, 160, 101)) == "3-6 months"
+    odds = tier_probabilities(np.array([100.0, 350.0, 600.0, 700.0]))
+    assert odds == {"500+": 0.5, "300-499": 0.25, "<300": 0.25}
@@ -0,0 +1,83 @@
+# Time-to-goal for monthly listeners. Each budget scenario's 90-day
+# projection range calibrates a growth process; tens of thousands of paths
+# are stepped together one day at a time, recording the first day each path
+# reaches the goal and where it stands on assessment day.
+from functools import lru_cache
+
+import numpy as np
+
+START_LISTENERS = 2
+GOAL = 500
+ASSESSMENT_DAY = 90
+
+# 90-Day Success Assessment tiers: (label, lower bound, upper bound)
+TIERS = (("500+", 500, np.inf), ("300-499", 300, 500), ("<300", 0, 300))
+
+# Growth slows as the easy audience is reached: the daily drift halves
+# every DRIFT_HALF_LIFE days
+DRIFT_HALF_LIFE = 90
+
+# A projection range "low-high" is read as the 10th-90th percentile
+_Z90 = 1.2816
+
+
+def parse_range(text):
+    """'120-180' -> (120.0, 180.0)."""
+    low, _, high = str(text).replace(",", "").partition("-")
+    return float(low), float(high or low)
+
+
+@lru_cache(maxsize=64)
+def first_passage(low, high, start=START_LISTENERS, goal=GOAL, paths=20000, horizon=730,
+                  assessment_day=ASSESSMENT_DAY, seed=0):
+    """Simulate listener paths calibrated to a day-`assessment_day` projection range.
+
+    Returns {'days': first day each path reaches `goal` (inf if not within
+    `horizon`), 'assessment': listeners on assessment day}. Cached per
+    scenario, so a scenario is only re-simulated when its inputs change.
+    """
+    decay = np.exp2(-np.arange(horizon) / DRIFT_HALF_LIFE)
+    # Drift chosen so the median path lands on the range's geometric midpoint
+    mu = np.log(np.sqrt(low * high) / start) / decay[:assessment_day].sum()
+    sigma = np.log(high / low) / (2 * _Z90) / np.sqrt(assessment_day)
+
+    rng = np.random.default_rng(seed)
+    log_listeners = np.full(paths, np.log(start))
+    days = np.full(paths, np.inf)
+    assessment = None
+    goal_log = np.log(goal)
+    for day in range(horizon):
+        log_listeners += mu * decay[day] + sigma * rng.standard_normal(paths)
+        days[np.isinf(days) & (log_listeners >= goal_log)] = day + 1
+        if day + 1 == assessment_day:
+            assessment = np.exp(log_listeners)
+    days.setflags(write=False)
+    assessment.setflags(write=False)
+    return {"days": days, "assessment": assessment}
+
+
+def days_quantiles(days, qs=(0.1, 0.5, 0.9)):
+    """Quantiles of days-to-goal; inf where that share of paths never gets there."""
+    ordered = np.sort(days)
+    return [ordered[int(round(q * (len(ordered) - 1)))] for q in qs]
+
+
+def timeline_label(days):
+    """'4-6 months' from the 10th-90th percentile of days-to-goal."""
+    low, _, high = days_quantiles(days)
+    if np.isinf(low):
+        return "Not within 2 years"
+    low_m = max(int(np.floor(low / 30.4)), 1)
+    if np.isinf(high):
+        return f"{low_m}+ months"
+    return f"{low_m}-{max(int(np.ceil(high / 30.4)), low_m + 1)} months"
+
+
+def tier_probabilities(assessment):
+    """{tier label: share of paths in that tier on assessment day}."""
+    return {label: float(np.mean((assessment >= lo) & (assessment < hi))) for label, lo, hi in TIERS}
+
+
+def hit_curve(days, horizon=730):
+    """Share of paths that have reached the goal by each day 1..horizon."""
+    return np.searchsorted(np.sort(days), np.arange(1, horizon + 1), side="right") / len(days)
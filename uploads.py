@@ -0,0 +1,11 @@
+# Helpers shared by every upload that feeds a long-lived store.
+import hashlib
+
+
+def file_digest(data):
+    """Content hash of an uploaded file's bytes, used as its source key.
+
+    Keying on content rather than upload id means the same export uploaded
+    again, from another session or under another name, is recognised.
+    """
+    return hashlib.sha256(data).hexdigest()
@@ -0,0 +1,197 @@
+# Embedded SQLite warehouse for artist metrics. Every dashboard query has a
+# covering index (or clustered WITHOUT ROWID key) shaped to its filter and
+# columns, and results are cached until the next ingest.
+import csv
+import os
+import sqlite3
+import threading
+
+DEFAULT_PATH = os.environ.get("WAREHOUSE_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "warehouse.db"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS artists (
+    artist_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS platforms (
+    platform_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+-- Clustered on the exact (artist, platform, metric, day range) filter
+CREATE TABLE IF NOT EXISTS daily_metrics (
+    artist_id INTEGER NOT NULL REFERENCES artists,
+    platform_id INTEGER NOT NULL REFERENCES platforms,
+    metric TEXT NOT NULL,
+    day TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (artist_id, platform_id, metric, day)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS posts (
+    post_id TEXT NOT NULL,
+    artist_id INTEGER NOT NULL REFERENCES artists,
+    platform_id INTEGER NOT NULL REFERENCES platforms,
+    posted_at TEXT NOT NULL,
+    likes INTEGER NOT NULL DEFAULT 0,
+    comments INTEGER NOT NULL DEFAULT 0,
+    shares INTEGER NOT NULL DEFAULT 0,
+    views INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (platform_id, post_id)
+);
+CREATE INDEX IF NOT EXISTS posts_by_artist_time
+    ON posts (artist_id, posted_at, platform_id, likes, comments, shares, views);
+
+CREATE TABLE IF NOT EXISTS emails (
+    email_id INTEGER PRIMARY KEY,
+    artist_id INTEGER NOT NULL REFERENCES artists,
+    sequence TEXT NOT NULL,
+    sent_at TEXT NOT NULL,
+    recipients INTEGER NOT NULL,
+    opens INTEGER NOT NULL,
+    clicks INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS emails_by_artist_time
+    ON emails (artist_id, sent_at, sequence, recipients, opens, clicks);
+
+CREATE TABLE IF NOT EXISTS campaigns (
+    campaign_id INTEGER PRIMARY KEY,
+    artist_id INTEGER NOT NULL REFERENCES artists,
+    name TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    start_day TEXT NOT NULL,
+    end_day TEXT NOT NULL,
+    spend REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS campaigns_by_artist_time
+    ON campaigns (artist_id, start_day, end_day, channel, name, spend);
+"""
+
+# Named read queries; each is answered from one index without touching rows
+QUERIES = {
+    "metric_series": """
+        SELECT m.day, m.value FROM daily_metrics m
+        JOIN artists a USING (artist_id) JOIN platforms p USING (platform_id)
+        WHERE a.name = :artist AND p.name = :platform AND m.metric = :metric AND m.day BETWEEN :start AND :end
+        ORDER BY m.day
+    """,
+    "latest_metrics": """
+        SELECT p.name, m.metric, m.value FROM daily_metrics m
+        JOIN artists a USING (artist_id) JOIN platforms p USING (platform_id)
+        WHERE a.name = :artist AND m.day = (
+            SELECT MAX(day) FROM daily_metrics d
+            WHERE d.artist_id = m.artist_id AND d.platform_id = m.platform_id AND d.metric = m.metric
+        )
+    """,
+    "post_totals": """
+        SELECT p.name, COUNT(*), SUM(likes), SUM(comments), SUM(shares), SUM(views) FROM posts
+        JOIN artists a USING (artist_id) JOIN platforms p USING (platform_id)
+        WHERE a.name = :artist AND posted_at BETWEEN :start AND :end
+        GROUP BY p.name
+    """,
+    "email_performance": """
+        SELECT sequence, COUNT(*), SUM(recipients), SUM(opens), SUM(clicks) FROM emails
+        JOIN artists a USING (artist_id)
+        WHERE a.name = :artist AND sent_at BETWEEN :start AND :end
+        GROUP BY sequence
+    """,
+    "campaign_spend": """
+        SELECT c.channel, c.name, c.start_day, c.end_day, c.spend FROM campaigns c
+        JOIN artists a USING (artist_id)
+        WHERE a.name = :artist AND c.start_day <= :end AND c.end_day >= :start
+        ORDER BY c.start_day
+    """,
+}
+
+
+def read_metric_rows(lines, artist):
+    """Parse `date,platform,metric,value` CSV lines into daily_metrics rows."""
+    for row in csv.DictReader(lines):
+        try:
+            yield artist, row["platform"], row["metric"], row["date"], float(row["value"])
+        except (KeyError, ValueError):
+            continue
+
+
+class Warehouse:
+    """Ingest and query artist metrics; cached results are dropped on every ingest."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.lock = threading.Lock()
+        self.cache = {}
+        self.generation = 0
+        self.ids = {}
+
+    def _id(self, table, name):
+        key = (table, name)
+        if key not in self.ids:
+            column = "artist_id" if table == "artists" else "platform_id"
+            self.conn.execute(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", (name,))
+            self.ids[key] = self.conn.execute(f"SELECT {column} FROM {table} WHERE name = ?", (name,)).fetchone()[0]
+        return self.ids[key]
+
+    def _ingest(self, sql, rows):
+        with self.lock, self.conn:
+            self.conn.executemany(sql, rows)
+            # Any ingest can change any cached answer
+            self.cache.clear()
+            self.generation += 1
+
+    def ingest_daily_metrics(self, rows):
+        """rows: (artist, platform, metric, day, value); re-ingesting a day overwrites it."""
+        with self.lock:
+            resolved = [
+                (self._id("artists", a), self._id("platforms", p), metric, str(day), float(value))
+                for a, p, metric, day, value in rows
+            ]
+        self._ingest("INSERT OR REPLACE INTO daily_metrics VALUES (?, ?, ?, ?, ?)", resolved)
+
+    def ingest_posts(self, rows):
+        """rows: (artist, platform, post_id, posted_at, likes, comments, shares, views)."""
+        with self.lock:
+            resolved = [
+                (str(post_id), self._id("artists", a), self._id("platforms", p), str(posted_at), *counts)
+                for a, p, post_id, posted_at, *counts in rows
+            ]
+        self._ingest("INSERT OR REPLACE INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, ?)", resolved)
+
+    def ingest_emails(self, rows):
+        """rows: (artist, sequence, sent_at, recipients, opens, clicks)."""
+        with self.lock:
+            resolved = [(self._id("artists", a), seq, str(sent), *counts) for a, seq, sent, *counts in rows]
+        self._ingest(
+            "INSERT INTO emails (artist_id, sequence, sent_at, recipients, opens, clicks) VALUES (?, ?, ?, ?, ?, ?)",
+            resolved
+        )
+
+    def ingest_campaigns(self, rows):
+        """rows: (artist, name, channel, start_day, end_day, spend)."""
+        with self.lock:
+            resolved = [(self._id("artists", a), name, ch, str(s), str(e), spend) for a, name, ch, s, e, spend in rows]
+        self._ingest(
+            "INSERT INTO campaigns (artist_id, name, channel, start_day, end_day, spend) VALUES (?, ?, ?, ?, ?, ?)",
+            resolved
+        )
+
+    @staticmethod
+    def cache_key(name, params):
+        return name, tuple(sorted(params.items()))
+
+    def query(self, name, **params):
+        """Run a named query, serving repeat calls from the cache."""
+        key = self.cache_key(name, params)
+        with self.lock:
+            if key not in self.cache:
+                self.cache[key] = self.conn.execute(QUERIES[name], params).fetchall()
+            return self.cache[key]
+
+    def explain(self, name, **params):
+        """SQLite's query plan for a named query, to check index coverage."""
+        with self.lock:
+            return [row[-1] for row in self.conn.execute("EXPLAIN QUERY PLAN " + QUERIES[name], params)]